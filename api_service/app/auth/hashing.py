@@ -1,25 +1,98 @@
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
 from passlib.context import CryptContext
+from starlette.concurrency import run_in_threadpool
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from api_service.app.core.config import settings
 
-# HOT FIX FOR DEPRECATED bcrypt ROUNDS ISSUE
-# FIX LATER!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
 
-# pwd_context = CryptContext(
-#     schemes=["bcrypt"],
-#     deprecated="auto",
-#     bcrypt__rounds=12  # Optional: explicitly set rounds for security
-# )
+@lru_cache(maxsize=None)
+def _context(rounds: int) -> CryptContext:
+    # min == max == default: any hash made with a different cost "needs update",
+    # so changing BCRYPT_ROUNDS rehashes users transparently on their next login
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
 
 
-def hash_password(password: str) -> str:
+def _truncate(password: str) -> str:
     # Truncate password to 72 bytes for bcrypt, then decode back to string
     password_bytes = password.encode("utf-8")[:72]
-    safe_password = password_bytes.decode("utf-8", errors="ignore")
-    return pwd_context.hash(safe_password)
+    return password_bytes.decode("utf-8", errors="ignore")
+
+
+# Worker-side functions: module level so they can be sent to the process pool
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(_truncate(password))
+
+
+def _verify_and_update(password: str, hashed_password: str, rounds: int) -> tuple[bool, str | None]:
+    return _context(rounds).verify_and_update(_truncate(password), hashed_password)
+
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def start_hash_pool() -> ProcessPoolExecutor | None:
+    """Start the bcrypt worker processes (None when PASSWORD_HASH_WORKERS is 0).
+
+    Called at application startup so workers are forked before request
+    threads exist; later calls return the running pool.
+    """
+    global _pool
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in methods else None)
+            _pool = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, mp_context=context)
+            _pool.submit(int).result()  # launch the workers now
+        return _pool
+
+
+def shutdown_hash_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+
+def _run(fn, *args):
+    pool = start_hash_pool()
+    if pool is None:
+        return fn(*args)
+    return pool.submit(fn, *args).result()
+
+
+async def _run_async(fn, *args):
+    pool = start_hash_pool()
+    if pool is None:
+        return await run_in_threadpool(fn, *args)
+    # Await the worker without holding a request thread
+    return await asyncio.wrap_future(pool.submit(fn, *args))
+
+
+def hash_password(password: str) -> str:
+    return _run(_hash, password, settings.BCRYPT_ROUNDS)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    # Truncate password to 72 bytes for bcrypt, then decode back to string
-    password_bytes = plain_password.encode("utf-8")[:72]
-    safe_password = password_bytes.decode("utf-8", errors="ignore")
-    return pwd_context.verify(safe_password, hashed_password)
+    valid, _ = _run(_verify_and_update, plain_password, hashed_password, settings.BCRYPT_ROUNDS)
+    return valid
+
+async def hash_password_async(password: str) -> str:
+    return await _run_async(_hash, password, settings.BCRYPT_ROUNDS)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+    """Verify a password; also return a new hash when the stored one uses an outdated cost."""
+    return await _run_async(_verify_and_update, plain_password, hashed_password, settings.BCRYPT_ROUNDS)
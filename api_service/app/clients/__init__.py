@@ -1 +1,2 @@
-from .osm_client import OSMClient
\ No newline at end of file
+from .osm_client import OSMClient
+from .geocoding_cache import GeocodingCache
\ No newline at end of file
@@ -0,0 +1,63 @@
+from datetime import datetime, timedelta, timezone
+
+import requests
+
+from api_service.app.core.address import normalize_address
+from api_service.app.core.cache import TTLCache
+from api_service.app.core.config import settings
+from api_service.app.data_access import GeocodeCacheDAO
+from api_service.app.models import GeocodeCacheEntry
+from .osm_client import OSMClient
+
+# Marks a cached "address not found" so it can be told apart from a cache miss
+NOT_FOUND = (None, None)
+
+
+class GeocodingCache:
+    """Geocoding lookups through an in-process LRU backed by the geocodecacheentry table.
+
+    Addresses are keyed by their normalized form, so formatting differences
+    between reports of the same incident share one entry. Unknown addresses
+    are cached for a shorter negative TTL; upstream failures are not cached
+    at all, so the next request tries again.
+    """
+
+    memory = TTLCache(maxsize=settings.GEOCODING_CACHE_SIZE, ttl=settings.GEOCODING_CACHE_TTL_SECONDS)
+
+    @staticmethod
+    def get_coordinates(address: str) -> tuple[float, float] | None:
+        key = normalize_address(address)
+        if not key:
+            return None
+        coordinates, _ = GeocodingCache.memory.get_or_load(
+            key,
+            lambda: GeocodingCache._load(key, address),
+            ttl_for=lambda loaded: loaded[1],
+        )
+        if coordinates is None or coordinates == NOT_FOUND:
+            return None
+        return coordinates
+
+    @staticmethod
+    def _load(key: str, address: str) -> tuple[tuple | None, float]:
+        """Resolve an address from the table or upstream; return (coordinates, ttl_seconds)."""
+        entry = GeocodeCacheDAO.get_entry(key)
+        if entry:
+            remaining = (entry.expires_at - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
+            return (entry.latitude, entry.longitude), remaining
+
+        try:
+            coordinates = OSMClient.search(address)
+        except requests.RequestException as e:
+            print(f"Error fetching coordinates: {e}")
+            return None, 0  # upstream failure: do not cache
+
+        ttl = settings.GEOCODING_CACHE_TTL_SECONDS if coordinates else settings.GEOCODING_NEGATIVE_TTL_SECONDS
+        latitude, longitude = coordinates or NOT_FOUND
+        GeocodeCacheDAO.save_entry(GeocodeCacheEntry(
+            address=key,
+            latitude=latitude,
+            longitude=longitude,
+            expires_at=datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(seconds=ttl),
+        ))
+        return (latitude, longitude), ttl
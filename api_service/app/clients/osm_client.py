@@ -1,30 +1,54 @@
 import requests
+from requests.adapters import HTTPAdapter
+
+from api_service.app.core.config import settings
+
+
+def _build_session() -> requests.Session:
+    # One pooled session per process so repeated lookups reuse TCP/TLS connections
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = "Semester Project CE1 - Mayday Resource Coordinator (wg38up@student.aau.dk)"
+    return session
+
 
 class OSMClient:
-    BASE_URL = "https://nominatim.openstreetmap.org/search"
+    BASE_URL = settings.GEOCODING_URL
+    TIMEOUT_SECONDS = settings.GEOCODING_TIMEOUT_SECONDS
+    session = _build_session()
 
     @staticmethod
-    def get_coordinates_from_address(address: str):
+    def search(address: str) -> tuple[float, float] | None:
+        """Geocode an address via Nominatim.
+
+        Returns None when the address is unknown and raises
+        ``requests.RequestException`` when the upstream call fails, so callers
+        can tell "not found" apart from "could not ask".
+        """
         params = {
             "q": address,
             "format": "json",
             "limit": 1
         }
-        headers = {"User-Agent": "Semester Project CE1 - Mayday Resource Coordinator (wg38up@student.aau.dk)"}
-        
-        try:
+        response = OSMClient.session.get(OSMClient.BASE_URL, params=params, timeout=OSMClient.TIMEOUT_SECONDS)
+        response.raise_for_status()
 
-            response = requests.get(OSMClient.BASE_URL, params=params, headers=headers)
-            response.raise_for_status()
+        data = response.json()
+        if not data:
+            return None
 
-            data = response.json()
-            if not data:
-                return None
+        return float(data[0]["lat"]), float(data[0]["lon"])
 
-            return float(data[0]["lat"]), float(data[0]["lon"])
+    @staticmethod
+    def get_coordinates_from_address(address: str) -> tuple[float, float] | None:
+        try:
+            return OSMClient.search(address)
         except requests.RequestException as e:
             print(f"Error fetching coordinates: {e}")
-            return float(0.0), float(0.0)
+            return None
+
     @staticmethod
     def get_address_from_coordinates(lat: float, lon: float):
         raise NotImplementedError("Reverse geocoding not implemented yet.")
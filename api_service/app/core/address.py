@@ -0,0 +1,28 @@
+import re
+import unicodedata
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def join_address(street: str | None, city: str | None, postcode: str | None, country: str | None) -> str:
+    """Join address parts the way the rest of the API formats a full address."""
+    return ", ".join(filter(None, [street, city, postcode, country]))
+
+
+def normalize_address(address: str) -> str:
+    """Lower-case an address and reduce punctuation and spacing to single spaces.
+
+    "Nørregade 5,  1165 København K" and "nørregade 5 1165 københavn k" both
+    normalize to the same string, so they score and tokenize identically.
+    """
+    text = unicodedata.normalize("NFKC", address).casefold()
+    return " ".join(_NON_WORD.sub(" ", text).replace("_", " ").split())
+
+
+def address_tokens(normalized_address: str) -> set[str]:
+    """Return the distinct tokens of a normalized address used for indexing.
+
+    Single letters carry no signal and are dropped; numbers of any length are
+    kept because house numbers and postcodes are the most selective tokens.
+    """
+    return {token for token in normalized_address.split() if len(token) > 1 or token.isdigit()}
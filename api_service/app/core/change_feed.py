@@ -0,0 +1,130 @@
+import asyncio
+import itertools
+import json
+import threading
+from datetime import datetime, timezone
+
+from sqlalchemy import event
+from sqlmodel import Session
+
+# Changes recorded on a session are kept under this key in ``Session.info``
+# until the surrounding transaction commits (published) or rolls back (dropped).
+PENDING_CHANGES_KEY = "pending_changes"
+
+
+class Subscription:
+    """A single subscriber's bounded queue of pending change notifications.
+
+    When a slow client lets its queue fill up, the backlog is discarded and a
+    single ``resync`` notification is queued instead, so the client knows to
+    refetch everything rather than apply a partial stream.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_pending: int):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    def deliver(self, change: dict) -> None:
+        try:
+            self.queue.put_nowait(change)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"action": "resync", "seq": change["seq"]})
+
+    async def get(self, timeout: float | None = None) -> dict | None:
+        """Wait for the next change; return None when ``timeout`` elapses first."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ChangeFeed:
+    """In-process fan-out of create/update/delete notifications.
+
+    Writers (DAO code running in the threadpool) call ``publish``; each event
+    loop holding subscribers receives one thread-safe callback per change,
+    which then pushes the change into every local subscriber queue. Idle
+    subscribers cost nothing but their queue.
+    """
+
+    def __init__(self, max_pending: int = 100):
+        self.max_pending = max_pending
+        self._subscribers: dict[asyncio.AbstractEventLoop, set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+
+    def subscribe(self) -> Subscription:
+        """Register a subscriber on the running event loop."""
+        loop = asyncio.get_running_loop()
+        subscription = Subscription(loop, self.max_pending)
+        with self._lock:
+            self._subscribers.setdefault(loop, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.loop)
+            if subscribers is None:
+                return
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.loop]
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subs) for subs in self._subscribers.values())
+
+    def publish(self, entity: str, action: str, entity_id: int | None) -> dict:
+        """Broadcast a change to every subscriber and return the change record."""
+        change = {
+            "seq": next(self._seq),
+            "entity": entity,
+            "action": action,
+            "id": entity_id,
+            "time": datetime.now(timezone.utc).isoformat(),
+        }
+        with self._lock:
+            loops = [(loop, list(subs)) for loop, subs in self._subscribers.items()]
+        for loop, subscribers in loops:
+            try:
+                loop.call_soon_threadsafe(_deliver_all, subscribers, change)
+            except RuntimeError:
+                # Loop already closed; its subscribers are gone with it.
+                with self._lock:
+                    self._subscribers.pop(loop, None)
+        return change
+
+
+def _deliver_all(subscribers: list[Subscription], change: dict) -> None:
+    for subscription in subscribers:
+        subscription.deliver(change)
+
+
+def format_sse(change: dict) -> str:
+    """Render a change as a Server-Sent Events message."""
+    return f"id: {change['seq']}\nevent: change\ndata: {json.dumps(change)}\n\n"
+
+
+change_feed = ChangeFeed()
+
+
+def record_change(session: Session, entity: str, action: str, entity_id: int | None) -> None:
+    """Queue a change notification to be published once ``session`` commits.
+
+    DAO write paths call this before committing. Nothing is published if the
+    transaction rolls back, so subscribers never see changes that did not land.
+    """
+    session.info.setdefault(PENDING_CHANGES_KEY, []).append((entity, action, entity_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_changes(session: Session) -> None:
+    for entity, action, entity_id in session.info.pop(PENDING_CHANGES_KEY, []):
+        change_feed.publish(entity, action, entity_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_changes(session: Session, previous_transaction) -> None:
+    session.info.pop(PENDING_CHANGES_KEY, None)
@@ -0,0 +1,44 @@
+from datetime import timezone
+from email.utils import format_datetime
+
+from fastapi import Request, Response
+
+from api_service.app.data_access import CollectionVersionDAO
+
+
+class NotModified(Exception):
+    """Raised by ``conditional_get`` to answer 304 before the handler runs."""
+
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
+
+
+def conditional_get(*entities: str):
+    """Dependency adding ETag/Last-Modified validators to a collection GET.
+
+    The ETag is derived from the write counters of ``entities`` (every
+    collection whose rows appear in the response), so a matching
+    ``If-None-Match`` is answered with 304 without querying rows or
+    serializing. Versions are read before the handler runs, so a write that
+    lands in between can only make the ETag older, never newer, than the body.
+    """
+    async def dependency(request: Request, response: Response) -> None:
+        versions = await CollectionVersionDAO.get_versions_async(list(entities))
+        tag = ".".join(f"{entity}-{versions[entity].version if entity in versions else 0}" for entity in entities)
+        headers = {"ETag": f'W/"{tag}"'}
+        if versions:
+            last_modified = max(version.modified_at for version in versions.values())
+            headers["Last-Modified"] = format_datetime(last_modified.replace(tzinfo=timezone.utc), usegmt=True)
+
+        if _etag_matches(request.headers.get("if-none-match"), tag):
+            raise NotModified(headers)
+        response.headers.update(headers)
+
+    return dependency
+
+
+def _etag_matches(if_none_match: str | None, tag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip().removeprefix("W/").strip('"') for candidate in if_none_match.split(",")}
+    return "*" in candidates or tag in candidates
@@ -39,11 +39,59 @@ class Settings(BaseSettings):
     SECRET_KEY: str = Field(default=DEFAULT_DEV_SECRET)
     DEBUG: bool = False
     DB_LOGGING_ENABLED: bool = False
+    # Connection pools (Postgres). Each worker process has a sync engine and an
+    # async engine with a pool each, so size them so that tasks * workers *
+    # (DB_POOL_SIZE + DB_MAX_OVERFLOW + DB_ASYNC_POOL_SIZE + DB_ASYNC_MAX_OVERFLOW)
+    # stays below max_connections; with the defaults that is 2 * (5 + 10) per worker.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_ASYNC_POOL_SIZE: int = 5
+    DB_ASYNC_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    # Behind PgBouncer (transaction pooling): no client-side pool, no prepared statement cache
+    DB_PGBOUNCER_MODE: bool = False
     ENVIRONMENT: Environment = Environment.LOCAL
     APP_NAME: str = "disaster-response-api"
     APP_VERSION: str = "1.0.0"
 
     REVERSE_GEOCODING_ENABLED: bool = False  # OSM geocoding
+    GEOCODING_URL: str = "https://nominatim.openstreetmap.org/search"
+    GEOCODING_TIMEOUT_SECONDS: float = 5.0
+    GEOCODING_CACHE_SIZE: int = 10000  # in-process LRU entries
+    GEOCODING_CACHE_TTL_SECONDS: int = 30 * 24 * 3600
+    GEOCODING_NEGATIVE_TTL_SECONDS: int = 3600  # how long "address not found" is remembered
+    BCRYPT_ROUNDS: int = 12  # changing it rehashes each user's password on their next login
+    PASSWORD_HASH_WORKERS: int = 2  # bcrypt worker processes; 0 hashes in the request thread
+    TOKEN_CACHE_SIZE: int = 10000  # verified JWT payloads kept per process
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 30.0  # users looked up by token subject (/auth/me)
+    STATS_CACHE_TTL_SECONDS: float = 5.0  # shared by every dashboard polling /stats/
+    STATS_SNAPSHOT_INTERVAL_SECONDS: int = 60  # how often live stats are persisted for history
+    DASHBOARD_CACHE_TTL_SECONDS: float = 2.0  # /dashboard/snapshot, shared per role and view
+    SYNC_OVERLAP_SECONDS: float = 5.0  # /sync re-sends rows this close to the cursor (covers slow commits)
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30  # older /sync cursors must reload from scratch
+    # Response compression (brotli when installed, else gzip)
+    COMPRESSION_MIN_SIZE: int = 1024  # bytes; smaller bodies are sent as is
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_OFFLOAD_MIN_SIZE: int = 64 * 1024  # bodies this large are compressed off the event loop
+    # Resource matching (/resources/matches)
+    MATCHING_CANDIDATES_PER_NEED: int = 16  # best offers per need handed to the assignment solver
+    MATCHING_MAX_DISTANCE_KM: float = 250.0  # offers further from the event are never proposed
+    MATCHING_DISTANCE_SCALE_KM: float = 25.0  # distance at which the distance penalty reaches half
+    MATCHING_MAX_ROUNDS: int = 4  # needs larger than one offer get up to this many offers
+    # Volunteer dispatch ranking (/events/{event_id}/dispatch)
+    DISPATCH_WEIGHT_DISTANCE: float = 1.0  # doubled for priority 1 events
+    DISPATCH_WEIGHT_WORKLOAD: float = 1.0
+    DISPATCH_WEIGHT_RESOURCES: float = 1.0
+    DISPATCH_DISTANCE_SCALE_KM: float = 25.0  # distance at which the proximity term reaches half
+    DISPATCH_FEATURES_TTL_SECONDS: float = 30.0  # user features shared by rankings; bulk assignments reset them
+    # Event triage queue (/events/triage); after changing these run api_service.scripts.add_triage_score
+    TRIAGE_PRIORITY_WEIGHT: float = 10.0  # per priority level
+    TRIAGE_NEEDS_WEIGHT: float = 2.0  # times ln(1 + unfulfilled needed quantity)
+    TRIAGE_VOLUNTEERS_WEIGHT: float = 2.0  # times ln(1 + active volunteers), subtracted
+    TRIAGE_AGING_PER_HOUR: float = 0.5  # a day of waiting is worth a little over one priority level
     CORS_ORIGINS: list[str] = Field(default_factory=lambda: ["http://localhost:3000"])
 
     # Bootstrap admin user (optional)
@@ -90,4 +138,20 @@ class Settings(BaseSettings):
         )
 
 
+    @property
+    def async_database_url_computed(self) -> str:
+        """The database URL rewritten for the asyncio driver of the same backend."""
+        url = self.database_url_computed
+        for prefix, async_prefix in (
+            ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+            ("postgresql://", "postgresql+asyncpg://"),
+            ("postgres://", "postgresql+asyncpg://"),
+            ("sqlite+pysqlite://", "sqlite+aiosqlite://"),
+            ("sqlite://", "sqlite+aiosqlite://"),
+        ):
+            if url.startswith(prefix):
+                return async_prefix + url[len(prefix):]
+        return url
+
+
 settings = Settings()
@@ -0,0 +1,109 @@
+import math
+
+# Geohash base32 alphabet, in ascending order under byte-order and
+# locale collations alike
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+GEOHASH_PRECISION = 9  # ~4.8m x 4.8m cells
+EARTH_RADIUS_KM = 6371.0088
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+    """Encode a coordinate as a geohash string of ``precision`` characters."""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True  # geohash interleaves bits starting with longitude
+    while len(chars) < precision:
+        rng, value = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (rng[0] + rng[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            rng[0] = mid
+        else:
+            bits <<= 1
+            rng[1] = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """Return the smallest geohash-alphabet string above every hash starting with ``prefix``.
+
+    The hashes that start with ``prefix`` are exactly those in the half-open
+    range [prefix, bound). The bound is built by incrementing the last
+    character that is not "z" rather than appending a sentinel like "{",
+    which locale collations such as Postgres' en_US.utf8 sort before digits
+    and letters. None means the range is unbounded above.
+    """
+    stem = prefix.rstrip("z")
+    if not stem:
+        return None
+    return stem[:-1] + _BASE32[_BASE32.index(stem[-1]) + 1]
+
+
+def _cell_size(precision: int) -> tuple[float, float]:
+    """Return (lat_degrees, lon_degrees) covered by one cell at ``precision``."""
+    total_bits = 5 * precision
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+
+def _cell_span(low: float, high: float, origin: float, size: float, cells: int) -> range:
+    first = max(0, int((low - origin) // size))
+    last = min(cells - 1, int((high - origin) // size))
+    return range(first, last + 1)
+
+
+def covering_cells(min_lat: float, min_lon: float, max_lat: float, max_lon: float,
+                   max_cells: int = 32) -> list[str] | None:
+    """Return geohash prefixes whose cells together cover the bounding box.
+
+    Picks the finest precision that needs at most ``max_cells`` prefixes, so a
+    lookup is a handful of index range scans that over-fetch by a bounded
+    factor. Returns None when the box is too large to be worth narrowing.
+    """
+    min_lat, max_lat = max(min_lat, -90.0), min(max_lat, 90.0)
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lat_size, lon_size = _cell_size(precision)
+        lat_cells = _cell_span(min_lat, max_lat, -90.0, lat_size, round(180.0 / lat_size))
+        lon_cells = _cell_span(min_lon, max_lon, -180.0, lon_size, round(360.0 / lon_size))
+        if len(lat_cells) * len(lon_cells) > max_cells:
+            continue
+        return [
+            encode_geohash(-90.0 + (i + 0.5) * lat_size, -180.0 + (j + 0.5) * lon_size, precision)
+            for i in lat_cells
+            for j in lon_cells
+        ]
+    return None
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two coordinates in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def bbox_around(latitude: float, longitude: float, radius_km: float) -> tuple[float, float, float, float]:
+    """Return (min_lat, min_lon, max_lat, max_lon) enclosing a circle.
+
+    Longitudes are clipped at the antimeridian rather than wrapped.
+    """
+    lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = latitude - lat_delta, latitude + lat_delta
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        # The circle reaches a pole, so every longitude is in range
+        return max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0
+    lon_delta = math.degrees(radius_km / (EARTH_RADIUS_KM * math.cos(math.radians(latitude))))
+    return min_lat, max(longitude - lon_delta, -180.0), max_lat, min(longitude + lon_delta, 180.0)
@@ -0,0 +1,94 @@
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Upper bounds (milliseconds) of the checkout wait histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class WaitHistogram:
+    """Thread-safe cumulative histogram of connection checkout wait times."""
+
+    def __init__(self, buckets_ms: tuple[float, ...] = WAIT_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self._counts = [0] * (len(buckets_ms) + 1)  # last slot is +Inf
+        self._sum_ms = 0.0
+        self._timeouts = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        with self._lock:
+            self._counts[bisect_left(self.buckets_ms, ms)] += 1
+            self._sum_ms += ms
+
+    def observe_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> dict:
+        """Return counts in Prometheus style: each bucket counts waits <= its bound."""
+        with self._lock:
+            counts = list(self._counts)
+            sum_ms = self._sum_ms
+            timeouts = self._timeouts
+        buckets, running = {}, 0
+        for bound, count in zip((*self.buckets_ms, "+Inf"), counts):
+            running += count
+            buckets[str(bound)] = running
+        return {"count": running, "sum_ms": round(sum_ms, 3), "timeouts": timeouts, "buckets_ms": buckets}
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout (waiting for, or opening, a connection) into ``wait_histogram``."""
+
+    def __init__(self, *args, wait_histogram: WaitHistogram | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = wait_histogram or WaitHistogram()
+
+    def recreate(self):
+        # Keep collecting into the same histogram when the engine rebuilds its pool
+        pool = super().recreate()
+        pool.wait_histogram = self.wait_histogram
+        return pool
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.wait_histogram.observe_timeout()
+            raise
+        self.wait_histogram.observe(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(pool) -> dict:
+    """Describe a pool's live state for the internal pool endpoint."""
+    if not hasattr(pool, "checkedout"):
+        # NullPool (PgBouncer mode) and the SQLite pools keep no connection queue
+        return {"pool": type(pool).__name__}
+    status = {
+        "pool": type(pool).__name__,
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeout_seconds": pool.timeout(),
+    }
+    histogram = getattr(pool, "wait_histogram", None)
+    if histogram is not None:
+        status["checkout_wait"] = histogram.snapshot()
+    return status
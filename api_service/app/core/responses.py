@@ -0,0 +1,21 @@
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def trusted_response(content: Any, response: Response | None = None) -> ORJSONResponse:
+    """Render data already shaped like the route's ``response_model`` with orjson.
+
+    Returning a Response skips FastAPI's response_model pass (dump, re-validate,
+    encode), so only use it for payloads built from trusted database rows.
+    Headers that dependencies set on the injected ``response`` (e.g. ETag)
+    are carried over.
+    """
+    return ORJSONResponse(content, headers=response.headers if response is not None else None)
+
+
+def row_payload(row: Any, schema: type[BaseModel]) -> dict:
+    """Copy the fields of a flat response ``schema`` off an ORM row without validating them."""
+    return {name: getattr(row, name) for name in schema.model_fields}
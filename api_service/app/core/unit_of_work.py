@@ -0,0 +1,42 @@
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api_service.app.db import unit_of_work
+
+
+class UnitOfWorkMiddleware:
+    """Run each HTTP request inside one database session and transaction.
+
+    DAO calls made while handling the request share the session (see
+    ``db.session_scope``) and only flush. The transaction is committed just
+    before the response starts, so a failed commit still turns into a 500
+    instead of a success response for data that was never stored. Error
+    responses (status >= 400) and unhandled exceptions roll back.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with unit_of_work() as session:
+            finished = False
+
+            async def send_after_commit(message: Message) -> None:
+                nonlocal finished
+                if message["type"] == "http.response.start" and not finished:
+                    finished = True
+                    if message["status"] < 400:
+                        await run_in_threadpool(session.commit)
+                    else:
+                        await run_in_threadpool(session.rollback)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_after_commit)
+            finally:
+                if not finished:
+                    await run_in_threadpool(session.rollback)
@@ -3,4 +3,11 @@ from .event_dao import EventDAO as EventDAO
 from .location_dao import LocationDAO as LocationDAO
 from .resource_dao import ResourceDAO as ResourceDAO
 from .volunteer_dao import VolunteerDAO as VolunteerDAO
-from .stats_dao import StatsDAO as StatsDAO
\ No newline at end of file
+from .stats_dao import StatsDAO as StatsDAO
+from .geocode_cache_dao import GeocodeCacheDAO as GeocodeCacheDAO
+from .collection_version_dao import CollectionVersionDAO as CollectionVersionDAO
+from .sync_dao import SyncDAO as SyncDAO
+from .dashboard_dao import DashboardDAO as DashboardDAO
+from .matching_dao import MatchingDAO as MatchingDAO
+from .dispatch_dao import DispatchDAO as DispatchDAO
+from .triage_dao import TriageDAO as TriageDAO
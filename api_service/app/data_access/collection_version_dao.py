@@ -0,0 +1,59 @@
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from api_service.app.models import CollectionVersion
+from api_service.app.db import get_async_engine
+from api_service.app.core.change_feed import PENDING_CHANGES_KEY
+
+MODIFIED_COLLECTIONS_KEY = "modified_collections"
+
+
+def mark_modified(session: Session, entity: str) -> None:
+    """Bump ``entity``'s collection version when ``session`` commits.
+
+    Changes passed to ``record_change`` are counted automatically; this is for
+    writes that are not published on the change feed (e.g. locations).
+    """
+    session.info.setdefault(MODIFIED_COLLECTIONS_KEY, set()).add(entity)
+
+
+class CollectionVersionDAO:
+    @staticmethod
+    def bump(session: Session, entities: set[str]) -> None:
+        """Increment the version of each collection with a single upsert."""
+        now = datetime.utcnow()
+        dialect_insert = postgresql.insert if session.get_bind().dialect.name == "postgresql" else sqlite.insert
+        statement = dialect_insert(CollectionVersion).values(
+            # Sorted so concurrent transactions lock the rows in the same order
+            [{"entity": entity, "version": 1, "modified_at": now} for entity in sorted(entities)]
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=["entity"],
+            set_={"version": CollectionVersion.version + 1, "modified_at": now},
+        )
+        session.execute(statement)
+
+    @staticmethod
+    async def get_versions_async(entities: list[str]) -> dict[str, CollectionVersion]:
+        """Retrieve the current versions of the given collections (missing ones were never written)."""
+        query = select(CollectionVersion).where(CollectionVersion.entity.in_(entities))
+        async with AsyncSession(get_async_engine()) as session:
+            return {row.entity: row for row in (await session.exec(query)).all()}
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_modified_collections(session: Session) -> None:
+    # Bumped last thing before COMMIT so the hot counter rows stay locked only briefly
+    entities = set(session.info.pop(MODIFIED_COLLECTIONS_KEY, ()))
+    entities.update(entity for entity, _, _ in session.info.get(PENDING_CHANGES_KEY, ()))
+    if entities:
+        CollectionVersionDAO.bump(session, entities)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_modified_collections(session: Session, previous_transaction) -> None:
+    session.info.pop(MODIFIED_COLLECTIONS_KEY, None)
@@ -0,0 +1,33 @@
+from sqlmodel import select
+
+from api_service.app.models import Event, ResourceAvailable, ResourceNeeded, User
+from api_service.app.db import session_scope
+from .event_dao import EventDAO
+from .stats_dao import StatsDAO
+from .volunteer_dao import VolunteerDAO
+
+
+class DashboardDAO:
+    @staticmethod
+    def get_snapshot(sections: set[str], limit: int) -> dict:
+        """Read the requested dashboard sections with one set-based statement each.
+
+        Everything is read in one transaction of its own. On PostgreSQL it runs
+        at REPEATABLE READ so all sections see the same snapshot (a SQLite read
+        transaction already does). List sections hold at most ``limit`` rows in
+        id order, like their list endpoints.
+        """
+        queries = {
+            "events": EventDAO._details_query().order_by(Event.id).limit(limit),
+            "volunteers": VolunteerDAO._with_users_query(None, None, None, None, 0, limit),
+            "users": select(User).order_by(User.id).limit(limit),
+            "resources_needed": select(ResourceNeeded).order_by(ResourceNeeded.id).limit(limit),
+            "resources_available": select(ResourceAvailable).order_by(ResourceAvailable.id).limit(limit),
+        }
+        with session_scope(independent=True) as session:
+            if session.get_bind().dialect.name == "postgresql":
+                session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            snapshot = {name: session.exec(query).all() for name, query in queries.items() if name in sections}
+            if "stats" in sections:
+                snapshot["stats"] = StatsDAO.read_stats(session)
+            return snapshot
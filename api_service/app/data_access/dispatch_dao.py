@@ -0,0 +1,107 @@
+from datetime import datetime
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from api_service.app.models import Event, Location, ResourceAvailable, ResourceNeeded, User, Volunteer
+from api_service.app.db import commit, session_scope
+from api_service.app.core.change_feed import record_change
+from .volunteer_dao import VolunteerDAO
+
+
+class DispatchDAO:
+    @staticmethod
+    def get_user_features() -> tuple[list[tuple], list[tuple]]:
+        """Retrieve the inputs of the dispatch ranking for every dispatchable user.
+
+        Returns ``(users, resource_types)``. ``users`` rows are ``(user_id, name,
+        active_assignments, latitude, longitude)`` for SUV users not marked
+        unavailable; the coordinates are those of the event of the user's latest
+        volunteer row, or None if they were never deployed. ``resource_types``
+        rows are the distinct ``(user_id, resource_type)`` pairs registered
+        through ResourceAvailable.
+        """
+        latest = (
+            select(Volunteer.user_id, func.max(Volunteer.id).label("volunteer_id"))
+            .where(Volunteer.user_id.is_not(None))
+            .group_by(Volunteer.user_id)
+            .subquery()
+        )
+        users = (
+            select(User.id, User.name, User.active_assignments, Location.latitude, Location.longitude)
+            .outerjoin(latest, latest.c.user_id == User.id)
+            .outerjoin(Volunteer, Volunteer.id == latest.c.volunteer_id)
+            .outerjoin(Event, Event.id == Volunteer.event_id)
+            .outerjoin(Location, Location.id == Event.location_id)
+            .where(User.role == "SUV", User.status != "unavailable")
+            .order_by(User.id)
+        )
+        resource_types = (
+            select(Volunteer.user_id, ResourceAvailable.resource_type)
+            .join(Volunteer, ResourceAvailable.volunteer_id == Volunteer.id)
+            .where(Volunteer.user_id.is_not(None))
+            .distinct()
+        )
+        with session_scope() as session:
+            return session.exec(users).all(), session.exec(resource_types).all()
+
+    @staticmethod
+    def get_event_context(event_id: int) -> tuple[tuple, list[str], set[int]] | None:
+        """Retrieve ``((priority, status, latitude, longitude), needed resource types, assigned user ids)`` for an event.
+
+        The needed types are those of its unfulfilled needs; the assigned users
+        are those with an active volunteer row at the event. None if the event
+        does not exist.
+        """
+        with session_scope() as session:
+            event = session.exec(
+                select(Event.priority, Event.status, Location.latitude, Location.longitude)
+                .join(Location, Event.location_id == Location.id)
+                .where(Event.id == event_id)
+            ).first()
+            if event is None:
+                return None
+            needed_types = session.exec(
+                select(ResourceNeeded.resource_type)
+                .where(ResourceNeeded.event_id == event_id, ResourceNeeded.is_fulfilled == False)  # noqa: E712
+                .distinct()
+            ).all()
+            assigned = session.exec(
+                select(Volunteer.user_id).where(Volunteer.event_id == event_id, Volunteer.status == "active")
+            ).all()
+            return tuple(event), sorted(needed_types), {user_id for user_id in assigned if user_id is not None}
+
+    @staticmethod
+    def get_dispatchable_users(user_ids: list[int]) -> set[int]:
+        """Return which of ``user_ids`` are SUV users not marked unavailable."""
+        with session_scope() as session:
+            return set(session.exec(
+                select(User.id).where(User.id.in_(user_ids), User.role == "SUV", User.status != "unavailable")
+            ).all())
+
+    @staticmethod
+    def create_volunteers(event_id: int, user_ids: list[int]) -> list[tuple[Volunteer, User]]:
+        """Create an active volunteer row at ``event_id`` for each user, in one transaction.
+
+        The users' active_assignments and status are updated by one statement.
+        Returns the new (volunteer, user) rows in ``user_ids`` order.
+        """
+        now = datetime.now()
+        with session_scope() as session:
+            volunteers = [Volunteer(user_id=user_id, event_id=event_id, status="active", create_time=now) for user_id in user_ids]
+            session.add_all(volunteers)
+            session.flush()
+            volunteer_ids = [volunteer.id for volunteer in volunteers]
+            for volunteer_id in volunteer_ids:
+                record_change(session, "volunteer", "created", volunteer_id)
+            VolunteerDAO.adjust_active_assignments({user_id: 1 for user_id in user_ids}, session)
+            commit(session)
+
+            rows = session.exec(
+                select(Volunteer, User)
+                .join(User, Volunteer.user_id == User.id)
+                .where(Volunteer.id.in_(volunteer_ids))
+                .order_by(Volunteer.id)
+                .execution_options(populate_existing=True)
+            ).all()
+            return rows
@@ -1,24 +1,105 @@
+from datetime import datetime, timezone
+
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import func, insert, update
 
-from api_service.app.models import Event
+from api_service.app.models import Event, Location, LocationAddressToken, ResourceNeeded, Volunteer
+from api_service.app.core.address import address_tokens
+from api_service.app.core.geo import bbox_around
 from domain.schemas import EventCreate, EventResponse, EventUpdate
-from api_service.app.db import engine
+from api_service.app.db import commit, session_scope, get_async_engine
+from api_service.app.core.change_feed import record_change
+from .location_dao import LocationDAO
+from .collection_version_dao import mark_modified
 
 class EventDAO:
     @staticmethod
     def create_event(event_data: Event) -> Event:
         """Create and persist a new Event from an EventCreate object."""
-        with Session(engine) as session:
+        with session_scope() as session:
             # Save and return the persisted event
             session.add(event_data)
-            session.commit()
+            session.flush()
+            record_change(session, "event", "created", event_data.id)
+            commit(session)
             session.refresh(event_data)
             return event_data
 
+    @staticmethod
+    def create_events_bulk(items: list[tuple[Location, Event, list[ResourceNeeded]]]) -> list[int]:
+        """Persist many events with their locations and needed resources in one transaction.
+
+        Each table is written with a single multi-row INSERT ... RETURNING, so
+        a chunk costs a fixed number of round trips and one commit no matter
+        how many items it holds. The chunk always commits on its own, even
+        inside a request's unit of work. Returns the new event ids in input order.
+        """
+        if not items:
+            return []
+        locations = [LocationDAO.apply_normalized_address(LocationDAO.apply_geohash(loc)) for loc, _, _ in items]
+
+        with session_scope(independent=True) as session:
+            location_ids = session.execute(
+                insert(Location).returning(Location.id, sort_by_parameter_order=True),
+                [loc.model_dump(exclude={"id"}) for loc in locations],
+            ).scalars().all()
+
+            tokens = [
+                {"token": token, "location_id": location_id}
+                for loc, location_id in zip(locations, location_ids)
+                if loc.normalized_address
+                for token in address_tokens(loc.normalized_address)
+            ]
+            if tokens:
+                session.execute(insert(LocationAddressToken), tokens)
+
+            event_rows = []
+            for (_, event, _), location_id in zip(items, location_ids):
+                event.location_id = location_id
+                event_rows.append(event.model_dump(exclude={"id"}))
+            event_ids = session.execute(
+                insert(Event).returning(Event.id, sort_by_parameter_order=True),
+                event_rows,
+            ).scalars().all()
+
+            resource_rows = []
+            for (_, _, resources), event_id in zip(items, event_ids):
+                for resource in resources:
+                    resource.event_id = event_id
+                    resource_rows.append(resource.model_dump(exclude={"id"}))
+            resource_ids = []
+            if resource_rows:
+                resource_ids = session.execute(
+                    insert(ResourceNeeded).returning(ResourceNeeded.id, sort_by_parameter_order=True),
+                    resource_rows,
+                ).scalars().all()
+
+            mark_modified(session, "location")
+            for event_id in event_ids:
+                record_change(session, "event", "created", event_id)
+            for resource_id in resource_ids:
+                record_change(session, "resource_needed", "created", resource_id)
+            commit(session)
+            return list(event_ids)
+
+    @staticmethod
+    def touch_events(session: Session, *event_ids: int | None) -> None:
+        """Stamp modified_time on events whose volunteers_count changed with no volunteer row left pointing at them.
+
+        Delta sync finds events through their volunteers' modified_time; an
+        event a volunteer was deleted from or moved away from has to be
+        stamped itself.
+        """
+        ids = sorted({event_id for event_id in event_ids if event_id is not None})
+        if ids:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            session.execute(update(Event).where(Event.id.in_(ids)).values(modified_time=now))
+
     @staticmethod
     def get_event(event_id: int) -> Event | None:
         """Retrieve an event by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.get(Event, event_id)
 
     @staticmethod
@@ -30,13 +111,108 @@ class EventDAO:
             query = query.where(Event.priority == priority)
         if status:
             query = query.where(Event.status == status)
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.exec(query.offset(skip).limit(limit)).all()
 
+    @staticmethod
+    def _details_query():
+        """Build the SELECT used by the listing paths.
+
+        Each row is ``(Event, Location, active_volunteers)``. Active volunteer
+        counts come from a grouped subquery, so the whole page is resolved in a
+        single statement regardless of how many volunteers an event has.
+        """
+        active_counts = (
+            select(Volunteer.event_id, func.count().label("active_volunteers"))
+            .where(Volunteer.status == "active")
+            .group_by(Volunteer.event_id)
+            .subquery()
+        )
+        return (
+            select(Event, Location, func.coalesce(active_counts.c.active_volunteers, 0))
+            .join(Location, Event.location_id == Location.id)
+            .outerjoin(active_counts, active_counts.c.event_id == Event.id)
+        )
+
+    @staticmethod
+    def _details_filtered_query(priority, status, bbox):
+        query = EventDAO._details_query()
+
+        if bbox:
+            query = query.where(LocationDAO.bbox_filter(*bbox))
+        if priority:
+            query = query.where(Event.priority == priority)
+        if status:
+            query = query.where(Event.status == status)
+        return query
+
+    @staticmethod
+    def _details_page_query(skip, limit, priority, status, bbox):
+        return EventDAO._details_filtered_query(priority, status, bbox).order_by(Event.id).offset(skip).limit(limit)
+
+    @staticmethod
+    def _details_nearby_query(latitude, longitude, radius_km, limit, priority, status):
+        return (
+            EventDAO._details_filtered_query(priority, status, bbox_around(latitude, longitude, radius_km))
+            .order_by(LocationDAO.approximate_distance(latitude, longitude))
+            .limit(limit * LocationDAO.NEARBY_OVERFETCH)
+        )
+
+    @staticmethod
+    def get_event_with_details(event_id: int) -> tuple[Event, Location, int] | None:
+        """Retrieve an event together with its location and active volunteer count."""
+        query = EventDAO._details_query().where(Event.id == event_id)
+        with session_scope() as session:
+            return session.exec(query).first()
+
+    @staticmethod
+    async def get_event_with_details_async(event_id: int) -> tuple[Event, Location, int] | None:
+        """Async variant of ``get_event_with_details``."""
+        query = EventDAO._details_query().where(Event.id == event_id)
+        async with AsyncSession(get_async_engine()) as session:
+            return (await session.exec(query)).first()
+
+    @staticmethod
+    def get_events_with_details(skip, limit, priority, status, bbox: tuple[float, float, float, float] | None = None) -> list[tuple[Event, Location, int]]:
+        """Retrieve a page of events with their locations and active volunteer counts.
+
+        ``bbox`` is an optional (min_lat, min_lon, max_lat, max_lon) restricting
+        events to those located inside it.
+        """
+        query = EventDAO._details_page_query(skip, limit, priority, status, bbox)
+        with session_scope() as session:
+            return session.exec(query).all()
+
+    @staticmethod
+    async def get_events_with_details_async(skip, limit, priority, status, bbox: tuple[float, float, float, float] | None = None) -> list[tuple[Event, Location, int]]:
+        """Async variant of ``get_events_with_details``."""
+        query = EventDAO._details_page_query(skip, limit, priority, status, bbox)
+        async with AsyncSession(get_async_engine()) as session:
+            return (await session.exec(query)).all()
+
+    @staticmethod
+    def get_events_nearby(latitude, longitude, radius_km, limit, priority, status) -> list[tuple[Event, Location, int]]:
+        """Retrieve the candidates for the ``limit`` events nearest a point, as listing rows.
+
+        At most LocationDAO.NEARBY_OVERFETCH * ``limit`` rows come back, nearest
+        first by approximate distance; the caller ranks them by exact distance
+        and drops those outside ``radius_km``.
+        """
+        query = EventDAO._details_nearby_query(latitude, longitude, radius_km, limit, priority, status)
+        with session_scope() as session:
+            return session.exec(query).all()
+
+    @staticmethod
+    async def get_events_nearby_async(latitude, longitude, radius_km, limit, priority, status) -> list[tuple[Event, Location, int]]:
+        """Async variant of ``get_events_nearby``."""
+        query = EventDAO._details_nearby_query(latitude, longitude, radius_km, limit, priority, status)
+        async with AsyncSession(get_async_engine()) as session:
+            return (await session.exec(query)).all()
+
     @staticmethod
     def update_event(event_id: int, event_update : Event) -> Event | None:
         """Update an event by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             # Fetch the existing record first
             existing = session.get(Event, event_id)
             if not existing:
@@ -46,17 +222,19 @@ class EventDAO:
                     setattr(existing, key, value)
             
             session.add(existing)
-            session.commit()
+            record_change(session, "event", "updated", event_id)
+            commit(session)
             session.refresh(existing)
             return existing
 
     @staticmethod
     def delete_event(event_id: int) -> bool:
         """Delete an event by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             event = session.get(Event, event_id)
             if not event:
                 return False
             session.delete(event)
-            session.commit()
+            record_change(session, "event", "deleted", event_id)
+            commit(session)
             return True
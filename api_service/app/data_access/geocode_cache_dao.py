@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql, sqlite
+
+from api_service.app.models import GeocodeCacheEntry
+from api_service.app.db import commit, session_scope
+
+class GeocodeCacheDAO:
+    @staticmethod
+    def get_entry(address: str) -> GeocodeCacheEntry | None:
+        """Retrieve an unexpired cache entry by normalized address."""
+        with session_scope() as session:
+            entry = session.get(GeocodeCacheEntry, address)
+            if entry and entry.expires_at > datetime.now(timezone.utc).replace(tzinfo=None):
+                return entry
+            return None
+
+    @staticmethod
+    def save_entry(entry: GeocodeCacheEntry) -> None:
+        """Insert or replace the cache entry for an address.
+
+        A single upsert, so workers geocoding the same new address at once
+        both succeed and the last one wins.
+        """
+        with session_scope() as session:
+            dialect_insert = postgresql.insert if session.get_bind().dialect.name == "postgresql" else sqlite.insert
+            values = entry.model_dump()
+            statement = dialect_insert(GeocodeCacheEntry).values(values).on_conflict_do_update(
+                index_elements=["address"],
+                set_={key: value for key, value in values.items() if key != "address"},
+            )
+            session.execute(statement)
+            commit(session)
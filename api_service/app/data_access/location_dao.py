@@ -1,17 +1,107 @@
+import math
+from collections import Counter
 from sqlmodel import Session, select
+from sqlalchemy import and_, delete, or_
 from fuzzywuzzy import fuzz
 
-from api_service.app.models import Location
-from api_service.app.db import engine
+from api_service.app.models import Location, LocationAddressToken
+from api_service.app.db import commit, session_scope
+from .collection_version_dao import mark_modified
+from api_service.app.core.geo import (
+    bbox_around,
+    covering_cells,
+    encode_geohash,
+    haversine_km,
+    prefix_upper_bound,
+)
+from api_service.app.core.address import address_tokens, join_address, normalize_address
 
 class LocationDAO:
+    # Address tokens shared by more locations than this are treated as stop words
+    MAX_TOKEN_POSTINGS = 500
+    # Number of best token-overlap candidates that get fuzzy scored
+    MAX_ADDRESS_CANDIDATES = 20
+    # Radius lookups fetch this many times ``limit`` rows, nearest first by
+    # approximate distance, before ranking them by exact distance
+    NEARBY_OVERFETCH = 2
+
+    @staticmethod
+    def apply_geohash(location: Location) -> Location:
+        """Keep the indexed geohash column in sync with the coordinates."""
+        if location.latitude is not None and location.longitude is not None:
+            location.geohash = encode_geohash(location.latitude, location.longitude)
+        return location
+
+    @staticmethod
+    def apply_normalized_address(location: Location) -> Location:
+        """Derive the normalized address stored for de-duplication lookups."""
+        full_address = join_address(location.street, location.city, location.postcode, location.country)
+        location.normalized_address = normalize_address(full_address) or None
+        return location
+
+    @staticmethod
+    def index_address_tokens(session: Session, locations: list[Location]) -> None:
+        """Add token index rows for flushed locations (ids must be assigned)."""
+        for location in locations:
+            if location.normalized_address:
+                for token in address_tokens(location.normalized_address):
+                    session.add(LocationAddressToken(token=token, location_id=location.id))
+
+    @staticmethod
+    def bbox_filter(min_lat: float, min_lon: float, max_lat: float, max_lon: float):
+        """Build a WHERE clause selecting locations inside a bounding box.
+
+        The geohash prefix ranges let the database answer from the geohash
+        index; the coordinate comparisons then trim the cells' overhang.
+        """
+        exact = and_(
+            Location.latitude >= min_lat,
+            Location.latitude <= max_lat,
+            Location.longitude >= min_lon,
+            Location.longitude <= max_lon,
+        )
+        cells = covering_cells(min_lat, min_lon, max_lat, max_lon)
+        if not cells:
+            return exact
+        return and_(or_(*[LocationDAO.geohash_prefix_filter(cell) for cell in cells]), exact)
+
+    @staticmethod
+    def geohash_prefix_filter(prefix: str):
+        """Build an index range condition selecting geohashes that start with ``prefix``."""
+        bound = prefix_upper_bound(prefix)
+        if bound is None:
+            return Location.geohash >= prefix
+        return and_(Location.geohash >= prefix, Location.geohash < bound)
+
+    @staticmethod
+    def approximate_distance(latitude: float, longitude: float):
+        """Build an expression that orders locations by distance from a point.
+
+        It is the squared equirectangular distance in degrees, with the cosine
+        of the mean latitude taken from its Taylor series so the expression is
+        plain arithmetic on any database. Within the 1000 km radius the
+        endpoints allow it is within 1% of the great-circle distance up to 60
+        degrees of latitude and within 5% nearer the poles; NEARBY_OVERFETCH
+        absorbs the difference.
+        """
+        mean_latitude = (Location.latitude + latitude) * (math.pi / 360)
+        squared = mean_latitude * mean_latitude
+        cos_latitude = 1 - squared / 2 + squared * squared / 24
+        d_lat = Location.latitude - latitude
+        d_lon = (Location.longitude - longitude) * cos_latitude
+        return d_lat * d_lat + d_lon * d_lon
 
     @staticmethod
     def create_location(location: Location) -> Location:
         """Create and persist a new location."""
-        with Session(engine) as session:
+        LocationDAO.apply_geohash(location)
+        LocationDAO.apply_normalized_address(location)
+        with session_scope() as session:
             session.add(location)
-            session.commit()
+            session.flush()
+            LocationDAO.index_address_tokens(session, [location])
+            mark_modified(session, "location")
+            commit(session)
             session.refresh(location)
             return location
 
@@ -19,13 +109,13 @@ class LocationDAO:
     @staticmethod
     def get_location(location_id: int) -> Location | None:
         """Retrieve a location by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.get(Location, location_id)
         
     @staticmethod
     def get_location_by_coordinates(latitude: float, longitude: float, tolerance: float = 0.0001) -> Location | None:
         """Retrieve a location by its coordinates, allowing for a small variance."""
-        with Session(engine) as session:
+        with session_scope() as session:
             query = select(Location).where(
                 (Location.latitude >= latitude - tolerance) &
                 (Location.latitude <= latitude + tolerance) &
@@ -34,28 +124,90 @@ class LocationDAO:
             )
             return session.exec(query).first()
 
+    @staticmethod
+    def get_locations_in_bbox(min_lat: float, min_lon: float, max_lat: float, max_lon: float, limit: int = 100) -> list[Location]:
+        """Retrieve locations inside a bounding box."""
+        query = select(Location).where(LocationDAO.bbox_filter(min_lat, min_lon, max_lat, max_lon))
+        with session_scope() as session:
+            return session.exec(query.order_by(Location.id).limit(limit)).all()
+
+    @staticmethod
+    def get_locations_within_radius(latitude: float, longitude: float, radius_km: float, limit: int = 100) -> list[tuple[Location, float]]:
+        """Retrieve locations within ``radius_km`` of a point, nearest first.
+
+        Returns (location, distance_km) pairs. The database returns at most
+        NEARBY_OVERFETCH * ``limit`` candidates, nearest first by approximate
+        distance, so the rows read are bounded however dense the area is.
+        """
+        query = (
+            select(Location)
+            .where(LocationDAO.bbox_filter(*bbox_around(latitude, longitude, radius_km)))
+            .order_by(LocationDAO.approximate_distance(latitude, longitude))
+            .limit(limit * LocationDAO.NEARBY_OVERFETCH)
+        )
+        with session_scope() as session:
+            candidates = session.exec(query).all()
+        matches = [
+            (loc, haversine_km(latitude, longitude, loc.latitude, loc.longitude))
+            for loc in candidates
+        ]
+        matches = [match for match in matches if match[1] <= radius_km]
+        matches.sort(key=lambda match: match[1])
+        return matches[:limit]
+
     @staticmethod
     def get_location_by_full_address(full_address: str, threshold: int = 85) -> Location | None:
-        """ Retrieve a location by fuzzy matching its full address. """
-        with Session(engine) as session:
-            locations = session.exec(select(Location)).all()
-            for loc in locations:
-                if loc.full_address:
-                    ratio = fuzz.token_set_ratio(full_address, loc.full_address)
-                    if ratio >= threshold:
-                        return loc
-        return None
+        """Retrieve a location by fuzzy matching its full address.
+
+        The token index narrows the search to locations sharing the most
+        address tokens with the query; only those few candidates are scored.
+        Tokens with more than MAX_TOKEN_POSTINGS locations (a city or country
+        name, say) are too common to narrow anything and are skipped, so a
+        lookup reads a bounded number of index entries however large the
+        table grows.
+        """
+        normalized = normalize_address(full_address)
+        tokens = address_tokens(normalized)
+        if not tokens:
+            return None
+
+        with session_scope() as session:
+            votes = Counter()
+            for token in tokens:
+                postings = session.exec(
+                    select(LocationAddressToken.location_id)
+                    .where(LocationAddressToken.token == token)
+                    .limit(LocationDAO.MAX_TOKEN_POSTINGS + 1)
+                ).all()
+                if len(postings) <= LocationDAO.MAX_TOKEN_POSTINGS:
+                    votes.update(postings)
+            if not votes:
+                return None
+
+            candidate_ids = [location_id for location_id, _ in votes.most_common(LocationDAO.MAX_ADDRESS_CANDIDATES)]
+            candidates = session.exec(select(Location).where(Location.id.in_(candidate_ids))).all()
+
+        best, best_ratio = None, threshold - 1
+        for loc in candidates:
+            if loc.normalized_address:
+                ratio = fuzz.token_set_ratio(normalized, loc.normalized_address)
+                if ratio > best_ratio:
+                    best, best_ratio = loc, ratio
+        return best
 
     @staticmethod
-    def get_locations() -> list[Location]:
-        """Retrieve all locations."""
-        with Session(engine) as session:
-            return session.exec(select(Location)).all()
+    def get_locations(after_id: int | None = None, limit: int = 100) -> list[Location]:
+        """Retrieve a page of locations ordered by id (keyset on ``after_id``)."""
+        query = select(Location)
+        if after_id is not None:
+            query = query.where(Location.id > after_id)
+        with session_scope() as session:
+            return session.exec(query.order_by(Location.id).limit(limit)).all()
 
     @staticmethod
     def update_location(location_update: Location) -> Location | None:
         """Update an existing location by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             # Fetch the existing record first
             existing = session.get(Location, location_update.id)
             if not existing:
@@ -65,19 +217,28 @@ class LocationDAO:
             for key, value in location_update.model_dump().items():
                 if key != "id" and value is not None:
                     setattr(existing, key, value)
+            LocationDAO.apply_geohash(existing)
+            LocationDAO.apply_normalized_address(existing)
+
+            # Rebuild the address token index for this location
+            session.exec(delete(LocationAddressToken).where(LocationAddressToken.location_id == existing.id))
+            LocationDAO.index_address_tokens(session, [existing])
 
             session.add(existing)
-            session.commit()
+            mark_modified(session, "location")
+            commit(session)
             session.refresh(existing)
             return existing
 
     @staticmethod
     def delete_location(location_id: int) -> bool:
         """Delete a location by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             location = session.get(Location, location_id)
             if not location:
                 return False
+            session.exec(delete(LocationAddressToken).where(LocationAddressToken.location_id == location_id))
             session.delete(location)
-            session.commit()
+            mark_modified(session, "location")
+            commit(session)
             return  {"ok": True}
@@ -0,0 +1,123 @@
+from sqlalchemy import and_, case, func, update
+from sqlmodel import select
+
+from api_service.app.models import Event, Location, ResourceAvailable, ResourceNeeded, Volunteer
+from api_service.app.db import commit, session_scope
+from api_service.app.core.change_feed import record_change
+
+
+class MatchingDAO:
+    @staticmethod
+    def get_open_needs(event_ids: list[int] | None = None, resource_type: str | None = None,
+                       need_ids: list[int] | None = None) -> list[tuple]:
+        """Retrieve unfulfilled needs of open events for the matching engine.
+
+        Rows are ``(need_id, event_id, resource_type, quantity, priority,
+        latitude, longitude, spare)`` ordered by (event, type, id). ``spare`` is
+        the quantity already allocated to the need's (event, type) group beyond
+        what its fulfilled needs account for; the caller spreads it over the
+        group's open needs in id order.
+        """
+        allocated = (
+            select(ResourceAvailable.event_id, ResourceAvailable.resource_type, func.sum(ResourceAvailable.quantity).label("quantity"))
+            .where(ResourceAvailable.is_allocated == True, ResourceAvailable.event_id.is_not(None))  # noqa: E712
+            .group_by(ResourceAvailable.event_id, ResourceAvailable.resource_type)
+            .subquery()
+        )
+        fulfilled = (
+            select(ResourceNeeded.event_id, ResourceNeeded.resource_type, func.sum(ResourceNeeded.quantity).label("quantity"))
+            .where(ResourceNeeded.is_fulfilled == True)  # noqa: E712
+            .group_by(ResourceNeeded.event_id, ResourceNeeded.resource_type)
+            .subquery()
+        )
+        query = (
+            select(
+                ResourceNeeded.id,
+                ResourceNeeded.event_id,
+                ResourceNeeded.resource_type,
+                ResourceNeeded.quantity,
+                Event.priority,
+                Location.latitude,
+                Location.longitude,
+                func.coalesce(allocated.c.quantity, 0) - func.coalesce(fulfilled.c.quantity, 0),
+            )
+            .join(Event, ResourceNeeded.event_id == Event.id)
+            .join(Location, Event.location_id == Location.id)
+            .outerjoin(allocated, and_(allocated.c.event_id == ResourceNeeded.event_id, allocated.c.resource_type == ResourceNeeded.resource_type))
+            .outerjoin(fulfilled, and_(fulfilled.c.event_id == ResourceNeeded.event_id, fulfilled.c.resource_type == ResourceNeeded.resource_type))
+            .where(ResourceNeeded.is_fulfilled == False, Event.status != "completed")  # noqa: E712
+        )
+        if event_ids is not None:
+            query = query.where(ResourceNeeded.event_id.in_(event_ids))
+        if resource_type is not None:
+            query = query.where(ResourceNeeded.resource_type == resource_type)
+        if need_ids is not None:
+            query = query.where(ResourceNeeded.id.in_(need_ids))
+        query = query.order_by(ResourceNeeded.event_id, ResourceNeeded.resource_type, ResourceNeeded.id)
+        with session_scope() as session:
+            return session.exec(query).all()
+
+    @staticmethod
+    def get_open_offers(resource_type: str | None = None) -> list[tuple]:
+        """Retrieve unallocated offers as ``(resource_id, resource_type, quantity, latitude, longitude)``.
+
+        The coordinates are those of the offering volunteer's event, or None
+        when the volunteer is not deployed anywhere.
+        """
+        query = (
+            select(
+                ResourceAvailable.id,
+                ResourceAvailable.resource_type,
+                ResourceAvailable.quantity,
+                Location.latitude,
+                Location.longitude,
+            )
+            .outerjoin(Volunteer, ResourceAvailable.volunteer_id == Volunteer.id)
+            .outerjoin(Event, Volunteer.event_id == Event.id)
+            .outerjoin(Location, Event.location_id == Location.id)
+            .where(ResourceAvailable.is_allocated == False)  # noqa: E712
+        )
+        if resource_type is not None:
+            query = query.where(ResourceAvailable.resource_type == resource_type)
+        with session_scope() as session:
+            return session.exec(query.order_by(ResourceAvailable.id)).all()
+
+    @staticmethod
+    def allocate(allocations: dict[int, tuple[int, str]]) -> list[int]:
+        """Allocate offers to events with one UPDATE; ``allocations`` maps resource id to (event_id, resource_type).
+
+        Only offers that are still unallocated and of the expected type are
+        changed, so proposals that went stale are skipped rather than
+        overwriting a coordinator's manual allocation. Returns the ids that
+        were allocated.
+        """
+        if not allocations:
+            return []
+        event_by_id = {resource_id: event_id for resource_id, (event_id, _) in allocations.items()}
+        type_by_id = {resource_id: resource_type for resource_id, (_, resource_type) in allocations.items()}
+        with session_scope() as session:
+            allocated = session.execute(
+                update(ResourceAvailable)
+                .where(
+                    ResourceAvailable.id.in_(list(allocations)),
+                    ResourceAvailable.is_allocated == False,  # noqa: E712
+                    ResourceAvailable.resource_type == case(type_by_id, value=ResourceAvailable.id),
+                )
+                .values(event_id=case(event_by_id, value=ResourceAvailable.id), is_allocated=True, status="in_use")
+                .returning(ResourceAvailable.id)
+            ).scalars().all()
+            for resource_id in allocated:
+                record_change(session, "resource_available", "updated", resource_id)
+            commit(session)
+            return allocated
+
+    @staticmethod
+    def mark_fulfilled(need_ids: list[int]) -> None:
+        """Mark needs as fulfilled with one UPDATE."""
+        if not need_ids:
+            return
+        with session_scope() as session:
+            session.execute(update(ResourceNeeded).where(ResourceNeeded.id.in_(need_ids)).values(is_fulfilled=True))
+            for need_id in need_ids:
+                record_change(session, "resource_needed", "updated", need_id)
+            commit(session)
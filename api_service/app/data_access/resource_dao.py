@@ -1,97 +1,151 @@
-from sqlmodel import Session, select
+from sqlmodel import select
 
 from api_service.app.models import ResourceAvailable, ResourceNeeded
-from api_service.app.db import engine
+from api_service.app.db import commit, session_scope
+from api_service.app.core.change_feed import record_change
+from .triage_dao import mark_triage_stale
 
 class ResourceDAO:
     @staticmethod
     def create_resource_available(resource: ResourceAvailable) -> ResourceAvailable:
         """Create and persist a new available resource."""
-        with Session(engine) as session:
+        with session_scope() as session:
             session.add(resource)
-            session.commit()
+            session.flush()
+            record_change(session, "resource_available", "created", resource.id)
+            commit(session)
             session.refresh(resource)
             return resource
 
     @staticmethod
     def get_resource_available(resource_id: int) -> ResourceAvailable | None:
         """Retrieve an available resource by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.get(ResourceAvailable, resource_id)
 
     @staticmethod
-    def get_resources_available() -> list[ResourceAvailable]:
-        """Retrieve all available resources."""
-        with Session(engine) as session:
-            return session.exec(select(ResourceAvailable)).all()
+    def get_resources_available(
+        after_id: int | None = None,
+        limit: int = 100,
+        event_id: int | None = None,
+        volunteer_id: int | None = None,
+        resource_type: str | None = None,
+        is_allocated: bool | None = None,
+    ) -> list[ResourceAvailable]:
+        """Retrieve a page of available resources ordered by id.
+
+        Pagination is keyset-based: pass the last id of the previous page as
+        ``after_id`` to continue from there.
+        """
+        query = select(ResourceAvailable)
+
+        if after_id is not None:
+            query = query.where(ResourceAvailable.id > after_id)
+        if event_id is not None:
+            query = query.where(ResourceAvailable.event_id == event_id)
+        if volunteer_id is not None:
+            query = query.where(ResourceAvailable.volunteer_id == volunteer_id)
+        if resource_type is not None:
+            query = query.where(ResourceAvailable.resource_type == resource_type)
+        if is_allocated is not None:
+            query = query.where(ResourceAvailable.is_allocated == is_allocated)
+
+        with session_scope() as session:
+            return session.exec(query.order_by(ResourceAvailable.id).limit(limit)).all()
 
     @staticmethod
     def update_resource_available(resource_id: int, resource_data: dict) -> ResourceAvailable | None:
         """Update an available resource by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             resource = session.get(ResourceAvailable, resource_id)
             if not resource:
                 return None
             for key, value in resource_data.items():
                 setattr(resource, key, value)
             session.add(resource)
-            session.commit()
+            record_change(session, "resource_available", "updated", resource_id)
+            commit(session)
             session.refresh(resource)
             return resource
 
     @staticmethod
     def delete_resource_available(resource_id: int) -> bool:
         """Delete an available resource by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             resource = session.get(ResourceAvailable, resource_id)
             if not resource:
                 return False
             session.delete(resource)
-            session.commit()
+            record_change(session, "resource_available", "deleted", resource_id)
+            commit(session)
             return {"ok": True}
 
     @staticmethod
     def create_resource_needed(resource: ResourceNeeded) -> ResourceNeeded:
         """Create and persist a new needed resource."""
-        with Session(engine) as session:
+        with session_scope() as session:
             session.add(resource)
-            session.commit()
+            session.flush()
+            record_change(session, "resource_needed", "created", resource.id)
+            commit(session)
             session.refresh(resource)
             return resource
 
     @staticmethod
     def get_resource_needed(resource_id: int) -> ResourceNeeded | None:
         """Retrieve a needed resource by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.get(ResourceNeeded, resource_id)
 
     @staticmethod
-    def get_resources_needed() -> list[ResourceNeeded]:
-        """Retrieve all needed resources."""
-        with Session(engine) as session:
-            return session.exec(select(ResourceNeeded)).all()
+    def get_resources_needed(
+        after_id: int | None = None,
+        limit: int = 100,
+        event_id: int | None = None,
+        resource_type: str | None = None,
+        is_fulfilled: bool | None = None,
+    ) -> list[ResourceNeeded]:
+        """Retrieve a page of needed resources ordered by id (keyset on ``after_id``)."""
+        query = select(ResourceNeeded)
+
+        if after_id is not None:
+            query = query.where(ResourceNeeded.id > after_id)
+        if event_id is not None:
+            query = query.where(ResourceNeeded.event_id == event_id)
+        if resource_type is not None:
+            query = query.where(ResourceNeeded.resource_type == resource_type)
+        if is_fulfilled is not None:
+            query = query.where(ResourceNeeded.is_fulfilled == is_fulfilled)
+
+        with session_scope() as session:
+            return session.exec(query.order_by(ResourceNeeded.id).limit(limit)).all()
 
     @staticmethod
     def update_resource_needed(resource_id: int, resource_data: dict) -> ResourceNeeded | None:
         """Update a needed resource by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             resource = session.get(ResourceNeeded, resource_id)
             if not resource:
                 return None
+            # The need may move to another event; the old one is rescored too
+            mark_triage_stale(session, resource.event_id)
             for key, value in resource_data.items():
                 setattr(resource, key, value)
             session.add(resource)
-            session.commit()
+            record_change(session, "resource_needed", "updated", resource_id)
+            commit(session)
             session.refresh(resource)
             return resource
 
     @staticmethod
     def delete_resource_needed(resource_id: int) -> bool:
         """Delete a needed resource by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             resource = session.get(ResourceNeeded, resource_id)
             if not resource:
                 return False
             session.delete(resource)
-            session.commit()
+            record_change(session, "resource_needed", "deleted", resource_id)
+            mark_triage_stale(session, resource.event_id)
+            commit(session)
             return {"ok": True}
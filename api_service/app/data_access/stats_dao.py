@@ -1,37 +1,64 @@
+from datetime import datetime
+
 from sqlmodel import Session, select
 from sqlalchemy import func
 
-from api_service.app.db import engine
-from api_service.app.models import Event, Volunteer, ResourceAvailable, Location
+from api_service.app.db import commit, session_scope
+from api_service.app.models import Event, Volunteer, ResourceAvailable, Location, StatsSnapshot
 
 
 class StatsDAO:
     @staticmethod
     def get_stats() -> dict:
-        """Return aggregated stats used by the frontend dashboard."""
-        with Session(engine) as session:
-            # active events are those with status active or pending (matches frontend filter)
-            active_events = session.exec(
-                select(func.count()).select_from(Event).where(Event.status.in_(["active"]))
-            ).one()
-
-            total_volunteers = session.exec(
-                select(func.count()).select_from(Volunteer)
-            ).one()
-
-            resources_sum = session.exec(
-                select(func.sum(ResourceAvailable.quantity))
-            ).one()
-            if resources_sum is None:
-                resources_sum = 0
-
-            total_locations = session.exec(
-                select(func.count()).select_from(Location)
-            ).one()
+        """Return aggregated stats used by the frontend dashboard.
+
+        All four aggregates are scalar subqueries of one SELECT, so they are
+        computed in a single round trip against a single snapshot.
+        """
+        with session_scope() as session:
+            return StatsDAO.read_stats(session)
+
+    @staticmethod
+    def read_stats(session: Session) -> dict:
+        """Run the stats SELECT on ``session`` (lets callers fold it into a larger read)."""
+        # active events are those with status active (matches frontend filter)
+        active_events = select(func.count()).select_from(Event).where(Event.status.in_(["active"])).scalar_subquery()
+        total_volunteers = select(func.count()).select_from(Volunteer).scalar_subquery()
+        resources_sum = select(func.coalesce(func.sum(ResourceAvailable.quantity), 0)).scalar_subquery()
+        total_locations = select(func.count()).select_from(Location).scalar_subquery()
 
+        row = session.exec(select(active_events, total_volunteers, resources_sum, total_locations)).one()
         return {
-            "activeEvents": int(active_events),
-            "totalVolunteers": int(total_volunteers),
-            "resourcesAvailable": int(resources_sum),
-            "totalLocations": int(total_locations),
+            "activeEvents": int(row[0]),
+            "totalVolunteers": int(row[1]),
+            "resourcesAvailable": int(row[2]),
+            "totalLocations": int(row[3]),
         }
+
+    @staticmethod
+    def save_snapshot(stats: dict, taken_at: datetime) -> StatsSnapshot:
+        """Persist a point-in-time copy of the dashboard stats."""
+        snapshot = StatsSnapshot(
+            taken_at=taken_at,
+            active_events=stats["activeEvents"],
+            total_volunteers=stats["totalVolunteers"],
+            resources_available=stats["resourcesAvailable"],
+            total_locations=stats["totalLocations"],
+        )
+        with session_scope() as session:
+            session.add(snapshot)
+            commit(session)
+            session.refresh(snapshot)
+            return snapshot
+
+    @staticmethod
+    def get_snapshot_at(at: datetime) -> StatsSnapshot | None:
+        """Retrieve the latest snapshot taken at or before ``at`` (naive UTC)."""
+        query = (
+            select(StatsSnapshot)
+            .where(StatsSnapshot.taken_at <= at)
+            .order_by(StatsSnapshot.taken_at.desc())
+            .limit(1)
+        )
+        with session_scope() as session:
+            return session.exec(query).first()
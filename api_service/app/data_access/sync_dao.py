@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from sqlalchemy import delete, event, insert, or_
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from api_service.app.models import Event, Location, ResourceAvailable, ResourceNeeded, Tombstone, User, Volunteer
+from api_service.app.db import commit, get_async_engine, session_scope
+from api_service.app.core.change_feed import PENDING_CHANGES_KEY
+from .event_dao import EventDAO
+from .volunteer_dao import VolunteerDAO
+
+
+class SyncDAO:
+    @staticmethod
+    async def get_changes_async(since: datetime | None) -> dict[str, list]:
+        """Retrieve the rows modified, and the tombstones recorded, after ``since`` (naive UTC).
+
+        Events are included when their location or one of their volunteers
+        changed too, since the location and the volunteer count are embedded
+        in the response; likewise volunteers when their user did. With
+        ``since`` None every row is returned and no tombstones.
+        """
+        events = EventDAO._details_query().order_by(Event.id)
+        volunteers = VolunteerDAO._with_users_query(None, None, None, None, 0, None)
+        users = select(User).order_by(User.id)
+        resources_needed = select(ResourceNeeded).order_by(ResourceNeeded.id)
+        resources_available = select(ResourceAvailable).order_by(ResourceAvailable.id)
+        tombstones = select(Tombstone).order_by(Tombstone.id)
+        if since is not None:
+            volunteer_changed = (
+                select(Volunteer.id)
+                .where(Volunteer.event_id == Event.id, Volunteer.modified_time > since)
+                .exists()
+            )
+            events = events.where(or_(Event.modified_time > since, Location.modified_time > since, volunteer_changed))
+            volunteers = volunteers.where(or_(Volunteer.modified_time > since, User.modified_time > since))
+            users = users.where(User.modified_time > since)
+            resources_needed = resources_needed.where(ResourceNeeded.modified_time > since)
+            resources_available = resources_available.where(ResourceAvailable.modified_time > since)
+            tombstones = tombstones.where(Tombstone.deleted_at > since)
+
+        async with AsyncSession(get_async_engine()) as session:
+            return {
+                "events": (await session.exec(events)).all(),
+                "volunteers": (await session.exec(volunteers)).all(),
+                "users": (await session.exec(users)).all(),
+                "resources_needed": (await session.exec(resources_needed)).all(),
+                "resources_available": (await session.exec(resources_available)).all(),
+                "deleted": (await session.exec(tombstones)).all() if since is not None else [],
+            }
+
+    @staticmethod
+    def prune_tombstones(before: datetime) -> int:
+        """Delete tombstones recorded before ``before``; return how many were removed."""
+        with session_scope() as session:
+            result = session.execute(delete(Tombstone).where(Tombstone.deleted_at < before))
+            commit(session)
+            return result.rowcount
+
+
+@event.listens_for(Session, "before_commit")
+def _record_tombstones(session: Session) -> None:
+    # Deletes queued on the change feed commit together with their tombstones
+    now = datetime.utcnow()
+    tombstones = [
+        {"entity": entity, "entity_id": entity_id, "deleted_at": now}
+        for entity, action, entity_id in session.info.get(PENDING_CHANGES_KEY, ())
+        if action == "deleted" and entity_id is not None
+    ]
+    if tombstones:
+        session.execute(insert(Tombstone), tombstones)
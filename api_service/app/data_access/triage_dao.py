@@ -0,0 +1,164 @@
+import math
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, event, func, update
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from api_service.app.models import Event, Location, ResourceNeeded, Volunteer
+from api_service.app.db import commit, get_async_engine, session_scope
+from api_service.app.core.config import settings
+from api_service.app.core.change_feed import PENDING_CHANGES_KEY
+
+STALE_TRIAGE_KEY = "stale_triage_events"
+# Stored scores count aging from this instant instead of from "now", so they
+# stay comparable without being rewritten as time passes
+TRIAGE_EPOCH = datetime(2020, 1, 1)
+REFRESH_CHUNK_SIZE = 500
+
+
+def mark_triage_stale(session: Session, *event_ids: int | None) -> None:
+    """Recompute these events' triage scores when ``session`` commits.
+
+    Events whose own row, needs or volunteers are on the change feed are
+    refreshed automatically; this is for events a need or volunteer was moved
+    away from or deleted from.
+    """
+    session.info.setdefault(STALE_TRIAGE_KEY, set()).update(event_id for event_id in event_ids if event_id is not None)
+
+
+class TriageDAO:
+    @staticmethod
+    def score(priority: int, create_time: datetime | None, unfulfilled_quantity: int, active_volunteers: int) -> float:
+        """The stored triage score: the score an event would have at TRIAGE_EPOCH.
+
+        score = TRIAGE_PRIORITY_WEIGHT * (6 - priority)
+                + TRIAGE_NEEDS_WEIGHT * ln(1 + unfulfilled quantity)
+                - TRIAGE_VOLUNTEERS_WEIGHT * ln(1 + active volunteers)
+                + TRIAGE_AGING_PER_HOUR * hours since create_time
+
+        Aging grows at the same rate for every event, so the order of stored
+        scores is the order of current scores; add ``aging_offset(now)`` to
+        get the current value.
+        """
+        if create_time is None:
+            create_time = datetime.utcnow()
+        elif create_time.tzinfo is not None:
+            create_time = create_time.astimezone(timezone.utc).replace(tzinfo=None)
+        created_hours = (create_time - TRIAGE_EPOCH).total_seconds() / 3600
+        return (
+            settings.TRIAGE_PRIORITY_WEIGHT * (6 - priority)
+            + settings.TRIAGE_NEEDS_WEIGHT * math.log1p(max(unfulfilled_quantity, 0))
+            - settings.TRIAGE_VOLUNTEERS_WEIGHT * math.log1p(max(active_volunteers, 0))
+            - settings.TRIAGE_AGING_PER_HOUR * created_hours
+        )
+
+    @staticmethod
+    def aging_offset(now: datetime) -> float:
+        """What to add to a stored score to get its value at ``now`` (naive UTC)."""
+        return settings.TRIAGE_AGING_PER_HOUR * (now - TRIAGE_EPOCH).total_seconds() / 3600
+
+    @staticmethod
+    def refresh(session: Session, event_ids: set[int]) -> None:
+        """Recompute the stored triage score of the given events (caller commits).
+
+        Completed events get no score and drop out of the queue. Each event
+        costs one indexed row update, whatever the size of the table.
+        """
+        unfulfilled = (
+            select(func.coalesce(func.sum(ResourceNeeded.quantity), 0))
+            .where(ResourceNeeded.event_id == Event.id, ResourceNeeded.is_fulfilled == False)  # noqa: E712
+            .scalar_subquery()
+        )
+        active = (
+            select(func.count())
+            .select_from(Volunteer)
+            .where(Volunteer.event_id == Event.id, Volunteer.status == "active")
+            .scalar_subquery()
+        )
+        table = Event.__table__
+        # Core UPDATE so the ORM's modified_time onupdate does not fire: the
+        # score is derived data and must not make the event look edited to /sync
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("event_id"))
+            .values(triage_score=bindparam("score"), modified_time=table.c.modified_time)
+        )
+        ids = sorted(event_ids)
+        for start in range(0, len(ids), REFRESH_CHUNK_SIZE):
+            rows = session.execute(
+                select(Event.id, Event.priority, Event.status, Event.create_time, unfulfilled, active)
+                .where(Event.id.in_(ids[start:start + REFRESH_CHUNK_SIZE]))
+            ).all()
+            if rows:
+                session.execute(statement, [
+                    {
+                        "event_id": event_id,
+                        "score": None if status == "completed" else TriageDAO.score(priority, create_time, quantity, volunteers),
+                    }
+                    for event_id, priority, status, create_time, quantity, volunteers in rows
+                ])
+
+    @staticmethod
+    def refresh_all() -> int:
+        """Recompute every event's triage score, e.g. after the TRIAGE_* weights changed; return how many."""
+        with session_scope(independent=True) as session:
+            event_ids = session.exec(select(Event.id).order_by(Event.id)).all()
+        for start in range(0, len(event_ids), REFRESH_CHUNK_SIZE):
+            # Each chunk commits on its own so a full rescore never holds long locks
+            with session_scope(independent=True) as session:
+                TriageDAO.refresh(session, set(event_ids[start:start + REFRESH_CHUNK_SIZE]))
+                commit(session)
+        return len(event_ids)
+
+    @staticmethod
+    async def get_queue_async(limit: int) -> list[tuple[Event, Location, int]]:
+        """Retrieve the ``limit`` open events with the highest triage score, highest first.
+
+        Rows are ``(Event, Location, active_volunteers)`` like the listing paths,
+        but the volunteer count is a correlated subquery so the read walks the
+        triage_score index and touches only the rows it returns.
+        """
+        active = (
+            select(func.count())
+            .select_from(Volunteer)
+            .where(Volunteer.event_id == Event.id, Volunteer.status == "active")
+            .scalar_subquery()
+        )
+        query = (
+            select(Event, Location, active)
+            .join(Location, Event.location_id == Location.id)
+            .where(Event.triage_score.is_not(None))
+            .order_by(Event.triage_score.desc())
+            .limit(limit)
+        )
+        async with AsyncSession(get_async_engine()) as session:
+            return (await session.exec(query)).all()
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_triage_scores(session: Session) -> None:
+    event_ids = set(session.info.pop(STALE_TRIAGE_KEY, ()))
+    need_ids, volunteer_ids = set(), set()
+    for entity, action, entity_id in session.info.get(PENDING_CHANGES_KEY, ()):
+        if action == "deleted" or entity_id is None:
+            continue
+        if entity == "event":
+            event_ids.add(entity_id)
+        elif entity == "resource_needed":
+            need_ids.add(entity_id)
+        elif entity == "volunteer":
+            volunteer_ids.add(entity_id)
+    for model, ids in ((ResourceNeeded, sorted(need_ids)), (Volunteer, sorted(volunteer_ids))):
+        for start in range(0, len(ids), REFRESH_CHUNK_SIZE):
+            event_ids.update(session.execute(
+                select(model.event_id).where(model.id.in_(ids[start:start + REFRESH_CHUNK_SIZE]))
+            ).scalars())
+    event_ids.discard(None)
+    if event_ids:
+        TriageDAO.refresh(session, event_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_stale_triage(session: Session, previous_transaction) -> None:
+    session.info.pop(STALE_TRIAGE_KEY, None)
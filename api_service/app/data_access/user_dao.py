@@ -1,13 +1,33 @@
 from sqlmodel import Session, select
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
 
 from api_service.app.models import User
-from api_service.app.db import engine
+from api_service.app.db import commit, session_scope
+from api_service.app.core.cache import TTLCache
+from api_service.app.core.config import settings
+from api_service.app.core.change_feed import record_change
 from domain.exceptions import UserExistsException
 
+STALE_USER_EMAILS_KEY = "stale_user_emails"
+
+
+def evict_cached_users(session: Session, *emails: str | None) -> None:
+    """Drop these users from ``UserDAO.email_cache`` once ``session`` commits.
+
+    Evicting earlier would let a concurrent lookup reload the pre-commit row
+    and cache it for the full TTL.
+    """
+    session.info.setdefault(STALE_USER_EMAILS_KEY, set()).update(email for email in emails if email)
+
+
 class UserDAO:
+    # Detached copies of users looked up by email (the token subject)
+    email_cache = TTLCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+
     def create_user(user_data: User) -> User:
         """Create and persist a new user if email doesn't exist; return existing otherwise."""
-        with Session(engine) as session:
+        with session_scope() as session:
             # Check if a user with the same email already exists
             query = select(User).where(User.email == user_data.email)
             existing_user = session.exec(query).first()
@@ -17,16 +37,46 @@ class UserDAO:
 
             # Otherwise, create and persist the new user
             session.add(user_data)
-            session.commit()
+            try:
+                session.flush()
+            except IntegrityError as e:
+                # Lost a race with a concurrent registration; the unique index on email caught it
+                session.rollback()
+                raise UserExistsException("User already exists with this email.") from e
+            record_change(session, "user", "created", user_data.id)
+            commit(session)
             session.refresh(user_data)
             return user_data
 
     @staticmethod
     def get_user(user_id: int) -> User | None:
         """Retrieve a user by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.get(User, user_id)
 
+    @staticmethod
+    def get_user_by_email(email: str) -> User | None:
+        """Retrieve a user by email."""
+        with session_scope() as session:
+            return session.exec(select(User).where(User.email == email)).first()
+
+    @staticmethod
+    def get_user_by_email_cached(email: str) -> User | None:
+        """Like ``get_user_by_email`` but served from a short-TTL cache.
+
+        Returns a detached copy that is safe to share between requests; it
+        must not be added to a session. Unknown emails are not cached.
+        """
+        return UserDAO.email_cache.get_or_load(
+            email,
+            lambda: UserDAO._detached_copy(UserDAO.get_user_by_email(email)),
+            ttl_for=lambda user: None if user else 0,
+        )
+
+    @staticmethod
+    def _detached_copy(user: User | None) -> User | None:
+        return User(**user.model_dump()) if user else None
+
     @staticmethod
     def get_users(skip, limit, status: str | None = None, role: str | None = None, role_ne: str | None = None) -> list[User]:
         """Retrieve all users, optionally filtered by status and role."""
@@ -38,35 +88,62 @@ class UserDAO:
         if role_ne:
             query = query.where(User.role != role_ne)
 
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.exec(query.offset(skip).limit(limit)).all()
 
     @staticmethod
     def update_user(user_id: int, user_update: User) -> User | None:
         """Update a user by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
            # Fetch the existing record first
             existing = session.get(User, user_id)
             if not existing:
                 return None  # Don't insert new row
+            previous_email = existing.email
 
             # Copy updated fields from input object
             for key, value in user_update.model_dump().items():
                 if key != "id" and value is not None:
                     setattr(existing, key, value)
+            evict_cached_users(session, previous_email, existing.email)
 
             session.add(existing)
-            session.commit()
+            record_change(session, "user", "updated", user_id)
+            commit(session)
             session.refresh(existing)
             return existing
 
+    @staticmethod
+    def update_password_hash(user_id: int, password_hash: str) -> None:
+        """Replace a user's stored password hash (e.g. after a bcrypt cost change)."""
+        with session_scope() as session:
+            user = session.get(User, user_id)
+            if user:
+                user.password = password_hash
+                session.add(user)
+                evict_cached_users(session, user.email)
+                commit(session)
+
     @staticmethod
     def delete_user(user_id: int) -> bool:
         """Delete a user by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             user = session.get(User, user_id)
             if not user:
                 return False
             session.delete(user)
-            session.commit()
+            evict_cached_users(session, user.email)
+            record_change(session, "user", "deleted", user_id)
+            commit(session)
             return True
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_committed_users(session: Session) -> None:
+    for email in session.info.pop(STALE_USER_EMAILS_KEY, ()):
+        UserDAO.email_cache.pop(email)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_stale_users(session: Session, previous_transaction) -> None:
+    session.info.pop(STALE_USER_EMAILS_KEY, None)
@@ -1,52 +1,85 @@
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from collections import defaultdict
+
+from sqlalchemy import case, func, or_, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from datetime import datetime
 
 from api_service.app.models import Volunteer, User
-from api_service.app.db import engine
+from api_service.app.db import commit, session_scope, get_async_engine
+from api_service.app.core.change_feed import record_change
+from .user_dao import evict_cached_users
+from .event_dao import EventDAO
+from .triage_dao import mark_triage_stale
 from sqlmodel import select
 from datetime import datetime
 
 class VolunteerDAO:
     @staticmethod
-    def refresh_user_status(user_id: int, session: Session | None = None) -> None:
-        """Ensure the linked User.status reflects whether they have any active volunteers.
+    def adjust_active_assignments(deltas: dict[int, int], session: Session) -> None:
+        """Atomically add ``deltas[user_id]`` to users' active_assignments (caller commits).
 
-        If a session is provided, the update is performed on that session and not committed
-        (caller should commit). If no session is provided, the method opens its own session
-        and commits the change.
+        The user's status is derived from the new count in the same UPDATE:
+        'assigned' while it is positive, else 'available'; users marked
+        'unavailable' keep that status. Users sharing a delta are updated by
+        one statement, so the cost does not depend on volunteer history.
         """
-        owns_session = False
-        if session is None:
-            session = Session(engine)
-            owns_session = True
-
-        try:
-            user = session.get(User, user_id)
-            if user:
-                active = session.exec(
-                    select(Volunteer).where(Volunteer.user_id == user_id, Volunteer.status == "active")
-                ).first()
-
-                if user.status == "unavailable":
-                    desired_status = "unavailable"
-                elif active:
-                    desired_status = "assigned"
-                else:
-                    desired_status = "available"
-
-                if user.status != desired_status:
-                    user.status = desired_status
-                    session.add(user)
-                    if owns_session:
-                        session.commit()
-        finally:
-            if owns_session:
-                session.close()
+        user_ids_by_delta = defaultdict(list)
+        for user_id, delta in deltas.items():
+            if user_id and delta:
+                user_ids_by_delta[delta].append(user_id)
+
+        for delta, user_ids in user_ids_by_delta.items():
+            active_assignments = User.active_assignments + delta
+            changed = session.execute(
+                update(User)
+                .where(User.id.in_(user_ids))
+                .values(active_assignments=active_assignments, status=VolunteerDAO._derived_status(active_assignments))
+                .returning(User.id, User.email)
+            ).all()
+            for user_id, email in changed:
+                evict_cached_users(session, email)
+                record_change(session, "user", "updated", user_id)
+
+    @staticmethod
+    def recount_active_assignments() -> int:
+        """Recompute every user's active_assignments and status from the Volunteer table.
+
+        Repairs counters that drifted (e.g. rows edited outside the API).
+        Returns the number of users that were corrected.
+        """
+        active_count = (
+            select(func.count())
+            .select_from(Volunteer)
+            .where(Volunteer.user_id == User.id, Volunteer.status == "active")
+            .scalar_subquery()
+        )
+        derived_status = VolunteerDAO._derived_status(active_count)
+        with session_scope() as session:
+            corrected = session.execute(
+                update(User)
+                .where(or_(User.active_assignments != active_count, User.status != derived_status))
+                .values(active_assignments=active_count, status=derived_status)
+                .returning(User.id, User.email)
+            ).all()
+            for user_id, email in corrected:
+                evict_cached_users(session, email)
+                record_change(session, "user", "updated", user_id)
+            commit(session)
+            return len(corrected)
+
+    @staticmethod
+    def _derived_status(active_assignments):
+        return case(
+            (User.status == "unavailable", User.status),
+            (active_assignments > 0, "assigned"),
+            else_="available",
+        )
 
     @staticmethod
     def create_volunteer(volunteer_data: Volunteer) -> Volunteer:
-        with Session(engine) as session:
+        with session_scope() as session:
             # Set create_time for new volunteer
             volunteer_data.create_time = datetime.now()
 
@@ -56,21 +89,21 @@ class VolunteerDAO:
 
             session.add(volunteer_data)
 
-            # Flush so that the pending volunteer row is visible to subsequent SELECTs
             session.flush()
+            record_change(session, "volunteer", "created", volunteer_data.id)
 
-            # Recompute and set the user's status based on active assignments
-            if volunteer_data.user_id:
-                VolunteerDAO.refresh_user_status(volunteer_data.user_id, session)
+            # Count the new assignment against the user (and mark them assigned)
+            if volunteer_data.status == "active":
+                VolunteerDAO.adjust_active_assignments({volunteer_data.user_id: 1}, session)
 
-            session.commit()
+            commit(session)
             session.refresh(volunteer_data)
             return volunteer_data
 
     @staticmethod
     def get_volunteer(volunteer_id: int) -> Volunteer | None:
         """Retrieve a volunteer by ID."""
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.get(Volunteer, volunteer_id)
 
     @staticmethod
@@ -88,9 +121,45 @@ class VolunteerDAO:
         if status is not None:
             query = query.where(Volunteer.status == status)
 
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.exec(query.offset(skip).limit(limit)).all()
 
+    @staticmethod
+    def get_volunteers_with_users(volunteer_id: int = None, event_id: int = None, user_id: int = None, status: str = None, skip: int = 0, limit: int = 100) -> list[tuple[Volunteer, User]]:
+        """Retrieve volunteers joined with their linked users in a single query.
+
+        Volunteers without a linked user are skipped, matching the response
+        shape which always nests the user.
+        """
+        query = VolunteerDAO._with_users_query(volunteer_id, event_id, user_id, status, skip, limit)
+        with session_scope() as session:
+            return session.exec(query).all()
+
+    @staticmethod
+    async def get_volunteers_with_users_async(volunteer_id: int = None, event_id: int = None, user_id: int = None, status: str = None, skip: int = 0, limit: int = 100) -> list[tuple[Volunteer, User]]:
+        """Async variant of ``get_volunteers_with_users``."""
+        query = VolunteerDAO._with_users_query(volunteer_id, event_id, user_id, status, skip, limit)
+        async with AsyncSession(get_async_engine()) as session:
+            return (await session.exec(query)).all()
+
+    @staticmethod
+    def _with_users_query(volunteer_id, event_id, user_id, status, skip, limit):
+        query = select(Volunteer, User).join(User, Volunteer.user_id == User.id)
+
+        if volunteer_id is not None:
+            query = query.where(Volunteer.id == volunteer_id)
+
+        if event_id is not None:
+            query = query.where(Volunteer.event_id == event_id)
+
+        if user_id is not None:
+            query = query.where(Volunteer.user_id == user_id)
+
+        if status is not None:
+            query = query.where(Volunteer.status == status)
+
+        return query.order_by(Volunteer.id).offset(skip).limit(limit)
+
     @staticmethod
     def get_active_volunteers(event_id: int = None, skip: int = 0, limit: int = 100) -> list[Volunteer]:
         """Retrieve all active volunteers. Optionally filter by event_id."""
@@ -100,18 +169,21 @@ class VolunteerDAO:
         if event_id is not None:
             query = query.where(Volunteer.event_id == event_id)
 
-        with Session(engine) as session:
+        with session_scope() as session:
             return session.exec(query.offset(skip).limit(limit)).all()
 
     @staticmethod
     def update_volunteer(volunteer_update: Volunteer) -> Volunteer | None:
         """Update a volunteer by ID, handling database errors safely."""
-        with Session(engine) as session:
+        with session_scope() as session:
             try:
                 # Fetch the existing record first
                 existing = session.get(Volunteer, volunteer_update.id)
                 if not existing:
                     return None  # Volunteer not found; do not insert new row
+                previous_user_id, was_active = existing.user_id, existing.status == "active"
+                previous_event_id = existing.event_id
+                mark_triage_stale(session, existing.event_id)
 
                 # Copy updated fields from input object
                 # Only update fields that were explicitly set and are not None
@@ -126,15 +198,19 @@ class VolunteerDAO:
                 if existing.status == "completed" and existing.completion_time is None:
                     existing.completion_time = datetime.now()
 
-                # Always flush before refreshing user status so the changes are visible
                 session.flush()
+                record_change(session, "volunteer", "updated", existing.id)
+                if existing.event_id != previous_event_id:
+                    EventDAO.touch_events(session, previous_event_id)
 
-                # Recompute the linked user's status based on remaining active assignments
-                if existing.user_id:
-                    VolunteerDAO.refresh_user_status(existing.user_id, session)
+                # Move the assignment count if the status or the linked user changed
+                deltas = defaultdict(int)
+                deltas[previous_user_id] -= was_active
+                deltas[existing.user_id] += existing.status == "active"
+                VolunteerDAO.adjust_active_assignments(deltas, session)
 
                 # Commit changes to database
-                session.commit()
+                commit(session)
                 session.refresh(existing)
                 return existing
 
@@ -157,7 +233,7 @@ class VolunteerDAO:
         Also updates the linked user's `status` to 'available' when they have
         no other active assignments.
         """
-        with Session(engine) as session:
+        with session_scope() as session:
             volunteer = session.get(Volunteer, volunteer_id)
             if not volunteer:
                 return False
@@ -165,6 +241,7 @@ class VolunteerDAO:
             # If already completed, nothing to change
             if volunteer.status == "completed":
                 return True
+            was_active = volunteer.status == "active"
 
             # Mark completed and set completion_time
             volunteer.status = "completed"
@@ -172,14 +249,14 @@ class VolunteerDAO:
                 volunteer.completion_time = datetime.now()
             session.add(volunteer)
 
-            # Flush the change so queries see the volunteer as completed
             session.flush()
+            record_change(session, "volunteer", "updated", volunteer_id)
 
-            # Recompute and set the user's status based on active assignments
-            if volunteer.user_id:
-                VolunteerDAO.refresh_user_status(volunteer.user_id, session)
+            # Release the user (back to available once nothing else is active)
+            if was_active:
+                VolunteerDAO.adjust_active_assignments({volunteer.user_id: -1}, session)
 
-            session.commit()
+            commit(session)
             return True
 
     @staticmethod
@@ -189,39 +266,50 @@ class VolunteerDAO:
         Warning: This permanently removes the volunteer record from the database.
         Consider using complete_volunteer() instead to preserve audit history.
         """
-        with Session(engine) as session:
+        with session_scope() as session:
             volunteer = session.get(Volunteer, volunteer_id)
             if not volunteer:
                 return False
             session.delete(volunteer)
-            session.commit()
+            record_change(session, "volunteer", "deleted", volunteer_id)
+            mark_triage_stale(session, volunteer.event_id)
+            EventDAO.touch_events(session, volunteer.event_id)
+            if volunteer.status == "active":
+                VolunteerDAO.adjust_active_assignments({volunteer.user_id: -1}, session)
+            commit(session)
             return True
 
     @staticmethod
     def complete_volunteers_for_event(event_id: int) -> int:
         """Mark all volunteers for an event as completed and set completion_time.
 
-        Returns the number of rows updated.
+        Runs as set-based UPDATE ... RETURNING statements plus one counter
+        adjustment per distinct decrement, so the cost in round trips does
+        not grow with the number of volunteers. Returns the number of rows updated.
         """
-        with Session(engine) as session:
-            # Fetch volunteers for event that are not already completed
-            query = select(Volunteer).where(Volunteer.event_id == event_id)
-            volunteers = session.exec(query).all()
+        with session_scope() as session:
             now = datetime.now()
-            updated = 0
-            for v in volunteers:
-                if v.status != "completed":
-                    v.status = "completed"
-                    v.completion_time = now
-                    session.add(v)
-                    updated += 1
-
-                    # For linked users, recompute status after this change
-                    if v.user_id:
-                        # Flush the change visibility then recompute
-                        session.flush()
-                        VolunteerDAO.refresh_user_status(v.user_id, session)
-
-            if updated > 0:
-                session.commit()
-            return updated
+            # Active rows first, so their users' counters can be decremented
+            completed_active = session.execute(
+                update(Volunteer)
+                .where(Volunteer.event_id == event_id, Volunteer.status == "active")
+                .values(status="completed", completion_time=now)
+                .returning(Volunteer.id, Volunteer.user_id)
+            ).all()
+            completed_other = session.execute(
+                update(Volunteer)
+                .where(Volunteer.event_id == event_id, Volunteer.status != "completed")
+                .values(status="completed", completion_time=now)
+                .returning(Volunteer.id)
+            ).all()
+            if not completed_active and not completed_other:
+                return 0
+
+            for volunteer_id, *_ in (*completed_active, *completed_other):
+                record_change(session, "volunteer", "updated", volunteer_id)
+            deltas = defaultdict(int)
+            for _, user_id in completed_active:
+                deltas[user_id] -= 1
+            VolunteerDAO.adjust_active_assignments(deltas, session)
+            commit(session)
+            return len(completed_active) + len(completed_other)
@@ -1,15 +1,68 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
 from .models import *
 from .core.config import settings    
+from .core.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool, pool_status
+
+def engine_options(url: str, asynchronous: bool = False) -> dict:
+    """Pool arguments for ``create_engine``/``create_async_engine`` from settings.
+
+    SQLite keeps SQLAlchemy's own pool choice; the sizing settings only apply
+    to server databases.
+    """
+    options = {"echo": settings.DB_LOGGING_ENABLED}
+    if url.startswith("sqlite"):
+        options["pool_pre_ping"] = True
+        return options
+    if settings.DB_PGBOUNCER_MODE:
+        # PgBouncer owns pooling; prepared statements do not survive transaction pooling
+        options["poolclass"] = NullPool
+        if asynchronous:
+            options["connect_args"] = {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        return options
+    options.update(
+        poolclass=InstrumentedAsyncQueuePool if asynchronous else InstrumentedQueuePool,
+        pool_pre_ping=True,
+        pool_size=settings.DB_ASYNC_POOL_SIZE if asynchronous else settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_ASYNC_MAX_OVERFLOW if asynchronous else settings.DB_MAX_OVERFLOW,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    )
+    return options
 
 # Create engine
 engine = create_engine(
     settings.database_url_computed,
-    echo=settings.DB_LOGGING_ENABLED,
-    pool_pre_ping=True,
+    **engine_options(settings.database_url_computed),
 )
 
+# Asyncio engine for the non-blocking read paths (asyncpg / aiosqlite).
+# Created on first use so the async driver is only imported when needed.
+_async_engine: AsyncEngine | None = None
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.async_database_url_computed,
+            **engine_options(settings.async_database_url_computed, asynchronous=True),
+        )
+    return _async_engine
+
+async def dispose_async_engine():
+    """Close pooled async connections (called on application shutdown)."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
 def create_db_and_tables():
     SQLModel.metadata.create_all(engine)
 
@@ -21,16 +74,75 @@ def drop_db_and_tables():
     """
     SQLModel.metadata.drop_all(engine)
 
-def get_session():
+# Request-scoped unit of work: set by UnitOfWorkMiddleware for the duration of
+# a request so every DAO call shares one session, one connection and one commit.
+_unit_of_work: ContextVar[Session | None] = ContextVar("unit_of_work", default=None)
+
+@contextmanager
+def unit_of_work() -> Iterator[Session]:
+    """Make a fresh session the current unit of work until the block exits.
+
+    The owner decides whether to commit or roll back; the session is closed
+    on exit either way.
+    """
+    session = Session(engine)
+    token = _unit_of_work.set(session)
+    try:
+        yield session
+    finally:
+        _unit_of_work.reset(token)
+        session.close()
+
+@contextmanager
+def session_scope(independent: bool = False) -> Iterator[Session]:
+    """Yield the current unit-of-work session, or a short-lived session outside one.
+
+    Pass ``independent=True`` for work that must own its transaction (e.g.
+    chunked bulk writes) even while a request is in progress.
+    """
+    session = None if independent else _unit_of_work.get()
+    if session is not None:
+        yield session
+        return
     with Session(engine) as session:
         yield session
 
+def commit(session: Session) -> None:
+    """Commit ``session``; inside a unit of work only flush, as the owner commits once at the end."""
+    if session is _unit_of_work.get():
+        session.flush()
+    else:
+        session.commit()
+
+def get_session():
+    with session_scope() as session:
+        yield session
+
+async def get_async_session():
+    async with AsyncSession(get_async_engine()) as session:
+        yield session
+
 # Health check
 def check_database_health():
     try:
-        with Session(engine) as session:
+        with session_scope() as session:
             session.exec(text("SELECT 1"))
         return True
     except Exception:
         return False
-    
\ No newline at end of file
+
+def get_pool_stats() -> dict:
+    """Live pool statistics for both engines (``async`` is None until first used)."""
+    return {
+        "pgbouncer_mode": settings.DB_PGBOUNCER_MODE,
+        "sync": pool_status(engine.pool),
+        "async": pool_status(_async_engine.pool) if _async_engine is not None else None,
+    }
+
+async def check_database_health_async():
+    try:
+        async with AsyncSession(get_async_engine()) as session:
+            await session.exec(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
@@ -4,4 +4,9 @@ from .location_logic import LocationLogic as LocationLogic
 from .resource_logic import ResourceLogic as ResourceLogic
 from .volunteer_logic import VolunteerLogic as VolunteerLogic
 from .ingestion_logic import IngestionLogic as IngestionLogic
-from .stats_logic import StatsLogic as StatsLogic
\ No newline at end of file
+from .stats_logic import StatsLogic as StatsLogic
+from .sync_logic import SyncLogic as SyncLogic
+from .dashboard_logic import DashboardLogic as DashboardLogic
+from .matching_logic import MatchingLogic as MatchingLogic
+from .dispatch_logic import DispatchLogic as DispatchLogic
+from .triage_logic import TriageLogic as TriageLogic
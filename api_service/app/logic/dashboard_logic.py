@@ -0,0 +1,53 @@
+from domain.schemas import ResourceAvailableResponse, ResourceNeededResponse, UserResponse
+from api_service.app.core.cache import TTLCache
+from api_service.app.core.config import settings
+from api_service.app.core.responses import row_payload
+from api_service.app.data_access import DashboardDAO
+from .event_logic import EventLogic
+from .volunteer_logic import VolunteerLogic
+
+SECTIONS = ("events", "volunteers", "users", "stats", "resources_needed", "resources_available")
+
+
+class DashboardLogic:
+    # Keyed by (role, sections, limit): every dashboard of the same role polling
+    # the same view shares one read and one serialization per TTL window.
+    cache = TTLCache(maxsize=64, ttl=settings.DASHBOARD_CACHE_TTL_SECONDS)
+
+    @staticmethod
+    def get_snapshot(role: str, sections: set[str], limit: int) -> dict:
+        """Retrieve the requested sections as plain response data, loaded at most once per cache TTL."""
+        key = (role, frozenset(sections), limit)
+        return DashboardLogic.cache.get_or_load(key, lambda: DashboardLogic._load(sections, limit))
+
+    @staticmethod
+    def select_fields(snapshot: dict, fields: dict[str, set[str]]) -> dict:
+        """Keep only the requested top-level fields of each section named in ``fields``."""
+        selected = {}
+        for name, data in snapshot.items():
+            wanted = fields.get(name)
+            if not wanted:
+                selected[name] = data
+            elif isinstance(data, list):
+                selected[name] = [{key: row[key] for key in wanted if key in row} for row in data]
+            else:
+                selected[name] = {key: data[key] for key in wanted if key in data}
+        return selected
+
+    @staticmethod
+    def _load(sections: set[str], limit: int) -> dict:
+        rows = DashboardDAO.get_snapshot(sections, limit)
+        builders = {
+            "events": lambda row: EventLogic.event_payload(*row),
+            "volunteers": lambda row: VolunteerLogic.volunteer_payload(*row),
+            "users": lambda row: row_payload(row, UserResponse),
+            "resources_needed": lambda row: row_payload(row, ResourceNeededResponse),
+            "resources_available": lambda row: row_payload(row, ResourceAvailableResponse),
+        }
+        snapshot = {
+            name: [builders[name](row) for row in section]
+            for name, section in rows.items() if name != "stats"
+        }
+        if "stats" in rows:
+            snapshot["stats"] = rows["stats"]
+        return snapshot
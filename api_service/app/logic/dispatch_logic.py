@@ -0,0 +1,164 @@
+from collections import defaultdict
+
+import numpy as np
+
+from api_service.app.core.cache import TTLCache
+from api_service.app.core.config import settings
+from api_service.app.core.geo import EARTH_RADIUS_KM, haversine_km
+from api_service.app.data_access import DispatchDAO
+from .matching_logic import unit_vectors
+from .volunteer_logic import VolunteerLogic
+
+
+class DispatchLogic:
+    # Features of every dispatchable user, loaded at most once per TTL and
+    # dropped after each bulk assignment, so ranking an event only runs the
+    # vectorized scoring.
+    cache = TTLCache(maxsize=1, ttl=settings.DISPATCH_FEATURES_TTL_SECONDS)
+
+    @staticmethod
+    def rank_candidates(event_id: int, limit: int, weights: dict[str, float] | None = None) -> list[dict] | None:
+        """Rank the users best placed to volunteer at an event, best first; None if the event does not exist.
+
+        ``weights`` may override any of the ``distance``, ``workload`` and
+        ``resources`` weights from settings. Users already active at the event
+        are left out.
+        """
+        context = DispatchDAO.get_event_context(event_id)
+        if context is None:
+            return None
+        (priority, status, latitude, longitude), needed_types, assigned = context
+        if status == "completed":
+            raise ValueError(f"Event with id {event_id} is completed")
+
+        features = DispatchLogic.cache.get_or_load("features", DispatchLogic._load_features)
+        if not len(features["user_ids"]):
+            return []
+        scores = score_users(features, priority, latitude, longitude, needed_types,
+                             {**default_weights(), **(weights or {})})
+        excluded = [features["position"][user_id] for user_id in assigned if user_id in features["position"]]
+        scores[excluded] = -np.inf
+
+        top = top_k(scores, features["user_ids"], limit)
+        candidates = []
+        for i in top.tolist():
+            located = features["located"][i]
+            distance = haversine_km(latitude, longitude, *features["coordinates"][i]) if located else None
+            candidates.append({
+                "user_id": int(features["user_ids"][i]),
+                "name": features["names"][i],
+                "score": round(float(scores[i]), 4),
+                "distance_km": round(distance, 3) if distance is not None else None,
+                "active_assignments": int(features["active"][i]),
+                "resource_types": [t for t in features["types_by_user"].get(i, ()) if t in needed_types],
+            })
+        return candidates
+
+    @staticmethod
+    def assign(event_id: int, user_ids: list[int]) -> list[dict] | None:
+        """Create active volunteer rows at an event for all ``user_ids`` in one transaction; None if the event does not exist.
+
+        Nothing is created if any user is not a dispatchable SUV user or is
+        already active at the event.
+        """
+        context = DispatchDAO.get_event_context(event_id)
+        if context is None:
+            return None
+        (_, status, _, _), _, assigned = context
+        if status == "completed":
+            raise ValueError(f"Event with id {event_id} is completed")
+
+        user_ids = list(dict.fromkeys(user_ids))
+        already = [user_id for user_id in user_ids if user_id in assigned]
+        if already:
+            raise ValueError(f"Users already active at event {event_id}: {', '.join(map(str, already))}")
+        dispatchable = DispatchDAO.get_dispatchable_users(user_ids)
+        rejected = [user_id for user_id in user_ids if user_id not in dispatchable]
+        if rejected:
+            raise ValueError(f"Users cannot be dispatched: {', '.join(map(str, rejected))}")
+
+        rows = DispatchDAO.create_volunteers(event_id, user_ids)
+        # Workloads and locations changed; the next ranking reloads them
+        DispatchLogic.cache.clear()
+        return [VolunteerLogic.volunteer_payload(volunteer, user) for volunteer, user in rows]
+
+    @staticmethod
+    def _load_features() -> dict:
+        return build_features(*DispatchDAO.get_user_features())
+
+
+def build_features(users: list[tuple], resource_types: list[tuple]) -> dict:
+    """Arrange DispatchDAO.get_user_features rows as the arrays score_users works on."""
+    coordinates = [(row[3], row[4]) if row[3] is not None and row[4] is not None else None for row in users]
+    located = np.array([point is not None for point in coordinates], dtype=bool)
+    position = {row[0]: i for i, row in enumerate(users)}
+
+    holders: dict[str, list[int]] = defaultdict(list)
+    types_by_user: dict[int, list[str]] = defaultdict(list)
+    for user_id, resource_type in resource_types:
+        i = position.get(user_id)
+        if i is not None:
+            holders[resource_type].append(i)
+            types_by_user[i].append(resource_type)
+
+    return {
+        "user_ids": np.array([row[0] for row in users], dtype=np.int64),
+        "names": [row[1] for row in users],
+        "active": np.array([row[2] or 0 for row in users], dtype=np.float64),
+        "coordinates": coordinates,
+        "located": located,
+        "xyz": unit_vectors(np.array([point[0] if point else 0.0 for point in coordinates], dtype=np.float64),
+                            np.array([point[1] if point else 0.0 for point in coordinates], dtype=np.float64)),
+        "position": position,
+        "holders": {resource_type: np.array(indices, dtype=np.int64) for resource_type, indices in holders.items()},
+        "types_by_user": dict(types_by_user),
+    }
+
+
+def default_weights() -> dict[str, float]:
+    return {
+        "distance": settings.DISPATCH_WEIGHT_DISTANCE,
+        "workload": settings.DISPATCH_WEIGHT_WORKLOAD,
+        "resources": settings.DISPATCH_WEIGHT_RESOURCES,
+    }
+
+
+def score_users(features: dict, priority: int, latitude: float, longitude: float,
+                needed_types: list[str], weights: dict[str, float]) -> np.ndarray:
+    """Score every user for an event; higher is better.
+
+    score = distance weight * urgency * scale / (distance + scale)
+            + workload weight / (1 + active_assignments)
+            + resources weight * share of the event's needed resource types the user has registered
+
+    urgency runs from 2 for priority 1 down to 1 for priority 5, so
+    proximity counts for more the more critical the event. Users whose
+    location is unknown are taken to be DISPATCH_DISTANCE_SCALE_KM away.
+    """
+    scale_km = settings.DISPATCH_DISTANCE_SCALE_KM
+    event_xyz = unit_vectors(np.array([latitude]), np.array([longitude]))[0]
+    # Chord distance ranks like great-circle distance and is within 20 m of it up to 250 km
+    distance = EARTH_RADIUS_KM * np.sqrt(np.maximum(2.0 - 2.0 * (features["xyz"] @ event_xyz), 0.0))
+    distance[~features["located"]] = scale_km
+
+    urgency = 1.0 + (5 - priority) / 4.0
+    scores = (weights["distance"] * urgency) * scale_km / (distance + scale_km)
+    scores += weights["workload"] / (1.0 + features["active"])
+    if needed_types:
+        coverage = np.zeros(len(scores))
+        for resource_type in needed_types:
+            holders = features["holders"].get(resource_type)
+            if holders is not None:
+                coverage[holders] += 1.0
+        scores += weights["resources"] * coverage / len(needed_types)
+    return scores
+
+
+def top_k(scores: np.ndarray, user_ids: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest finite scores, best first, ties broken by user id."""
+    eligible = np.flatnonzero(np.isfinite(scores))
+    if k < len(eligible):
+        # Keep everything tied with the k-th best so the cut below is by user id
+        threshold = np.partition(scores[eligible], len(eligible) - k)[len(eligible) - k]
+        eligible = eligible[scores[eligible] >= threshold]
+    return eligible[np.lexsort((user_ids[eligible], -scores[eligible]))][:k]
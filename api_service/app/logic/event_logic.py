@@ -1,9 +1,9 @@
 from datetime import datetime, timezone
+from api_service.app.core.geo import haversine_km
 from domain import EventCreate, EventResponse, EventUpdate, LocationResponse
 from api_service.app.data_access import EventDAO, VolunteerDAO
 from .location_logic import LocationLogic
-from .volunteer_logic import VolunteerLogic
-from ..models import Event
+from ..models import Event, Location
 
 
 class EventLogic:
@@ -39,34 +39,81 @@ class EventLogic:
         return validated_event
 
     def get_event(event_id: int) -> EventResponse | None:
-        response_event : Event= EventDAO.get_event(event_id)
-        if not response_event:
+        row = EventDAO.get_event_with_details(event_id)
+        if not row:
             return None
-        
-        location = None
-        # Load the associated location if it exists
-        if response_event.location_id:
-            location = LocationLogic.get_location(response_event.location_id) 
-        if not location:
+        return EventLogic.build_event_response(*row)
+
+    async def get_event_async(event_id: int) -> dict | None:
+        """Like ``get_event``, but returns the unvalidated payload (see ``event_payload``)."""
+        row = await EventDAO.get_event_with_details_async(event_id)
+        if not row:
             return None
-        
-        # Compute volunteers count for the event
-        volunteers_count = len(VolunteerLogic.get_volunteers(event_id=event_id, status="active"))
-
-        # Validate the event including nested location
-        return EventResponse.model_validate({
-            **response_event.model_dump(),  # Event fields
-            "location": location.model_dump(),
-            "volunteers_count": volunteers_count
-        })
+        return EventLogic.event_payload(*row)
 
     def get_events(skip: int, limit: int, priority: int | None = None, status: str | None = None) -> list[EventResponse]:
-        events = EventDAO.get_events(skip, limit, priority, status)
-        result: list[EventResponse] = []
-        for event in events:
-            result.append(EventLogic.get_event(event.id))
+        rows = EventDAO.get_events_with_details(skip, limit, priority, status)
+        return [EventLogic.build_event_response(*row) for row in rows]
+
+    async def get_events_async(skip: int, limit: int, priority: int | None = None, status: str | None = None) -> list[dict]:
+        rows = await EventDAO.get_events_with_details_async(skip, limit, priority, status)
+        return [EventLogic.event_payload(*row) for row in rows]
+
+    def get_events_in_bbox(min_lat: float, min_lon: float, max_lat: float, max_lon: float, skip: int, limit: int,
+                           priority: int | None = None, status: str | None = None) -> list[EventResponse]:
+        rows = EventDAO.get_events_with_details(skip, limit, priority, status, bbox=(min_lat, min_lon, max_lat, max_lon))
+        return [EventLogic.build_event_response(*row) for row in rows]
+
+    async def get_events_in_bbox_async(min_lat: float, min_lon: float, max_lat: float, max_lon: float, skip: int, limit: int,
+                                       priority: int | None = None, status: str | None = None) -> list[dict]:
+        rows = await EventDAO.get_events_with_details_async(skip, limit, priority, status, bbox=(min_lat, min_lon, max_lat, max_lon))
+        return [EventLogic.event_payload(*row) for row in rows]
 
-        return result
+    def get_events_within_radius(latitude: float, longitude: float, radius_km: float, limit: int,
+                                 priority: int | None = None, status: str | None = None) -> list[EventResponse]:
+        """Return events within ``radius_km`` of a point, nearest first."""
+        rows = EventDAO.get_events_nearby(latitude, longitude, radius_km, limit, priority, status)
+        return [EventLogic.build_event_response(*row) for row in EventLogic._nearest(rows, latitude, longitude, radius_km, limit)]
+
+    async def get_events_within_radius_async(latitude: float, longitude: float, radius_km: float, limit: int,
+                                             priority: int | None = None, status: str | None = None) -> list[dict]:
+        rows = await EventDAO.get_events_nearby_async(latitude, longitude, radius_km, limit, priority, status)
+        return [EventLogic.event_payload(*row) for row in EventLogic._nearest(rows, latitude, longitude, radius_km, limit)]
+
+    @staticmethod
+    def _nearest(rows, latitude: float, longitude: float, radius_km: float, limit: int) -> list[tuple[Event, Location, int]]:
+        """Keep the nearby candidates inside the radius, nearest first."""
+        nearby = []
+        for row in rows:
+            location = row[1]
+            distance = haversine_km(latitude, longitude, location.latitude, location.longitude)
+            if distance <= radius_km:
+                nearby.append((distance, row))
+        nearby.sort(key=lambda item: item[0])
+        return [row for _, row in nearby[:limit]]
+
+    @staticmethod
+    def build_event_response(event: Event, location: Location, volunteers_count: int) -> EventResponse:
+        """Assemble an EventResponse from a joined (event, location, count) row."""
+        return EventResponse.model_validate(EventLogic.event_payload(event, location, volunteers_count))
+
+    @staticmethod
+    def event_payload(event: Event, location: Location, volunteers_count: int) -> dict:
+        """EventResponse data as a plain dict, built from a trusted joined row.
+
+        Read paths render this directly with orjson; building the dict costs a
+        fraction of validating an EventResponse and letting FastAPI re-validate it.
+        """
+        return {
+            "id": event.id,
+            "description": event.description,
+            "priority": event.priority,
+            "status": event.status,
+            "create_time": event.create_time,
+            "modified_time": event.modified_time,
+            "location": LocationLogic.location_payload(location),
+            "volunteers_count": volunteers_count,
+        }
 
     def update_event(event_id, event_update: EventUpdate) -> EventResponse | None:
         _event = Event(**event_update.model_dump())
@@ -88,12 +135,7 @@ class EventLogic:
                 # Don't fail the whole update if marking volunteers fails
                 pass
 
-        volunteers_count = len(VolunteerLogic.get_volunteers(event_id=updated_event.id, status="active"))
-        return EventResponse.model_validate({
-            **updated_event.model_dump(),
-            "location": LocationLogic.get_location(updated_event.location_id).model_dump(),
-            "volunteers_count": volunteers_count
-        })
+        return EventLogic.get_event(updated_event.id)
 
     def delete_event(event_id: int):
         return EventDAO.delete_event(event_id)
\ No newline at end of file
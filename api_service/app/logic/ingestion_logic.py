@@ -1,6 +1,13 @@
+from datetime import datetime, timezone
+from pydantic import ValidationError
 from domain import EventCreate, ResourceNeededCreate, LocationCreate
+from domain.schemas import EventIngest, IngestItemResult, BulkIngestResponse
+from api_service.app.core.config import settings
+from api_service.app.data_access import EventDAO
+from api_service.app.models import Event, ResourceNeeded
 from .resource_logic import ResourceLogic
 from .event_logic import EventLogic
+from .location_logic import LocationLogic
 
 class IngestionLogic:
     def ingest_full_event(full_event: dict) -> int:
@@ -25,4 +32,63 @@ class IngestionLogic:
             print(resource_needed_validated)
             ResourceLogic.create_resource_needed(resource_needed_validated)
 
-        return event_validated.id
\ No newline at end of file
+        return event_validated.id
+
+    # Items per transaction; bounds both lock duration and the cost of a failed chunk
+    BULK_CHUNK_SIZE = 500
+
+    def ingest_bulk(items: list) -> BulkIngestResponse:
+        """Ingest many events, each optionally with needed resources.
+
+        Every item is validated before anything is written; invalid items are
+        reported and skipped. Valid items are inserted in chunks of
+        BULK_CHUNK_SIZE, one transaction per chunk. Items may use the
+        single-ingest shape ``{"event": {...}}`` or be the event object itself.
+        """
+        results: list[IngestItemResult] = []
+        valid: list[tuple[int, EventIngest]] = []
+        for index, item in enumerate(items):
+            try:
+                if isinstance(item, dict) and "event" in item:
+                    item = item["event"]
+                event = EventIngest.model_validate(item)
+                if not settings.REVERSE_GEOCODING_ENABLED or not event.location.address:
+                    if event.location.latitude is None or event.location.longitude is None:
+                        raise ValueError("location requires latitude and longitude")
+                valid.append((index, event))
+            except (ValidationError, ValueError) as e:
+                results.append(IngestItemResult(index=index, status="error", error=str(e)))
+
+        for start in range(0, len(valid), IngestionLogic.BULK_CHUNK_SIZE):
+            chunk = valid[start:start + IngestionLogic.BULK_CHUNK_SIZE]
+            try:
+                event_ids = EventDAO.create_events_bulk([IngestionLogic._to_rows(event) for _, event in chunk])
+                results.extend(
+                    IngestItemResult(index=index, status="created", event_id=event_id)
+                    for (index, _), event_id in zip(chunk, event_ids)
+                )
+            except Exception as e:
+                results.extend(
+                    IngestItemResult(index=index, status="error", error=f"Chunk rolled back: {e}")
+                    for index, _ in chunk
+                )
+
+        results.sort(key=lambda result: result.index)
+        created = sum(1 for result in results if result.status == "created")
+        return BulkIngestResponse(created=created, failed=len(results) - created, results=results)
+
+    @staticmethod
+    def _to_rows(event: EventIngest):
+        if settings.REVERSE_GEOCODING_ENABLED and event.location.address:
+            location = LocationLogic.enhance_location(event.location)
+        else:
+            location = LocationLogic.build_location(event.location)
+        now = datetime.now(timezone.utc)
+        new_event = Event(
+            description=event.description,
+            priority=event.priority,
+            status=event.status,
+            create_time=now,
+            modified_time=now)
+        resources = [ResourceNeeded(**resource.model_dump()) for resource in event.resources_needed]
+        return location, new_event, resources
@@ -1,6 +1,6 @@
 from api_service.app.models import Location
 from api_service.app.data_access import LocationDAO
-from api_service.app.clients import OSMClient
+from api_service.app.clients import GeocodingCache
 from domain.schemas import LocationCreate, LocationResponse, LocationUpdate, LocationAddress
 from api_service.app.core.config import settings
 
@@ -24,22 +24,26 @@ class LocationLogic:
             _location = LocationLogic.enhance_location(location)
             response_location = LocationDAO.create_location(_location)
         else:
-            # When reverse geocoding is disabled, address may be None.
-            street = location.address.street if location.address else None
-            city = location.address.city if location.address else None
-            postcode = location.address.postcode if location.address else None
-            country = location.address.country if location.address else None
-            result = Location(
-                street=street,
-                city=city,
-                postcode=postcode,
-                country=country,
-                latitude=location.latitude,
-                longitude=location.longitude
-            )
-            response_location = LocationDAO.create_location(result)
+            response_location = LocationDAO.create_location(LocationLogic.build_location(location))
         return LocationLogic.validate_location_response(response_location)
 
+    @staticmethod
+    def build_location(location: LocationCreate) -> Location:
+        """Map a LocationCreate onto a Location row without any geocoding."""
+        # When reverse geocoding is disabled, address may be None.
+        street = location.address.street if location.address else None
+        city = location.address.city if location.address else None
+        postcode = location.address.postcode if location.address else None
+        country = location.address.country if location.address else None
+        return Location(
+            street=street,
+            city=city,
+            postcode=postcode,
+            country=country,
+            latitude=location.latitude,
+            longitude=location.longitude
+        )
+
     def get_location(location_id: int) -> LocationResponse | None:
         response_location = LocationDAO.get_location(location_id)
         if response_location:
@@ -52,14 +56,22 @@ class LocationLogic:
             return LocationLogic.validate_location_response(response_location)
         return None
 
-    def get_locations() -> list[LocationResponse]:
-        location_list = LocationDAO.get_locations()
+    def get_locations(after_id: int | None = None, limit: int = 100) -> list[LocationResponse]:
+        location_list = LocationDAO.get_locations(after_id, limit)
         result: list[LocationResponse]= []
         for loc in location_list:
             result.append(LocationLogic.validate_location_response(loc))
 
         return result
 
+    def get_locations_in_bbox(min_lat: float, min_lon: float, max_lat: float, max_lon: float, limit: int = 100) -> list[LocationResponse]:
+        location_list = LocationDAO.get_locations_in_bbox(min_lat, min_lon, max_lat, max_lon, limit)
+        return [LocationLogic.validate_location_response(loc) for loc in location_list]
+
+    def get_locations_within_radius(latitude: float, longitude: float, radius_km: float, limit: int = 100) -> list[LocationResponse]:
+        matches = LocationDAO.get_locations_within_radius(latitude, longitude, radius_km, limit)
+        return [LocationLogic.validate_location_response(loc) for loc, _ in matches]
+
     def update_location(location_update: LocationUpdate) -> LocationResponse | None:
         # address may be None on update
         street = location_update.address.street if location_update.address else None
@@ -83,13 +95,9 @@ class LocationLogic:
     def enhance_location(location: LocationCreate) -> Location:
         # Normalize LocationCreate into a Location object. Address may be None.
         _location = location
-        full_address = None
         if location.address:
             # derive lat/lon from address
             _location.latitude, _location.longitude = LocationLogic.create_location_from_address(location.address)
-            full_address = ", ".join(
-                filter(None, [location.address.street, location.address.city, location.address.postcode, location.address.country])
-            )
         elif location.latitude is not None and location.longitude is not None:
             # attempt to create an address from coordinates; allowed to return None fields
             try:
@@ -97,10 +105,6 @@ class LocationLogic:
             except NotImplementedError:
                 addr = None
             _location.address = addr
-            if addr:
-                full_address = ", ".join(
-                    filter(None, [addr.street, addr.city, addr.postcode, addr.country])
-                )
 
         # Safe extraction of address fields (may be None)
         street = _location.address.street if _location.address else None
@@ -114,11 +118,25 @@ class LocationLogic:
             street=street,
             postcode=postcode,
             longitude=_location.longitude,
-            latitude=_location.latitude,
-            full_address=full_address
+            latitude=_location.latitude
         )
         return result
     
+    @staticmethod
+    def location_payload(location: Location) -> dict:
+        """LocationResponse data as a plain dict, built from a trusted row without validation."""
+        return {
+            "id": location.id,
+            "address": {
+                "street": location.street,
+                "city": location.city,
+                "postcode": location.postcode,
+                "country": location.country,
+            },
+            "latitude": location.latitude,
+            "longitude": location.longitude,
+        }
+
     @staticmethod
     def validate_location_response(location: Location) -> LocationResponse:
         validated_address = LocationAddress(
@@ -139,9 +157,9 @@ class LocationLogic:
         full_address = ", ".join(
             filter(None, [address.street, address.city, address.postcode, address.country])
         )
-        lat, lon = OSMClient.get_coordinates_from_address(full_address)
-        if lat is not None and lon is not None:
-            return [lat, lon]
+        coordinates = GeocodingCache.get_coordinates(full_address)
+        if coordinates:
+            return list(coordinates)
         return [0.0, 0.0]
 
     @staticmethod
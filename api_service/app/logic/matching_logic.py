@@ -0,0 +1,225 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+
+from api_service.app.core.config import settings
+from api_service.app.core.geo import EARTH_RADIUS_KM, haversine_km
+from api_service.app.data_access import MatchingDAO
+
+# Need x offer pairs scored at once; bounds each float32 score matrix to ~16 MB
+SCORE_CHUNK_PAIRS = 4_000_000
+# Weight of each need's private "no match" column. It keeps a full matching
+# possible while losing to every real candidate: eligible pairs score at least
+# the urgency of a priority-5 need, 0.2.
+NO_MATCH_WEIGHT = 1e-6
+WASTE_PENALTY = 0.5
+
+
+class MatchingLogic:
+    @staticmethod
+    def propose_matches(event_id: int | None = None, resource_type: str | None = None) -> list[dict]:
+        """Propose unallocated offers for the open needs, highest scoring first.
+
+        Every offer goes to at most one need. A need whose remaining quantity is
+        larger than the offer it received takes part in further rounds, up to
+        MATCHING_MAX_ROUNDS.
+        """
+        needs = MatchingDAO.get_open_needs(event_ids=[event_id] if event_id is not None else None,
+                                           resource_type=resource_type)
+        if not needs:
+            return []
+        offers = MatchingDAO.get_open_offers(resource_type)
+        return MatchingLogic.match(needs, offers)
+
+    @staticmethod
+    def apply_matches(matches: list[tuple[int, int]]) -> dict:
+        """Allocate the chosen (need_id, resource_id) pairs and mark the needs they cover as fulfilled.
+
+        Pairs whose need is no longer open, or whose offer was allocated since
+        it was proposed, are skipped.
+        """
+        needs = {row[0]: row for row in MatchingDAO.get_open_needs(need_ids=[need_id for need_id, _ in matches])}
+        allocations: dict[int, tuple[int, str]] = {}
+        for need_id, resource_id in matches:
+            need = needs.get(need_id)
+            if need is not None and resource_id not in allocations:
+                allocations[resource_id] = (need[1], need[2])
+        allocated = MatchingDAO.allocate(allocations)
+
+        fulfilled: list[int] = []
+        event_ids = sorted({allocations[resource_id][0] for resource_id in allocated})
+        if event_ids:
+            rows = MatchingDAO.get_open_needs(event_ids=event_ids)
+            remaining = remaining_quantities(rows)
+            fulfilled = [row[0] for row, left in zip(rows, remaining) if left <= 0]
+            MatchingDAO.mark_fulfilled(fulfilled)
+
+        allocated_ids = set(allocated)
+        return {
+            "allocated": sorted(allocated_ids),
+            "skipped": sorted({resource_id for _, resource_id in matches} - allocated_ids),
+            "fulfilled_needs": fulfilled,
+        }
+
+    @staticmethod
+    def match(needs: list[tuple], offers: list[tuple]) -> list[dict]:
+        """Match need rows to offer rows as returned by MatchingDAO (see get_open_needs/get_open_offers)."""
+        if not needs or not offers:
+            return []
+        max_km = settings.MATCHING_MAX_DISTANCE_KM
+        scale_km = settings.MATCHING_DISTANCE_SCALE_KM
+        per_need = settings.MATCHING_CANDIDATES_PER_NEED
+
+        remaining = remaining_quantities(needs).astype(np.float64)
+        need_event = np.array([row[1] for row in needs])
+        urgency = (6.0 - np.array([row[4] for row in needs], dtype=np.float64)) / 5.0
+        need_xyz = unit_vectors(np.array([row[5] for row in needs], dtype=np.float64),
+                                np.array([row[6] for row in needs], dtype=np.float64))
+
+        offer_qty = np.array([row[2] for row in offers], dtype=np.float64)
+        offer_located = np.array([row[3] is not None and row[4] is not None for row in offers])
+        offer_xyz = unit_vectors(np.array([row[3] if located else 0.0 for row, located in zip(offers, offer_located)]),
+                                 np.array([row[4] if located else 0.0 for row, located in zip(offers, offer_located)]))
+
+        types, codes = np.unique([row[2] for row in needs] + [row[1] for row in offers], return_inverse=True)
+        need_type, offer_type = codes[:len(needs)], codes[len(needs):]
+        used = np.zeros(len(offers), dtype=bool)
+
+        proposals = []
+        for _ in range(settings.MATCHING_MAX_ROUNDS):
+            rows, cols, weights = [], [], []
+            for code in range(len(types)):
+                need_idx = np.flatnonzero((need_type == code) & (remaining > 0))
+                offer_idx = np.flatnonzero((offer_type == code) & ~used)
+                if len(need_idx) == 0 or len(offer_idx) == 0:
+                    continue
+                k = min(per_need, len(offer_idx))
+                step = max(1, SCORE_CHUNK_PAIRS // len(offer_idx))
+                for start in range(0, len(need_idx), step):
+                    chunk = need_idx[start:start + step]
+                    scores = score_pairs(urgency[chunk], remaining[chunk], need_event[chunk], need_xyz[chunk],
+                                         offer_qty[offer_idx], offer_xyz[offer_idx], offer_located[offer_idx],
+                                         max_km, scale_km)
+                    if k < len(offer_idx):
+                        top = np.argpartition(scores, len(offer_idx) - k, axis=1)[:, -k:]
+                    else:
+                        top = np.broadcast_to(np.arange(len(offer_idx)), scores.shape)
+                    top_scores = np.take_along_axis(scores, top, axis=1)
+                    keep = np.isfinite(top_scores)
+                    rows.append(np.broadcast_to(chunk[:, None], top.shape)[keep])
+                    cols.append(offer_idx[top[keep]])
+                    weights.append(top_scores[keep])
+            if not any(len(chunk_rows) for chunk_rows in rows):
+                break
+
+            pairs = solve_assignment(np.concatenate(rows), np.concatenate(cols), np.concatenate(weights))
+            for need, offer, score in pairs:
+                remaining[need] -= offer_qty[offer]
+                used[offer] = True
+                distance = None
+                if offer_located[offer]:
+                    distance = haversine_km(needs[need][5], needs[need][6], offers[offer][3], offers[offer][4])
+                proposals.append({
+                    "need_id": needs[need][0],
+                    "event_id": needs[need][1],
+                    "resource_id": offers[offer][0],
+                    "resource_type": offers[offer][1],
+                    "quantity": offers[offer][2],
+                    "distance_km": round(distance, 3) if distance is not None else None,
+                    "score": round(float(score), 4),
+                })
+        proposals.sort(key=lambda proposal: -proposal["score"])
+        return proposals
+
+
+def remaining_quantities(needs: list[tuple]) -> np.ndarray:
+    """Quantity each need still lacks once its (event, type) group's spare allocation is spread in id order."""
+    remaining = np.empty(len(needs), dtype=np.int64)
+    group, spare = None, 0
+    for i, row in enumerate(needs):
+        if (row[1], row[2]) != group:
+            group, spare = (row[1], row[2]), max(int(row[7]), 0)
+        covered = min(spare, row[3])
+        spare -= covered
+        remaining[i] = row[3] - covered
+    return remaining
+
+
+def unit_vectors(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Coordinates in degrees as rows of 3D unit vectors, so distances reduce to dot products."""
+    lat, lon = np.radians(latitudes), np.radians(longitudes)
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+
+def score_pairs(urgency: np.ndarray, remaining: np.ndarray, need_event: np.ndarray, need_xyz: np.ndarray,
+                offer_qty: np.ndarray, offer_xyz: np.ndarray, offer_located: np.ndarray,
+                max_km: float, scale_km: float) -> np.ndarray:
+    """Score every need x offer pair; higher is better and -inf means not eligible.
+
+    score = urgency + share of the remaining quantity covered
+            + scale / (distance + scale) + WASTE_PENALTY * share of the offer used
+
+    Every term is positive or zero and urgency is at least 0.2, so every
+    eligible pair scores above NO_MATCH_WEIGHT.
+
+    The distance term only depends on the need's event, so it is computed once
+    per event and shared by that event's needs. The matrix is built in place
+    in float32 since this is the engine's hot loop.
+    """
+    _, first_need, event_of_need = np.unique(need_event, return_index=True, return_inverse=True)
+    scores = proximity(need_xyz[first_need], offer_xyz, offer_located, max_km, scale_km)[event_of_need]
+
+    # urgency + covered * (1/remaining + WASTE_PENALTY/quantity) is the rest
+    # of the formula rearranged to need few full-matrix passes
+    quantity = offer_qty.astype(np.float32)[None, :]
+    remaining = remaining.astype(np.float32)[:, None]
+    weight = np.add(1.0 / remaining, WASTE_PENALTY / quantity)
+    weight *= np.minimum(quantity, remaining)
+    scores += weight
+    scores += urgency.astype(np.float32)[:, None]
+    return scores
+
+
+def proximity(site_xyz: np.ndarray, offer_xyz: np.ndarray, offer_located: np.ndarray,
+              max_km: float, scale_km: float) -> np.ndarray:
+    """``scale / (distance + scale)`` for every site x offer pair, or -inf beyond ``max_km``.
+
+    Distance is the straight chord through the earth, which is within 20 m of
+    the great-circle distance up to 250 km and needs no trigonometry per pair.
+    Offers without a known location are taken to be ``scale_km`` away.
+    """
+    # |a - b|^2 = 2 - 2 a.b for unit vectors; the subtraction stays in float64
+    squared = site_xyz @ offer_xyz.T
+    squared *= -2.0
+    squared += 2.0
+    np.maximum(squared, 0.0, out=squared)
+    distance = np.sqrt(squared.astype(np.float32))
+    distance *= EARTH_RADIUS_KM
+    distance[:, ~offer_located] = scale_km
+    too_far = distance > max_km
+    distance += scale_km
+    result = np.divide(scale_km, distance, out=distance)
+    result[too_far] = -np.inf
+    return result
+
+
+def solve_assignment(rows: np.ndarray, cols: np.ndarray, weights: np.ndarray) -> list[tuple[int, int, float]]:
+    """Maximum-weight matching over the candidate edges; returns (need, offer, weight) triples.
+
+    Only needs with candidates become rows. Each also gets a private
+    NO_MATCH_WEIGHT column, so the sparse solver always finds a full matching.
+    """
+    need_ids, row_of = np.unique(rows, return_inverse=True)
+    offer_ids, col_of = np.unique(cols, return_inverse=True)
+    n = len(need_ids)
+    graph = csr_matrix(
+        (np.concatenate((weights, np.full(n, NO_MATCH_WEIGHT))),
+         (np.concatenate((row_of, np.arange(n))), np.concatenate((col_of, len(offer_ids) + np.arange(n))))),
+        shape=(n, len(offer_ids) + n),
+    )
+    matched_rows, matched_cols = min_weight_full_bipartite_matching(graph, maximize=True)
+    real = matched_cols < len(offer_ids)
+    matched_rows, matched_cols = matched_rows[real], matched_cols[real]
+    chosen = np.asarray(graph[matched_rows, matched_cols]).ravel()
+    return list(zip(need_ids[matched_rows].tolist(), offer_ids[matched_cols].tolist(), chosen.tolist()))
@@ -17,8 +17,9 @@ class ResourceLogic:
     def get_resource_needed(resource_id: int):
         return ResourceDAO.get_resource_needed(resource_id)
 
-    def get_resources_needed():
-        return ResourceDAO.get_resources_needed()
+    def get_resources_needed(after_id: int | None = None, limit: int = 100, event_id: int | None = None,
+                             resource_type: str | None = None, is_fulfilled: bool | None = None):
+        return ResourceDAO.get_resources_needed(after_id, limit, event_id, resource_type, is_fulfilled)
 
     def update_resource_needed(resource_id: int, resource_data: dict):
         return ResourceDAO.update_resource_needed(resource_id, resource_data)
@@ -46,8 +47,10 @@ class ResourceLogic:
         return ResourceDAO.get_resource_available(resource_id)
 
     @staticmethod
-    def get_resources_available():
-        return ResourceDAO.get_resources_available()
+    def get_resources_available(after_id: int | None = None, limit: int = 100, event_id: int | None = None,
+                                volunteer_id: int | None = None, resource_type: str | None = None,
+                                is_allocated: bool | None = None):
+        return ResourceDAO.get_resources_available(after_id, limit, event_id, volunteer_id, resource_type, is_allocated)
 
     @staticmethod
     def update_resource_available(resource_id: int, resource_data: dict):
@@ -1,10 +1,44 @@
+from datetime import datetime, timedelta, timezone
+
 from domain.schemas import StatsResponse
+from api_service.app.core.cache import TTLCache
+from api_service.app.core.config import settings
 from api_service.app.data_access import StatsDAO
 
 
 class StatsLogic:
+    # One shared entry: every polling dashboard reads the same numbers, and a
+    # single request per TTL window pays for the aggregate query.
+    cache = TTLCache(maxsize=1, ttl=settings.STATS_CACHE_TTL_SECONDS)
+    last_snapshot_at: datetime | None = None
+
+    @staticmethod
     def get_stats() -> StatsResponse:
-        """Retrieve stats via the DAO and return a validated StatsResponse."""
+        """Retrieve live stats, recomputed at most once per cache TTL."""
+        return StatsLogic.cache.get_or_load("live", StatsLogic._refresh)
+
+    @staticmethod
+    def get_stats_at(at: datetime) -> StatsResponse | None:
+        """Retrieve the stats as recorded by the latest snapshot at or before ``at``."""
+        if at.tzinfo is not None:
+            at = at.astimezone(timezone.utc).replace(tzinfo=None)
+        snapshot = StatsDAO.get_snapshot_at(at)
+        if not snapshot:
+            return None
+        return StatsResponse(
+            activeEvents=snapshot.active_events,
+            totalVolunteers=snapshot.total_volunteers,
+            resourcesAvailable=snapshot.resources_available,
+            totalLocations=snapshot.total_locations,
+        )
+
+    @staticmethod
+    def _refresh() -> StatsResponse:
         stats = StatsDAO.get_stats()
+        now = datetime.utcnow()
+        interval = timedelta(seconds=settings.STATS_SNAPSHOT_INTERVAL_SECONDS)
+        if StatsLogic.last_snapshot_at is None or now - StatsLogic.last_snapshot_at >= interval:
+            StatsDAO.save_snapshot(stats, now)
+            StatsLogic.last_snapshot_at = now
         # Validate/convert via domain schema for consistent shape
         return StatsResponse.model_validate(stats)
@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+
+from domain.schemas import ResourceAvailableResponse, ResourceNeededResponse, UserResponse
+from api_service.app.core.config import settings
+from api_service.app.core.responses import row_payload
+from api_service.app.data_access import SyncDAO
+from .event_logic import EventLogic
+from .volunteer_logic import VolunteerLogic
+
+
+class SyncLogic:
+    @staticmethod
+    async def get_changes_async(since: datetime | None) -> dict | None:
+        """Collect everything that changed after the ``since`` cursor (everything when None).
+
+        Rows are matched from ``SYNC_OVERLAP_SECONDS`` before the cursor, so a
+        write that committed after the previous call read past it is still
+        delivered; clients upsert by id, so re-sent rows are harmless. Returns
+        SyncResponse data as a plain dict, or None when the cursor predates the
+        tombstone retention window and the client has to reload from scratch.
+        """
+        # Taken before reading, so the next window starts no later than anything read here
+        cursor = datetime.utcnow()
+        window_start = None
+        if since is not None:
+            if since.tzinfo is not None:
+                since = since.astimezone(timezone.utc).replace(tzinfo=None)
+            if since < cursor - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+                return None
+            window_start = since - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)
+
+        changes = await SyncDAO.get_changes_async(window_start)
+        return {
+            "cursor": cursor,
+            "events": [EventLogic.event_payload(*row) for row in changes["events"]],
+            "volunteers": [VolunteerLogic.volunteer_payload(*row) for row in changes["volunteers"]],
+            "users": [row_payload(user, UserResponse) for user in changes["users"]],
+            "resources_needed": [row_payload(r, ResourceNeededResponse) for r in changes["resources_needed"]],
+            "resources_available": [row_payload(r, ResourceAvailableResponse) for r in changes["resources_available"]],
+            "deleted": [{"entity": t.entity, "id": t.entity_id} for t in changes["deleted"]],
+        }
+
+    @staticmethod
+    def prune_tombstones() -> int:
+        """Drop tombstones no cursor inside the retention window can still need."""
+        return SyncDAO.prune_tombstones(datetime.utcnow() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS))
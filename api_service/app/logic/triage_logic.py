@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from api_service.app.data_access import TriageDAO
+from .event_logic import EventLogic
+
+
+class TriageLogic:
+    @staticmethod
+    async def get_queue_async(limit: int) -> list[dict]:
+        """Retrieve the open events most in need of attention, as EventResponse data plus their current triage score."""
+        rows = await TriageDAO.get_queue_async(limit)
+        offset = TriageDAO.aging_offset(datetime.utcnow())
+        return [
+            {**EventLogic.event_payload(event, location, volunteers), "triage_score": round(event.triage_score + offset, 3)}
+            for event, location, volunteers in rows
+        ]
+
+    @staticmethod
+    def rebuild() -> int:
+        """Recompute every stored triage score; return how many events were scored."""
+        return TriageDAO.refresh_all()
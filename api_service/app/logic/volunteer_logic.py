@@ -1,7 +1,8 @@
 from domain.schemas import VolunteerCreate, VolunteerResponse, VolunteerUpdate, UserResponse
-from ..models import Volunteer
+from ..models import Volunteer, User
 from .user_logic import UserLogic
 from api_service.app.data_access import VolunteerDAO, EventDAO
+from api_service.app.core.responses import row_payload
 
 class VolunteerLogic:
     def create_volunteer(volunteerCreate: VolunteerCreate) -> VolunteerResponse:
@@ -25,45 +26,59 @@ class VolunteerLogic:
         })
 
     def get_volunteer(volunteer_id: int) -> VolunteerResponse | None:
-        response_volunteer = VolunteerDAO.get_volunteer(volunteer_id)
-        if not response_volunteer:
+        rows = VolunteerDAO.get_volunteers_with_users(volunteer_id=volunteer_id, limit=1)
+        if not rows:
             return None
-        
-        # Load the associated user if it exists
-        user : UserResponse= None
-        if response_volunteer.user_id:
-            user = UserLogic.get_user(response_volunteer.user_id) 
-        if not user:
-            return None
-        
-        # Validate the volunteer including nested user
-        return VolunteerResponse.model_validate({
-            **response_volunteer.model_dump(),  # Volunteer fields
-            "user": user
-        })
+        return VolunteerLogic.build_volunteer_response(*rows[0])
 
+    async def get_volunteer_async(volunteer_id: int) -> dict | None:
+        """Like ``get_volunteer``, but returns the unvalidated payload (see ``volunteer_payload``)."""
+        rows = await VolunteerDAO.get_volunteers_with_users_async(volunteer_id=volunteer_id, limit=1)
+        if not rows:
+            return None
+        return VolunteerLogic.volunteer_payload(*rows[0])
 
     def get_volunteers(event_id: int = None, user_id: int = None, status: str = None, skip: int = 0, limit: int = 100) -> list[VolunteerResponse]:
         """Get volunteers with optional filtering by event_id, user_id, and status."""
-        volunteers = VolunteerDAO.get_volunteers(
+        rows = VolunteerDAO.get_volunteers_with_users(
             event_id=event_id,
             user_id=user_id,
             status=status,
             skip=skip,
             limit=limit
         )
-        result: list[VolunteerResponse] = []
-        for volunteer in volunteers:
-            result.append(VolunteerLogic.get_volunteer(volunteer.id))
-        return result
+        return [VolunteerLogic.build_volunteer_response(*row) for row in rows]
+
+    async def get_volunteers_async(event_id: int = None, user_id: int = None, status: str = None, skip: int = 0, limit: int = 100) -> list[dict]:
+        rows = await VolunteerDAO.get_volunteers_with_users_async(
+            event_id=event_id,
+            user_id=user_id,
+            status=status,
+            skip=skip,
+            limit=limit
+        )
+        return [VolunteerLogic.volunteer_payload(*row) for row in rows]
 
     def get_active_volunteers(event_id: int = None, skip: int = 0, limit: int = 100) -> list[VolunteerResponse]:
         """Get all volunteers with status='active'. Optionally filter by event_id."""
-        volunteers = VolunteerDAO.get_active_volunteers(event_id=event_id, skip=skip, limit=limit)
-        result: list[VolunteerResponse] = []
-        for volunteer in volunteers:
-            result.append(VolunteerLogic.get_volunteer(volunteer.id))
-        return result
+        return VolunteerLogic.get_volunteers(event_id=event_id, status="active", skip=skip, limit=limit)
+
+    @staticmethod
+    def build_volunteer_response(volunteer: Volunteer, user: User) -> VolunteerResponse:
+        """Assemble a VolunteerResponse from a joined (volunteer, user) row."""
+        return VolunteerResponse.model_validate(VolunteerLogic.volunteer_payload(volunteer, user))
+
+    @staticmethod
+    def volunteer_payload(volunteer: Volunteer, user: User | None) -> dict:
+        """VolunteerResponse data as a plain dict, built from a trusted joined row without validation."""
+        return {
+            "id": volunteer.id,
+            "user": row_payload(user, UserResponse) if user is not None else None,
+            "event_id": volunteer.event_id,
+            "status": volunteer.status,
+            "create_time": volunteer.create_time,
+            "completion_time": volunteer.completion_time,
+        }
 
     def update_volunteer(volunteer_update: VolunteerUpdate) -> VolunteerResponse | None:
         _volunteer = Volunteer(**volunteer_update.model_dump())
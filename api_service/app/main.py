@@ -1,6 +1,7 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from .db import create_db_and_tables, check_database_health
+from fastapi.responses import ORJSONResponse
+from .db import create_db_and_tables, check_database_health_async, dispose_async_engine, get_pool_stats
 from .routes import (
     auth_router,
     user_router,
@@ -10,15 +11,26 @@ from .routes import (
     resource_available_router,
     volunteer_router,
     stats_router,
+    changes_router,
+    sync_router,
+    dashboard_router,
+    matching_router,
+    dispatch_router,
 )
 from .models import User
 from .core.config import settings
-from .auth.hashing import hash_password
+from .core.unit_of_work import UnitOfWorkMiddleware
+from .core.compression import CompressionMiddleware
+from .core.conditional import NotModified
+from .auth.hashing import hash_password, shutdown_hash_pool, start_hash_pool
+from .auth.role_checker import require_role
 
 # Initialize database
 create_db_and_tables()
 
-app = FastAPI(title="MDay API Service")
+# orjson renders every JSON response; hot read routes also skip response_model
+# re-validation by returning core.responses.trusted_response directly
+app = FastAPI(title="MDay API Service", default_response_class=ORJSONResponse)
 
 # Add CORS middleware before including routers
 origins = [
@@ -56,8 +68,25 @@ app.add_middleware(
     allow_credentials=not allow_all_origins,  # credentials not supported with "*"
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
 )
 
+# One session, connection and commit per request
+app.add_middleware(UnitOfWorkMiddleware)
+
+# Outermost: compress the final body, after the unit of work has committed
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    offload_size=settings.COMPRESSION_OFFLOAD_MIN_SIZE,
+)
+
+@app.exception_handler(NotModified)
+async def not_modified_handler(request: Request, exc: NotModified):
+    return Response(status_code=304, headers=exc.headers)
+
 # Include user API router
 app.include_router(auth_router)
 app.include_router(user_router)
@@ -67,17 +96,35 @@ app.include_router(resource_needed_router)
 app.include_router(resource_available_router)
 app.include_router(volunteer_router)
 app.include_router(stats_router)
+app.include_router(changes_router)
+app.include_router(sync_router)
+app.include_router(dashboard_router)
+app.include_router(matching_router)
+app.include_router(dispatch_router)
 
 # Health check endpoint
 @app.get("/health")
-def health_check():
-    db_ok = check_database_health()
+async def health_check():
+    db_ok = await check_database_health_async()
     return {"database": "ok" if db_ok else "error"}
 
+# Internal: connection pool usage and checkout wait histogram
+@app.get("/health/pool", dependencies=[Depends(require_role(["AUTHORITY"]))])
+def pool_health():
+    return get_pool_stats()
+
+
+@app.on_event("shutdown")
+async def close_async_engine():
+    await dispose_async_engine()
+    shutdown_hash_pool()
+
 
 # Seed an initial administrator account (if configured and missing)
 @app.on_event("startup")
 def seed_admin_user():
+    # Fork the bcrypt workers before any request threads exist
+    start_hash_pool()
     admin_email = settings.ADMIN_EMAIL
     admin_password = settings.ADMIN_PASSWORD
     if not admin_email or not admin_password or admin_email.strip() == "" or admin_password.strip() == "":
@@ -105,3 +152,12 @@ def seed_admin_user():
         print("[startup] Administrator already exists:", admin_email)
         # Likely already exists; keep startup idempotent
         pass
+
+
+# Drop tombstones that no /sync cursor inside the retention window needs
+@app.on_event("startup")
+def prune_sync_tombstones():
+    from api_service.app.logic import SyncLogic
+    pruned = SyncLogic.prune_tombstones()
+    if pruned:
+        print(f"[startup] Pruned {pruned} sync tombstones")
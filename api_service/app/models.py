@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field
+from sqlalchemy import Index
 from datetime import datetime
 from typing import Optional
 
@@ -6,10 +7,11 @@ class Event(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     description: str
     create_time: datetime = Field(default=None)
-    modified_time: datetime = Field(default=None)
-    priority: int
-    status: str
-    location_id: int = Field(default=None, foreign_key="location.id")
+    modified_time: datetime = Field(default=None, index=True, sa_column_kwargs={"onupdate": datetime.utcnow})
+    priority: int = Field(index=True)
+    status: str = Field(index=True)
+    location_id: int = Field(default=None, foreign_key="location.id", index=True)
+    triage_score: Optional[float] = Field(default=None, index=True)  # maintained by TriageDAO; None once completed
 
 class ResourceNeeded(SQLModel, table=True):
     id: int = Field(primary_key=True)
@@ -18,7 +20,8 @@ class ResourceNeeded(SQLModel, table=True):
     description: str
     quantity: int
     is_fulfilled: bool
-    event_id: int = Field(foreign_key="event.id")
+    event_id: int = Field(foreign_key="event.id", index=True)
+    modified_time: datetime = Field(default_factory=datetime.utcnow, index=True, sa_column_kwargs={"onupdate": datetime.utcnow})
 
 class ResourceAvailable(SQLModel, table=True):
     id: int = Field(primary_key=True)
@@ -27,34 +30,85 @@ class ResourceAvailable(SQLModel, table=True):
     quantity: int
     description: str
     status: str
-    volunteer_id: int = Field(foreign_key="volunteer.id")
-    event_id: Optional[int] = Field(default=None, foreign_key="event.id")  # Optional - resource can be assigned to event
+    volunteer_id: int = Field(foreign_key="volunteer.id", index=True)
+    event_id: Optional[int] = Field(default=None, foreign_key="event.id", index=True)  # Optional - resource can be assigned to event
     is_allocated: bool
+    modified_time: datetime = Field(default_factory=datetime.utcnow, index=True, sa_column_kwargs={"onupdate": datetime.utcnow})
 
 class Volunteer(SQLModel, table=True):
+    # (event_id, status) serves event rosters and active counts; (user_id, status)
+    # serves the "does this user have an active assignment" check.
+    __table_args__ = (
+        Index("ix_volunteer_event_id_status", "event_id", "status"),
+        Index("ix_volunteer_user_id_status", "user_id", "status"),
+    )
+
     id: int = Field(primary_key=True) 
     user_id: Optional[int] = Field(default=None, foreign_key="user.id")  # Optional - volunteer can be unassigned      
     event_id: int = Field(default=None, foreign_key="event.id")  # Optional - volunteer can be unassigned
     create_time: datetime = Field(default=None)
     completion_time: Optional[datetime] = Field(default=None)
-    status: str = Field(default="active")
-    
+    status: str = Field(default="active", index=True)
+    modified_time: datetime = Field(default_factory=datetime.utcnow, index=True, sa_column_kwargs={"onupdate": datetime.utcnow})
+
 
 class Location(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    # full_address: Optional[str] = None
+    normalized_address: Optional[str] = None  # maintained by LocationDAO for address de-duplication
     street: Optional[str] = None
     city: Optional[str] = None
     postcode: Optional[str] = None
     country: Optional[str] = None
     latitude: float
     longitude: float
+    geohash: Optional[str] = Field(default=None, index=True)  # maintained by LocationDAO for spatial lookups
+    modified_time: datetime = Field(default_factory=datetime.utcnow, index=True, sa_column_kwargs={"onupdate": datetime.utcnow})
+
+class LocationAddressToken(SQLModel, table=True):
+    """Inverted index from normalized address tokens to the locations containing them."""
+    token: str = Field(primary_key=True)
+    location_id: int = Field(primary_key=True, foreign_key="location.id", index=True)
+
+class GeocodeCacheEntry(SQLModel, table=True):
+    """Persistent geocoding result keyed by normalized address.
+
+    A row with no coordinates is a cached "not found" answer.
+    """
+    address: str = Field(primary_key=True)
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    expires_at: datetime
+
+class CollectionVersion(SQLModel, table=True):
+    """Write counter per entity collection, bumped by every committed change (drives ETags)."""
+    entity: str = Field(primary_key=True)
+    version: int = 0
+    modified_at: datetime
+
+class Tombstone(SQLModel, table=True):
+    """Record of a deleted row, kept so delta sync clients can drop it from their mirror."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    entity: str
+    entity_id: int
+    deleted_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+
+class StatsSnapshot(SQLModel, table=True):
+    """Dashboard stats as they were at ``taken_at`` (UTC)."""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    taken_at: datetime = Field(index=True)
+    active_events: int
+    total_volunteers: int
+    resources_available: int
+    total_locations: int
 
 class User(SQLModel, table=True):
     id: int = Field(primary_key=True)
     name: str
-    email: str
+    email: str = Field(unique=True, index=True)
     phonenumber: str
     password: str
-    status: str = Field(default="available")  # available | assigned | unavailable
-    role: str = Field(default="SUV")  # SUV | VC | AUTHORITY
\ No newline at end of file
+    status: str = Field(default="available", index=True)  # available | assigned | unavailable
+    role: str = Field(default="SUV", index=True)  # SUV | VC | AUTHORITY
+    # Number of this user's volunteer rows with status "active"; drives "assigned"
+    active_assignments: int = Field(default=0)
+    modified_time: datetime = Field(default_factory=datetime.utcnow, index=True, sa_column_kwargs={"onupdate": datetime.utcnow})
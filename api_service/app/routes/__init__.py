@@ -5,4 +5,9 @@ from .resources_needed import router as resource_needed_router
 from .resources_available import router as resource_available_router
 from .volunteers import router as volunteer_router
 from .auth import router as auth_router
-from .stats import router as stats_router
\ No newline at end of file
+from .stats import router as stats_router
+from .changes import router as changes_router
+from .sync import router as sync_router
+from .dashboard import router as dashboard_router
+from .matching import router as matching_router
+from .dispatch import router as dispatch_router
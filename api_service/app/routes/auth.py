@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session, select
+from fastapi.concurrency import run_in_threadpool
 from datetime import timedelta
 
-from api_service.app.db import get_session
 from api_service.app.models import User
-from api_service.app.auth.hashing import hash_password, verify_password
+from api_service.app.auth.hashing import hash_password_async, verify_and_update_password_async
 from api_service.app.auth.jwt_handler import create_access_token, decode_access_token
+from api_service.app.data_access import UserDAO
 from api_service.app.auth.jwt_bearer import JWTBearer
 from api_service.app.logic import UserLogic
 from domain.schemas import UserResponse, UserCreate, UserLogin, UserToken
@@ -14,7 +14,7 @@ from domain.exceptions import UserExistsException
 router = APIRouter(prefix="/auth", tags=["Auth"])
 jwt_bearer = JWTBearer()
 
-def get_current_user(token: str = Depends(jwt_bearer), session: Session = Depends(get_session)) -> User:
+def get_current_user(token: str = Depends(jwt_bearer)) -> User:
     """
     Dependency to get the current authenticated user from JWT token
     """
@@ -26,27 +26,33 @@ def get_current_user(token: str = Depends(jwt_bearer), session: Session = Depend
     if not email:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token payload")
     
-    user = session.exec(select(User).where(User.email == email)).first()
+    user = UserDAO.get_user_by_email_cached(email)
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     
     return user
 
 @router.post("/register", response_model=UserResponse)
-def register_user(user: UserCreate):
-    # Hash password
-    user.password = hash_password(user.password)
+async def register_user(user: UserCreate):
+    # Hash password (in the bcrypt worker pool)
+    user.password = await hash_password_async(user.password)
     # Check if user already exists
     try:
-        return UserLogic.create_user(user)
+        return await run_in_threadpool(UserLogic.create_user, user)
     except UserExistsException as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @router.post("/login", response_model=UserToken)
-def login_user(user_login: UserLogin, session: Session = Depends(get_session)):
-    user = session.exec(select(User).where(User.email == user_login.email)).first()
-    if not user or not verify_password(user_login.password, user.password):
+async def login_user(user_login: UserLogin):
+    user = await run_in_threadpool(UserDAO.get_user_by_email, user_login.email)
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+    valid, new_hash = await verify_and_update_password_async(user_login.password, user.password)
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+    if new_hash:
+        # Stored hash used an outdated cost; upgrade it now that we know the password
+        await run_in_threadpool(UserDAO.update_password_hash, user.id, new_hash)
 
     token = create_access_token({"sub": user.email, "role": user.role}, timedelta(minutes=60))
     return UserToken(access_token=token, token_type="bearer")
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+from api_service.app.auth.role_checker import require_role
+from api_service.app.core.change_feed import change_feed, format_sse
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+# Idle connections get a comment line this often so proxies keep them open
+HEARTBEAT_SECONDS = 15
+
+
+async def _change_stream(request: Request):
+    subscription = change_feed.subscribe()
+    try:
+        # Tell the client how long to wait before reconnecting after a drop
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            change = await subscription.get(timeout=HEARTBEAT_SECONDS)
+            if change is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield format_sse(change)
+    finally:
+        change_feed.unsubscribe(subscription)
+
+
+@router.get(
+    "/stream",
+    summary="Stream data changes",
+    description="Server-Sent Events stream of create/update/delete notifications for events, volunteers, resources and users",
+    dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))]
+)
+async def stream_changes(request: Request):
+    return StreamingResponse(
+        _change_stream(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,39 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from api_service.app.logic import DashboardLogic
+from api_service.app.logic.dashboard_logic import SECTIONS
+from api_service.app.auth.role_checker import require_role
+from api_service.app.core.responses import trusted_response
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+@router.get(
+    "/snapshot",
+    summary="Get a combined dashboard snapshot",
+    description="Events, volunteers, users, stats and resources read in one request from one database snapshot",
+)
+def get_dashboard_snapshot(
+    sections: Optional[str] = Query(None, description=f"Comma-separated sections to include (default: all of {', '.join(SECTIONS)})"),
+    fields: Optional[str] = Query(None, description="Comma-separated section.field pairs to keep, e.g. events.id,events.status"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of rows per list section"),
+    payload: dict = Depends(require_role(["AUTHORITY", "VC"])),
+):
+    requested = set(_split(sections)) if sections else set(SECTIONS)
+    selected: dict[str, set[str]] = {}
+    for pair in _split(fields):
+        section, _, field = pair.partition(".")
+        if not field:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Field '{pair}' must be written as section.field")
+        selected.setdefault(section, set()).add(field)
+    unknown = (requested | selected.keys()) - set(SECTIONS)
+    if unknown:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown sections: {', '.join(sorted(unknown))}")
+
+    snapshot = DashboardLogic.get_snapshot(payload.get("role"), requested, limit)
+    return trusted_response(DashboardLogic.select_fields(snapshot, selected))
+
+
+def _split(value: str | None) -> list[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
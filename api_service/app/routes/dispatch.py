@@ -0,0 +1,53 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from domain.schemas import DispatchAssignRequest, DispatchCandidate, VolunteerResponse
+from api_service.app.logic import DispatchLogic
+from api_service.app.auth.role_checker import require_role
+from api_service.app.core.responses import trusted_response
+
+router = APIRouter(prefix="/events/{event_id}/dispatch", tags=["dispatch"])
+
+
+@router.get(
+    "/candidates",
+    response_model=list[DispatchCandidate],
+    summary="Rank volunteers for an event",
+    description="Available SUV users ranked by distance to the event, current workload and registered resource types",
+    dependencies=[Depends(require_role(["AUTHORITY", "VC"]))],
+)
+def get_dispatch_candidates(
+    event_id: int,
+    limit: int = Query(20, ge=1, le=1000, description="Number of candidates to return"),
+    weight_distance: float | None = Query(None, ge=0, description="Override DISPATCH_WEIGHT_DISTANCE"),
+    weight_workload: float | None = Query(None, ge=0, description="Override DISPATCH_WEIGHT_WORKLOAD"),
+    weight_resources: float | None = Query(None, ge=0, description="Override DISPATCH_WEIGHT_RESOURCES"),
+):
+    weights = {
+        name: value
+        for name, value in (("distance", weight_distance), ("workload", weight_workload), ("resources", weight_resources))
+        if value is not None
+    }
+    try:
+        candidates = DispatchLogic.rank_candidates(event_id, limit, weights)
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
+    if candidates is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return trusted_response(candidates)
+
+
+@router.post(
+    "",
+    response_model=list[VolunteerResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Assign volunteers to an event",
+    description="Creates an active volunteer row for every user in one transaction; nothing is created if any user is rejected",
+    dependencies=[Depends(require_role(["AUTHORITY", "VC"]))],
+)
+def assign_volunteers(event_id: int, request: DispatchAssignRequest):
+    try:
+        volunteers = DispatchLogic.assign(event_id, request.user_ids)
+    except ValueError as ve:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(ve))
+    if volunteers is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return volunteers
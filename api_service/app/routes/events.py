@@ -1,8 +1,13 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+import json
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
 from api_service.app.auth.role_checker import require_role
+from api_service.app.core.conditional import conditional_get
+from api_service.app.core.responses import trusted_response
 from domain import EventCreate, EventResponse, EventUpdate
-from api_service.app.logic import EventLogic, IngestionLogic
+from domain.schemas import BulkIngestResponse, TriageEventResponse
+from api_service.app.logic import EventLogic, IngestionLogic, TriageLogic
 
 router = APIRouter(prefix="/events", tags=["events"])
 
@@ -12,16 +17,67 @@ router = APIRouter(prefix="/events", tags=["events"])
     summary="Get all events",
     description="Retrieve a list of all disaster events with optional filtering",
     response_description="List of events",
+    dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"])), Depends(conditional_get("event", "volunteer", "location"))]
+)
+async def get_events(
+    response: Response,
+    skip: int = Query(0, ge=0, description="Number of events to skip"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of events to return"),
+    priority: Optional[int] = Query(None, ge=1, le=5, description="Filter by priority level"),
+    status: Optional[str] = Query(None, description="Filter by event status")
+):
+    events = await EventLogic.get_events_async(skip=skip, limit=limit, priority=priority, status=status)
+    return trusted_response(events, response)
+
+@router.get(
+    "/nearby",
+    response_model=list[EventResponse],
+    summary="Get events near a point",
+    description="Retrieve events located within a radius of a point, nearest first",
     dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))]
 )
-def get_events(
+async def get_events_nearby(
+    latitude: float = Query(..., ge=-90, le=90, description="Latitude of the search centre"),
+    longitude: float = Query(..., ge=-180, le=180, description="Longitude of the search centre"),
+    radius_km: float = Query(..., gt=0, le=1000, description="Search radius in kilometres"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of events to return"),
+    priority: Optional[int] = Query(None, ge=1, le=5, description="Filter by priority level"),
+    status: Optional[str] = Query(None, description="Filter by event status")
+):
+    return trusted_response(await EventLogic.get_events_within_radius_async(latitude, longitude, radius_km, limit, priority=priority, status=status))
+
+@router.get(
+    "/within",
+    response_model=list[EventResponse],
+    summary="Get events inside a bounding box",
+    description="Retrieve events located inside a bounding box such as the current map viewport",
+    dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))]
+)
+async def get_events_within(
+    min_lat: float = Query(..., ge=-90, le=90),
+    min_lon: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+    max_lon: float = Query(..., ge=-180, le=180),
     skip: int = Query(0, ge=0, description="Number of events to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of events to return"),
     priority: Optional[int] = Query(None, ge=1, le=5, description="Filter by priority level"),
     status: Optional[str] = Query(None, description="Filter by event status")
 ):
-    events = EventLogic.get_events(skip=skip, limit=limit, priority=priority, status=status)
-    return events
+    if min_lat > max_lat or min_lon > max_lon:
+        raise HTTPException(status_code=400, detail="Bounding box minimums must not exceed maximums")
+    return trusted_response(await EventLogic.get_events_in_bbox_async(min_lat, min_lon, max_lat, max_lon, skip, limit, priority=priority, status=status))
+
+@router.get(
+    "/triage",
+    response_model=list[TriageEventResponse],
+    summary="Get the event triage queue",
+    description="Open events ranked by priority, unfulfilled needs, active volunteers and time waiting, most urgent first",
+    dependencies=[Depends(require_role(["AUTHORITY", "VC"]))]
+)
+async def get_event_triage(
+    limit: int = Query(20, ge=1, le=1000, description="Number of events to return")
+):
+    return trusted_response(await TriageLogic.get_queue_async(limit))
 
 @router.get(
     "/{event_id}", 
@@ -34,11 +90,11 @@ def get_events(
     },
     dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))]
 )
-def get_event(event_id: int):
-    event = EventLogic.get_event(event_id)
+async def get_event(event_id: int):
+    event = await EventLogic.get_event_async(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    return event
+    return trusted_response(event)
 
 @router.post(
     "/", 
@@ -93,3 +149,31 @@ def ingest_event(full_event: dict):
         return {"message": "Event successfully ingested", "event_id": event_id}
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+
+@router.post(
+    "/ingest/bulk",
+    response_model=BulkIngestResponse,
+    summary="Bulk ingest events",
+    description="Ingest many events with their needed resources. Accepts a JSON array, "
+                "or NDJSON (one item per line) when sent as application/x-ndjson.",
+    dependencies=[Depends(require_role(["AUTHORITY"]))]
+)
+async def ingest_events_bulk(request: Request):
+    body = await request.body()
+    if "ndjson" in request.headers.get("content-type", ""):
+        items = []
+        for line_number, line in enumerate(body.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid JSON on line {line_number}: {e.msg}")
+    else:
+        try:
+            items = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON: {e.msg}")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=400, detail="Expected a JSON array of events")
+    return await run_in_threadpool(IngestionLogic.ingest_bulk, items)
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import Optional
 from api_service.app.auth.role_checker import require_role
 from api_service.app.logic import LocationLogic
 from domain.schemas import LocationAddress, LocationCreate, LocationResponse, LocationUpdate
@@ -18,8 +19,38 @@ def create_location(latitude: float = Query(0, ge=-90, le=90),
     raise HTTPException(status_code=501, detail="Geocode location creation not implemented yet")
 
 @router.get("/", response_model=list[LocationResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC"]))])
-def read_locations():
-    return LocationLogic.get_locations()
+def read_locations(
+    response: Response,
+    after_id: Optional[int] = Query(None, ge=0, description="Cursor: return locations with an id greater than this"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of rows to return"),
+):
+    locations = LocationLogic.get_locations(after_id, limit)
+    if len(locations) == limit:
+        response.headers["X-Next-Cursor"] = str(locations[-1].id)
+    return locations
+
+@router.get("/nearby", response_model=list[LocationResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC"]))])
+def read_locations_nearby(
+    latitude: float = Query(..., ge=-90, le=90, description="Latitude of the search centre"),
+    longitude: float = Query(..., ge=-180, le=180, description="Longitude of the search centre"),
+    radius_km: float = Query(..., gt=0, le=1000, description="Search radius in kilometres"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of rows to return"),
+):
+    """Locations within radius_km of a point, nearest first."""
+    return LocationLogic.get_locations_within_radius(latitude, longitude, radius_km, limit)
+
+@router.get("/within", response_model=list[LocationResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC"]))])
+def read_locations_within(
+    min_lat: float = Query(..., ge=-90, le=90),
+    min_lon: float = Query(..., ge=-180, le=180),
+    max_lat: float = Query(..., ge=-90, le=90),
+    max_lon: float = Query(..., ge=-180, le=180),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of rows to return"),
+):
+    """Locations inside a bounding box (e.g. the current map viewport)."""
+    if min_lat > max_lat or min_lon > max_lon:
+        raise HTTPException(status_code=400, detail="Bounding box minimums must not exceed maximums")
+    return LocationLogic.get_locations_in_bbox(min_lat, min_lon, max_lat, max_lon, limit)
 
 @router.get("/{location_id}", response_model=LocationResponse, dependencies=[Depends(require_role(["AUTHORITY", "VC"]))])
 def read_location(location_id: int):
@@ -0,0 +1,34 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from domain.schemas import MatchApplyRequest, MatchApplyResponse, MatchProposal
+from api_service.app.logic import MatchingLogic
+from api_service.app.auth.role_checker import require_role
+from api_service.app.core.responses import trusted_response
+
+router = APIRouter(prefix="/resources/matches", tags=["resources_matches"])
+
+
+@router.get(
+    "/",
+    response_model=list[MatchProposal],
+    summary="Propose matches between needed and available resources",
+    description="Pairs open resource needs with unallocated offers of the same type, weighing remaining quantity, event priority and distance",
+    dependencies=[Depends(require_role(["AUTHORITY", "VC"]))],
+)
+def get_match_proposals(
+    event_id: Optional[int] = Query(None, description="Only match the needs of this event"),
+    resource_type: Optional[str] = Query(None, description="Only match resources of this type"),
+):
+    return trusted_response(MatchingLogic.propose_matches(event_id, resource_type))
+
+
+@router.post(
+    "/apply",
+    response_model=MatchApplyResponse,
+    summary="Apply match proposals",
+    description="Allocates the chosen offers to their needs' events in one transaction and marks the needs they cover as fulfilled",
+    dependencies=[Depends(require_role(["AUTHORITY", "VC"]))],
+)
+def apply_match_proposals(request: MatchApplyRequest):
+    return MatchingLogic.apply_matches([(match.need_id, match.resource_id) for match in request.matches])
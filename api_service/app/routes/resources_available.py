@@ -1,5 +1,7 @@
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Query, Response, status, Depends
+from typing import Optional
 from api_service.app.auth.role_checker import require_role
+from api_service.app.core.conditional import conditional_get
 from domain.schemas import (
     ResourceAvailableCreate,
     ResourceAvailableResponse,
@@ -15,9 +17,20 @@ def create_resource_available(resource: ResourceAvailableCreate):
     return ResourceLogic.create_resource_available(resource)
 
 
-@router.get("/", response_model=list[ResourceAvailableResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))])
-def read_resources_available():
-    return ResourceLogic.get_resources_available()
+@router.get("/", response_model=list[ResourceAvailableResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"])), Depends(conditional_get("resource_available"))])
+def read_resources_available(
+    response: Response,
+    after_id: Optional[int] = Query(None, ge=0, description="Cursor: return resources with an id greater than this"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of rows to return"),
+    event_id: Optional[int] = Query(None, description="Filter by event ID"),
+    volunteer_id: Optional[int] = Query(None, description="Filter by volunteer ID"),
+    resource_type: Optional[str] = Query(None, description="Filter by resource type"),
+    is_allocated: Optional[bool] = Query(None, description="Filter by allocation state"),
+):
+    resources = ResourceLogic.get_resources_available(after_id, limit, event_id, volunteer_id, resource_type, is_allocated)
+    if len(resources) == limit:
+        response.headers["X-Next-Cursor"] = str(resources[-1].id)
+    return resources
 
 
 @router.get("/{resource_id}", response_model=ResourceAvailableResponse, dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))])
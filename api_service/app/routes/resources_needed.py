@@ -1,5 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from typing import Optional
 from api_service.app.auth.role_checker import require_role
+from api_service.app.core.conditional import conditional_get
 from domain.schemas import (
     ResourceNeededCreate,
     ResourceNeededResponse,
@@ -15,10 +17,20 @@ def create_resource_needed(resource: ResourceNeededCreate):
     return ResourceLogic.create_resource_needed(resource)
 
 
-@router.get("/", response_model=list[ResourceNeededResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))]
+@router.get("/", response_model=list[ResourceNeededResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"])), Depends(conditional_get("resource_needed"))]
 )
-def read_resources_needed():
-    return ResourceLogic.get_resources_needed()
+def read_resources_needed(
+    response: Response,
+    after_id: Optional[int] = Query(None, ge=0, description="Cursor: return resources with an id greater than this"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of rows to return"),
+    event_id: Optional[int] = Query(None, description="Filter by event ID"),
+    resource_type: Optional[str] = Query(None, description="Filter by resource type"),
+    is_fulfilled: Optional[bool] = Query(None, description="Filter by fulfillment state"),
+):
+    resources = ResourceLogic.get_resources_needed(after_id, limit, event_id, resource_type, is_fulfilled)
+    if len(resources) == limit:
+        response.headers["X-Next-Cursor"] = str(resources[-1].id)
+    return resources
 
 
 @router.get("/{resource_id}", response_model=ResourceNeededResponse, dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))])
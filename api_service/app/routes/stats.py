@@ -1,4 +1,7 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from domain.schemas import StatsResponse
 from api_service.app.logic import StatsLogic
 from api_service.app.auth.role_checker import require_role
@@ -7,6 +10,13 @@ router = APIRouter(prefix="/stats")
 
 
 @router.get("/", response_model=StatsResponse, dependencies=[Depends(require_role(["AUTHORITY", "VC"]))])
-def get_stats():
+def get_stats(
+	at: Optional[datetime] = Query(None, description="Return the recorded stats as of this time instead of live numbers"),
+):
 	"""Return aggregated statistics for dashboard/monitoring."""
-	return StatsLogic.get_stats()
+	if at is None:
+		return StatsLogic.get_stats()
+	stats = StatsLogic.get_stats_at(at)
+	if not stats:
+		raise HTTPException(status_code=404, detail="No stats recorded at or before the requested time")
+	return stats
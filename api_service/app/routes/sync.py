@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from domain.schemas import SyncResponse
+from api_service.app.logic import SyncLogic
+from api_service.app.auth.role_checker import require_role
+from api_service.app.core.responses import trusted_response
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+@router.get(
+    "",
+    response_model=SyncResponse,
+    summary="Get changes since a cursor",
+    description="Events, volunteers, users and resources created, modified or deleted after the cursor, plus the next cursor",
+    dependencies=[Depends(require_role(["AUTHORITY", "VC"]))],
+)
+async def get_sync(
+    since: Optional[datetime] = Query(None, description="Cursor returned by the previous call; omit for a full snapshot"),
+):
+    changes = await SyncLogic.get_changes_async(since)
+    if changes is None:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Cursor is older than the tombstone retention window; reload without 'since'",
+        )
+    return trusted_response(changes)
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException, Query, Depends
 from typing import Optional
 from api_service.app.auth.role_checker import require_role
+from api_service.app.core.conditional import conditional_get
 
 
 
@@ -9,7 +10,7 @@ from api_service.app.logic import UserLogic
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-@router.get("/", response_model=list[UserResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC"]))])
+@router.get("/", response_model=list[UserResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC"])), Depends(conditional_get("user"))])
 def read_users(
     skip: int = Query(0, ge=0, description="Number of rows to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of rows to return"),
@@ -1,10 +1,12 @@
-from fastapi import APIRouter, HTTPException, Query, status, Depends
+from fastapi import APIRouter, HTTPException, Query, Response, status, Depends
 from typing import Optional
 
 from domain.schemas import VolunteerCreate, VolunteerResponse, VolunteerUpdate
 from domain.exceptions import UserExistsException
 from api_service.app.logic import VolunteerLogic
 from api_service.app.auth.role_checker import require_role
+from api_service.app.core.conditional import conditional_get
+from api_service.app.core.responses import trusted_response
 
 router = APIRouter(prefix="/volunteers", tags=["volunteers"])
 
@@ -18,8 +20,9 @@ def create_volunteer(volunteer: VolunteerCreate):
             detail=str(ve)
         )
 
-@router.get("/", response_model=list[VolunteerResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))])
-def read_volunteers(
+@router.get("/", response_model=list[VolunteerResponse], dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"])), Depends(conditional_get("volunteer", "user"))])
+async def read_volunteers(
+    response: Response,
     event_id: Optional[int] = Query(None, description="Filter by event ID"),
     user_id: Optional[int] = Query(None, description="Filter by user ID"),
     status: Optional[str] = Query(None, description="Filter by status (active, completed, cancelled)"),
@@ -29,20 +32,21 @@ def read_volunteers(
     """
     Get volunteers with optional filtering.
     """
-    return VolunteerLogic.get_volunteers(
+    volunteers = await VolunteerLogic.get_volunteers_async(
         event_id=event_id,
         user_id=user_id,
         status=status,
         skip=skip,
         limit=limit
     )
+    return trusted_response(volunteers, response)
 
 @router.get("/{volunteer_id}", response_model=VolunteerResponse, dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))])
-def read_volunteer(volunteer_id: int):
-    volunteer = VolunteerLogic.get_volunteer(volunteer_id)
+async def read_volunteer(volunteer_id: int):
+    volunteer = await VolunteerLogic.get_volunteer_async(volunteer_id)
     if not volunteer:
         raise HTTPException(status_code=404, detail="Volunteer not found")
-    return volunteer
+    return trusted_response(volunteer)
 
 @router.put("/{volunteer_id}", response_model=VolunteerResponse, dependencies=[Depends(require_role(["AUTHORITY", "VC", "SUV"]))])
 def update_volunteer(volunteer_id: int, volunteer: VolunteerUpdate):
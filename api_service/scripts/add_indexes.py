@@ -0,0 +1,73 @@
+"""
+Migration script to create the indexes declared in models.py on an existing database.
+
+On Postgres every index is built with CREATE INDEX CONCURRENTLY, so tables stay
+readable and writable while it runs and nothing is rebuilt. Run with:
+
+    python -m api_service.scripts.add_indexes
+
+The script is idempotent: indexes that already exist (and are valid) are skipped.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from api_service.app.db import engine
+from sqlmodel import SQLModel, text
+
+
+def _index_ddl(index, concurrently: bool) -> str:
+    columns = ", ".join(f'"{column.name}"' for column in index.columns)
+    return (
+        f"CREATE {'UNIQUE ' if index.unique else ''}INDEX "
+        f"{'CONCURRENTLY ' if concurrently else ''}IF NOT EXISTS {index.name} "
+        f'ON "{index.table.name}" ({columns})'
+    )
+
+
+def _has_duplicates(connection, index) -> bool:
+    columns = ", ".join(f'"{column.name}"' for column in index.columns)
+    result = connection.execute(text(
+        f'SELECT {columns} FROM "{index.table.name}" GROUP BY {columns} HAVING COUNT(*) > 1 LIMIT 1'
+    ))
+    return result.first() is not None
+
+
+def _drop_if_invalid(connection, index) -> None:
+    """Drop a leftover INVALID index from an interrupted concurrent build."""
+    invalid = connection.execute(text("""
+        SELECT 1 FROM pg_class c JOIN pg_index i ON i.indexrelid = c.oid
+        WHERE c.relname = :name AND NOT i.indisvalid
+    """), {"name": index.name}).first()
+    if invalid:
+        print(f"  Dropping invalid index {index.name} left by an earlier run...")
+        connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}"))
+
+
+def migrate():
+    """Create every model-declared index that is missing."""
+    is_postgres = engine.dialect.name == "postgresql"
+
+    # CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for table in SQLModel.metadata.sorted_tables:
+            for index in sorted(table.indexes, key=lambda idx: idx.name):
+                try:
+                    if index.unique and _has_duplicates(connection, index):
+                        print(f"✗ Skipping unique index {index.name}: duplicate values exist in {table.name}. "
+                              "Resolve them and re-run.")
+                        continue
+                    if is_postgres:
+                        _drop_if_invalid(connection, index)
+                    print(f"Creating index {index.name} on {table.name}...")
+                    connection.execute(text(_index_ddl(index, concurrently=is_postgres)))
+                except Exception as e:
+                    print(f"✗ Error creating index {index.name}: {e}")
+                    raise
+    print("✓ All indexes are in place")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,59 @@
+"""
+Migration script to add and backfill the geohash column on the location table.
+
+Run with:
+
+    python -m api_service.scripts.add_location_geohash
+
+Safe to re-run: the column is only added when missing and only rows without a
+geohash are backfilled. Create the index afterwards with scripts/add_indexes.py.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from api_service.app.db import engine
+from api_service.app.core.geo import encode_geohash
+from sqlalchemy import inspect
+from sqlmodel import text
+
+BATCH_SIZE = 1000
+
+
+def migrate():
+    """Add location.geohash and fill it for existing rows."""
+    columns = {column["name"] for column in inspect(engine).get_columns("location")}
+    with engine.begin() as connection:
+        if "geohash" in columns:
+            print("✓ Column 'geohash' already exists in location table")
+        else:
+            print("Adding geohash column to location table...")
+            connection.execute(text("ALTER TABLE location ADD COLUMN geohash VARCHAR"))
+
+    last_id = 0
+    updated = 0
+    while True:
+        # Each batch commits on its own so a large backfill never holds long locks
+        with engine.begin() as connection:
+            rows = connection.execute(text("""
+                SELECT id, latitude, longitude FROM location
+                WHERE id > :last_id AND geohash IS NULL
+                ORDER BY id LIMIT :batch
+            """), {"last_id": last_id, "batch": BATCH_SIZE}).all()
+            if not rows:
+                break
+            connection.execute(
+                text("UPDATE location SET geohash = :geohash WHERE id = :id"),
+                [{"id": row.id, "geohash": encode_geohash(row.latitude, row.longitude)} for row in rows],
+            )
+        last_id = rows[-1].id
+        updated += len(rows)
+        print(f"  Backfilled {updated} locations...")
+
+    print(f"✓ Successfully backfilled geohash for {updated} locations")
+
+
+if __name__ == "__main__":
+    migrate()
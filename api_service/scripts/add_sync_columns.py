@@ -0,0 +1,46 @@
+"""
+Migration script for delta sync (GET /sync).
+
+Adds the indexed modified_time column to every synced table that is missing
+it and stamps existing rows with the current time, so the first delta after
+the migration re-sends them once. The tombstone table is created by the API
+on startup. Run with:
+
+    python -m api_service.scripts.add_sync_columns
+
+Safe to re-run: tables that already have the column are skipped.
+"""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from api_service.app.db import engine
+from sqlalchemy import inspect
+from sqlmodel import text
+
+TABLES = ("location", "user", "volunteer", "resourceneeded", "resourceavailable")
+
+
+def migrate():
+    """Add modified_time to the synced tables and index it (event already has the column)."""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table in TABLES:
+            columns = {column["name"] for column in inspector.get_columns(table)}
+            if "modified_time" in columns:
+                print(f"✓ Column 'modified_time' already exists in {table} table")
+                continue
+            print(f"Adding modified_time column to {table} table...")
+            connection.execute(text(f'ALTER TABLE "{table}" ADD COLUMN modified_time TIMESTAMP'))
+            connection.execute(text(f'UPDATE "{table}" SET modified_time = :now'), {"now": datetime.utcnow()})
+
+        for table in ("event", *TABLES):
+            connection.execute(text(f'CREATE INDEX IF NOT EXISTS ix_{table}_modified_time ON "{table}" (modified_time)'))
+    print("✓ modified_time columns and indexes are in place")
+
+
+if __name__ == "__main__":
+    migrate()
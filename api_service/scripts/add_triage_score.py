@@ -0,0 +1,40 @@
+"""
+Migration script for the event triage queue (GET /events/triage).
+
+Adds the indexed event.triage_score column when it is missing and scores
+every event. New writes keep the scores current from then on; re-run this
+after changing any TRIAGE_* setting so existing scores use the new weights.
+Run with:
+
+    python -m api_service.scripts.add_triage_score
+
+Safe to re-run.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from api_service.app.db import engine
+from api_service.app.logic import TriageLogic
+from sqlalchemy import inspect
+from sqlmodel import text
+
+
+def migrate():
+    """Add event.triage_score with its index, then compute it for every event."""
+    columns = {column["name"] for column in inspect(engine).get_columns("event")}
+    with engine.begin() as connection:
+        if "triage_score" in columns:
+            print("✓ Column 'triage_score' already exists in event table")
+        else:
+            print("Adding triage_score column to event table...")
+            connection.execute(text("ALTER TABLE event ADD COLUMN triage_score FLOAT"))
+        connection.execute(text("CREATE INDEX IF NOT EXISTS ix_event_triage_score ON event (triage_score)"))
+
+    print(f"✓ Scored {TriageLogic.rebuild()} events")
+
+
+if __name__ == "__main__":
+    migrate()
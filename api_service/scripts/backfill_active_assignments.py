@@ -0,0 +1,41 @@
+"""
+Migration/repair script for the user.active_assignments counter.
+
+Adds the column to an existing database if it is missing, then recomputes
+every user's count of active volunteer rows (and the derived status) from
+the volunteer table. Run with:
+
+    python -m api_service.scripts.backfill_active_assignments
+
+Safe to re-run at any time: only users whose counter or status drifted are
+updated.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from api_service.app.db import engine
+from api_service.app.data_access import VolunteerDAO
+from sqlalchemy import inspect
+from sqlmodel import text
+
+
+def migrate():
+    """Add the active_assignments column if needed and recount it."""
+    columns = {column["name"] for column in inspect(engine).get_columns("user")}
+    if "active_assignments" in columns:
+        print("✓ Column 'active_assignments' already exists in user table")
+    else:
+        print("Adding active_assignments column to user table...")
+        with engine.begin() as connection:
+            connection.execute(text('ALTER TABLE "user" ADD COLUMN active_assignments INTEGER NOT NULL DEFAULT 0'))
+
+    print("Recounting active assignments from the volunteer table...")
+    corrected = VolunteerDAO.recount_active_assignments()
+    print(f"✓ Corrected {corrected} users")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,63 @@
+"""
+Migration script to add the address de-duplication index to an existing database.
+
+Adds location.normalized_address, creates the locationaddresstoken table and
+backfills both for existing rows. Run with:
+
+    python -m api_service.scripts.build_address_index
+
+Safe to re-run: only locations without a normalized address are processed.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from api_service.app.db import engine
+from api_service.app.models import Location, LocationAddressToken
+from api_service.app.data_access import LocationDAO
+from sqlalchemy import inspect
+from sqlmodel import Session, select, text
+
+BATCH_SIZE = 1000
+
+
+def migrate():
+    """Add the normalized address column and token table, then backfill them."""
+    columns = {column["name"] for column in inspect(engine).get_columns("location")}
+    with engine.begin() as connection:
+        if "normalized_address" in columns:
+            print("✓ Column 'normalized_address' already exists in location table")
+        else:
+            print("Adding normalized_address column to location table...")
+            connection.execute(text("ALTER TABLE location ADD COLUMN normalized_address VARCHAR"))
+    LocationAddressToken.__table__.create(engine, checkfirst=True)
+
+    last_id = 0
+    indexed = 0
+    while True:
+        # Each batch commits on its own so a large backfill never holds long locks
+        with Session(engine) as session:
+            locations = session.exec(
+                select(Location)
+                .where(Location.id > last_id, Location.normalized_address.is_(None))
+                .order_by(Location.id)
+                .limit(BATCH_SIZE)
+            ).all()
+            if not locations:
+                break
+            for location in locations:
+                LocationDAO.apply_normalized_address(location)
+                session.add(location)
+            LocationDAO.index_address_tokens(session, locations)
+            session.commit()
+            last_id = locations[-1].id
+            indexed += len(locations)
+        print(f"  Indexed {indexed} locations...")
+
+    print(f"✓ Successfully indexed addresses for {indexed} locations")
+
+
+if __name__ == "__main__":
+    migrate()
@@ -94,6 +94,9 @@ class EventResponse(BaseModel):
         "from_attributes": True
     }
 
+class TriageEventResponse(EventResponse):
+    triage_score: float  # higher first; grows by TRIAGE_AGING_PER_HOUR while the event waits
+
 
 # ------------------ ResourceNeeded ------------------
 class ResourceNeededCreate(BaseModel):
@@ -185,6 +188,33 @@ class VolunteerResponse(BaseModel):
     }
 
 
+# ------------------ Ingestion ------------------
+class ResourceNeededIngest(BaseModel):
+    name: str
+    resource_type: str
+    description: str
+    quantity: int = Field(ge=1)
+    is_fulfilled: bool = False
+
+class EventIngest(BaseModel):
+    description: str
+    priority: int = Field(ge=1, le=5)
+    status: str
+    location: LocationCreate
+    resources_needed: list[ResourceNeededIngest] = []
+
+class IngestItemResult(BaseModel):
+    index: int
+    status: str  # created | error
+    event_id: int | None = None
+    error: str | None = None
+
+class BulkIngestResponse(BaseModel):
+    created: int
+    failed: int
+    results: list[IngestItemResult]
+
+
 # ------------------ Stats ------------------
 class StatsResponse(BaseModel):
     activeEvents: int
@@ -194,3 +224,54 @@ class StatsResponse(BaseModel):
     model_config = {
         "from_attributes": True
     }
+
+
+# ------------------ Sync ------------------
+class DeletedRow(BaseModel):
+    entity: str  # event | volunteer | user | resource_needed | resource_available
+    id: int
+
+class SyncResponse(BaseModel):
+    cursor: dt  # pass back as ``since`` on the next call
+    events: list[EventResponse]
+    volunteers: list[VolunteerResponse]
+    users: list[UserResponse]
+    resources_needed: list[ResourceNeededResponse]
+    resources_available: list[ResourceAvailableResponse]
+    deleted: list[DeletedRow]
+
+
+# ------------------ Matching ------------------
+class MatchProposal(BaseModel):
+    need_id: int
+    event_id: int
+    resource_id: int
+    resource_type: str
+    quantity: int
+    distance_km: float | None = None  # None when the offering volunteer has no event location
+    score: float
+
+class MatchSelection(BaseModel):
+    need_id: int
+    resource_id: int
+
+class MatchApplyRequest(BaseModel):
+    matches: list[MatchSelection] = Field(min_length=1)
+
+class MatchApplyResponse(BaseModel):
+    allocated: list[int]  # resource ids now allocated to the need's event
+    skipped: list[int]  # resource ids already allocated, or whose need was no longer open
+    fulfilled_needs: list[int]
+
+
+# ------------------ Dispatch ------------------
+class DispatchCandidate(BaseModel):
+    user_id: int
+    name: str
+    score: float
+    distance_km: float | None = None  # from the user's latest deployment; None if never deployed
+    active_assignments: int
+    resource_types: list[str]  # the event's needed resource types this user has registered
+
+class DispatchAssignRequest(BaseModel):
+    user_ids: list[int] = Field(min_length=1, max_length=1000)
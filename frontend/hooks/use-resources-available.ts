@@ -6,7 +6,7 @@ import { api } from '@/lib/api-client'
 export function useResourcesAvailable() {
   return useQuery({
     queryKey: ['resources/available'],
-    queryFn: () => api.get('/resources/available/'),
+    queryFn: () => api.getAll('/resources/available/'),
     refetchInterval: 5000
   })
 }
\ No newline at end of file
@@ -6,7 +6,7 @@ import { api } from '@/lib/api-client'
 export function useResourcesNeeded() {
   return useQuery({
     queryKey: ['resources/needed'],
-    queryFn: () => api.get('/resources/needed/'),
+    queryFn: () => api.getAll('/resources/needed/'),
     refetchInterval: 5000
   })
 }
\ No newline at end of file
@@ -4,7 +4,7 @@
  */
 
 import { useState, useCallback } from "react"
-import { get, post, put, del } from "@/lib/api-client"
+import { getAll, post, put, del } from "@/lib/api-client"
 import type { ResourceAvailable, ResourceNeeded } from "@/lib/types"
 
 interface UseResourcesReturn {
@@ -44,8 +44,7 @@ export function useResources(): UseResourcesReturn {
     try {
       setIsLoading(true)
       setError(null)
-      const allResources = await get<ResourceAvailable[]>('/resources/available/')
-      return allResources.filter(r => r.volunteer_id === volunteerId)
+      return await getAll<ResourceAvailable>(`/resources/available/?volunteer_id=${volunteerId}`)
     } catch (err) {
       const error = err instanceof Error ? err : new Error("Failed to fetch volunteer resources")
       setError(error)
@@ -60,8 +59,7 @@ export function useResources(): UseResourcesReturn {
     try {
       setIsLoading(true)
       setError(null)
-      const resources = await get<ResourceNeeded[]>('/resources/needed/')
-      return resources.filter((resource) => resource.event_id === eventId)
+      return await getAll<ResourceNeeded>(`/resources/needed/?event_id=${eventId}`)
     } catch (err) {
       const error = err instanceof Error ? err : new Error("Failed to fetch needed resources")
       setError(error)
@@ -76,8 +74,7 @@ export function useResources(): UseResourcesReturn {
     try {
       setIsLoading(true)
       setError(null)
-      const resources = await get<ResourceAvailable[]>('/resources/available/')
-      return resources.filter((resource) => resource.event_id === eventId)
+      return await getAll<ResourceAvailable>(`/resources/available/?event_id=${eventId}`)
     } catch (err) {
       const error = err instanceof Error ? err : new Error("Failed to fetch available resources")
       setError(error)
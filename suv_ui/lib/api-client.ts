@@ -78,6 +78,20 @@ export function clearAuthToken() {
  * Generic fetch wrapper with error handling and auto-logout on 401
  */
 async function apiFetch<T>(endpoint: string, options?: RequestInit): Promise<T> {
+  const response = await apiResponse(endpoint, options)
+
+  // Handle empty responses (204 No Content)
+  if (response.status === 204 || response.headers.get("content-length") === "0") {
+    return {} as T
+  }
+
+  return response.json()
+}
+
+/**
+ * Fetch an endpoint and return the raw response once it is known to be OK
+ */
+async function apiResponse(endpoint: string, options?: RequestInit): Promise<Response> {
   // Ensure endpoint starts with /
   const path = endpoint.startsWith('/') ? endpoint : `/${endpoint}`
   const url = `${getApiBaseUrl()}${path}`
@@ -122,12 +136,7 @@ async function apiFetch<T>(endpoint: string, options?: RequestInit): Promise<T>
       throw new Error(`API error ${response.status}: ${errorText}`)
     }
 
-    // Handle empty responses (204 No Content)
-    if (response.status === 204 || response.headers.get("content-length") === "0") {
-      return {} as T
-    }
-
-    return response.json()
+    return response
   } catch (error) {
     console.error(`Failed to fetch ${endpoint}:`, error)
     throw error
@@ -136,6 +145,9 @@ async function apiFetch<T>(endpoint: string, options?: RequestInit): Promise<T>
 
 // ============= Generic HTTP Methods =============
 
+// Largest page the paginated listings accept
+const MAX_PAGE_SIZE = 1000
+
 /**
  * Generic GET request
  */
@@ -143,6 +155,22 @@ export async function get<T>(endpoint: string): Promise<T> {
   return apiFetch<T>(endpoint, { method: 'GET' })
 }
 
+/**
+ * GET every page of a keyset-paginated listing, following X-Next-Cursor
+ */
+export async function getAll<T>(endpoint: string): Promise<T[]> {
+  const separator = endpoint.includes('?') ? '&' : '?'
+  const firstPage = `${endpoint}${separator}limit=${MAX_PAGE_SIZE}`
+  const items: T[] = []
+  let cursor: string | null = null
+  do {
+    const response = await apiResponse(cursor === null ? firstPage : `${firstPage}&after_id=${cursor}`, { method: 'GET' })
+    items.push(...(await response.json() as T[]))
+    cursor = response.headers.get('X-Next-Cursor')
+  } while (cursor !== null)
+  return items
+}
+
 /**
  * Generic POST request
  */
@@ -3,7 +3,8 @@ import pytest
 import sys
 from pathlib import Path
 from sqlmodel import Session, create_engine, SQLModel
-from sqlmodel.pool import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 
 # Ensure tests never depend on external Postgres creds
 os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
@@ -14,46 +15,50 @@ os.environ.setdefault("ADMIN_PASSWORD", "ChangeMe_CI_123")
 os.environ.setdefault("ADMIN_NAME", "CI Administrator")
 os.environ.setdefault("ADMIN_PHONE", "0000000000")
 
+# Cheap bcrypt, hashed inline: tests exercise behaviour, not password cost
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+
 sys.path.insert(0, str(Path(__file__).parent))
 
 from fastapi.testclient import TestClient
 from api_service.app import db
-from api_service.app.data_access import (
-    user_dao,
-    event_dao,
-    location_dao,
-    resource_dao,
-    stats_dao,
-    volunteer_dao,
-)
 from api_service.app.main import app
+from api_service.app.logic import DashboardLogic, DispatchLogic, StatsLogic
+from api_service.app.data_access import UserDAO
 from api_service.app.core.config import settings
 
 
 @pytest.fixture(scope="function")
-def db_session(monkeypatch):
-    """Create a fresh in-memory database for each test and point the app to it."""
+def db_session(monkeypatch, tmp_path):
+    """Create a fresh database for each test and point the app to it.
+
+    The database is a temporary file rather than ``:memory:`` so the sync
+    engine and the aiosqlite engine used by async routes see the same data.
+    """
+    db_file = tmp_path / "test.db"
     engine = create_engine(
-        "sqlite:///:memory:",
+        f"sqlite:///{db_file}",
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
+    # NullPool: each TestClient runs its own event loop, so async connections must not be reused across loops
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_file}", poolclass=NullPool)
     SQLModel.metadata.create_all(engine)
 
-    # Point all DAO code to the in-memory engine
+    # Point all DAO code to the test engines
     monkeypatch.setattr(db, "engine", engine)
-    for dao_module in (
-        user_dao,
-        event_dao,
-        location_dao,
-        resource_dao,
-        stats_dao,
-        volunteer_dao,
-    ):
-        monkeypatch.setattr(dao_module, "engine", engine)
+    monkeypatch.setattr(db, "_async_engine", async_engine)
+
+    # Cached stats and snapshot bookkeeping belong to the previous database
+    StatsLogic.cache.clear()
+    DashboardLogic.cache.clear()
+    DispatchLogic.cache.clear()
+    UserDAO.email_cache.clear()
+    monkeypatch.setattr(StatsLogic, "last_snapshot_at", None)
 
     with Session(engine) as session:
         yield session
+    engine.dispose()
 
 
 @pytest.fixture(scope="function")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Login/register throughput benchmark for the MayDay API.
+
+Starts a local API server once per PASSWORD_HASH_WORKERS value, drives it
+with concurrent register + login requests (the Locust on_start flow) and
+reports requests per second for each configuration.
+
+Usage (from the repository root):
+    python tests/load-testing/auth-benchmark.py --workers 0 1 2 4 --duration 20
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import requests
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def wait_until_ready(base_url: str, timeout: float = 30) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if requests.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except requests.RequestException:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"API at {base_url} did not become ready")
+
+
+def start_server(port: int, hash_workers: int, rounds: int, db_path: str) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{db_path}",
+        "PASSWORD_HASH_WORKERS": str(hash_workers),
+        "BCRYPT_ROUNDS": str(rounds),
+    }
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api_service.app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=REPO_ROOT,
+        env=env,
+    )
+
+
+def user_flow(base_url: str, session: requests.Session) -> tuple[bool, bool]:
+    """Register a fresh user and log in; return (register_ok, login_ok)."""
+    email = f"bench_{uuid.uuid4().hex[:12]}@example.com"
+    register = session.post(f"{base_url}/auth/register", json={
+        "name": "Benchmark User",
+        "email": email,
+        "phonenumber": "+4500000000",
+        "password": "Benchmark123!",
+        "role": "SUV",
+    })
+    login = session.post(f"{base_url}/auth/login", json={"email": email, "password": "Benchmark123!"})
+    return register.status_code == 200, login.status_code == 200
+
+
+def run_load(base_url: str, concurrency: int, duration: float) -> dict:
+    counts = {"register": 0, "login": 0, "errors": 0}
+    lock = threading.Lock()
+    stop_at = time.time() + duration
+
+    def worker():
+        session = requests.Session()
+        while time.time() < stop_at:
+            try:
+                register_ok, login_ok = user_flow(base_url, session)
+            except requests.RequestException:
+                register_ok = login_ok = False
+            with lock:
+                counts["register"] += register_ok
+                counts["login"] += login_ok
+                counts["errors"] += (not register_ok) + (not login_ok)
+
+    started = time.time()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    elapsed = time.time() - started
+    return {key: value / elapsed for key, value in counts.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4],
+                        help="PASSWORD_HASH_WORKERS values to compare (0 = hash in request threads)")
+    parser.add_argument("--rounds", type=int, default=12, help="BCRYPT_ROUNDS for the server")
+    parser.add_argument("--concurrency", type=int, default=32, help="concurrent simulated users")
+    parser.add_argument("--duration", type=float, default=20, help="seconds per configuration")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    print(f"bcrypt rounds={args.rounds}, concurrency={args.concurrency}, duration={args.duration}s")
+    print(f"{'hash workers':>12} | {'register/s':>10} | {'login/s':>8} | {'errors/s':>8}")
+    for hash_workers in args.workers:
+        with tempfile.TemporaryDirectory() as tmp:
+            server = start_server(args.port, hash_workers, args.rounds, os.path.join(tmp, "bench.db"))
+            try:
+                wait_until_ready(base_url)
+                result = run_load(base_url, args.concurrency, args.duration)
+            finally:
+                server.terminate()
+                server.wait()
+        print(f"{hash_workers:>12} | {result['register']:>10.1f} | {result['login']:>8.1f} | {result['errors']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Response compression benchmark.
+
+Builds volunteer-list style JSON bodies of several sizes and reports, per
+request, the bytes sent and the CPU time spent compressing them for each
+encoding and level the API can be configured with (COMPRESSION_GZIP_LEVEL,
+COMPRESSION_BROTLI_QUALITY). Brotli rows are skipped when the optional
+``brotli`` package is not installed.
+
+Usage (from the repository root):
+    python tests/load-testing/compression-benchmark.py --rows 10 100 1000 10000
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+# Importing the app package needs a database URL; nothing is queried
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from api_service.app.core.compression import brotli, compress
+
+STATUSES = ("active", "completed", "cancelled")
+
+
+def volunteer_page(rows: int) -> bytes:
+    """A body shaped like GET /volunteers/ with ``rows`` entries."""
+    now = datetime.utcnow()
+    return orjson.dumps([
+        {
+            "id": i,
+            "user": {
+                "id": 1000 + i,
+                "name": f"Volunteer {i}",
+                "email": f"volunteer{i}@example.com",
+                "phonenumber": f"+45{20000000 + i}",
+                "status": "assigned",
+                "role": "SUV",
+            },
+            "event_id": i % 50,
+            "status": STATUSES[i % len(STATUSES)],
+            "create_time": now,
+            "completion_time": None,
+        }
+        for i in range(rows)
+    ])
+
+
+def cpu_ms_per_call(encoding: str, body: bytes, level: int, repeat: int) -> float:
+    start = time.process_time()
+    for _ in range(repeat):
+        compress(encoding, body, gzip_level=level, brotli_quality=level)
+    return (time.process_time() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10, 100, 1000, 10000], help="rows per response")
+    parser.add_argument("--gzip-levels", type=int, nargs="+", default=[1, 6, 9])
+    parser.add_argument("--brotli-qualities", type=int, nargs="+", default=[1, 4, 11])
+    parser.add_argument("--min-cpu-seconds", type=float, default=0.5, help="CPU time to spend per measurement")
+    args = parser.parse_args()
+
+    configurations = [("gzip", level) for level in args.gzip_levels]
+    if brotli is not None:
+        configurations += [("br", quality) for quality in args.brotli_qualities]
+    else:
+        print("brotli not installed: gzip only\n")
+
+    print(f"{'rows':>6} | {'encoding':>8} | {'level':>5} | {'bytes':>9} | {'ratio':>6} | {'CPU ms/request':>14}")
+    for rows in args.rows:
+        body = volunteer_page(rows)
+        print(f"{rows:>6} | {'identity':>8} | {'-':>5} | {len(body):>9} | {1:>6.1f} | {0:>14.3f}")
+        for encoding, level in configurations:
+            size = len(compress(encoding, body, gzip_level=level, brotli_quality=level))
+            # Calibrate the repetition count so small bodies are measured above timer resolution
+            single = max(cpu_ms_per_call(encoding, body, level, 1) / 1000, 1e-5)
+            repeat = max(1, int(args.min_cpu_seconds / single))
+            cpu_ms = cpu_ms_per_call(encoding, body, level, repeat)
+            print(f"{rows:>6} | {encoding:>8} | {level:>5} | {size:>9} | {len(body) / size:>6.1f} | {cpu_ms:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
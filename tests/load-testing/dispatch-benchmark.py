@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Volunteer dispatch ranking microbenchmark.
+
+Times the two parts of GET /events/{event_id}/dispatch/candidates on synthetic
+users shaped like the DispatchDAO.get_user_features rows:
+
+  features  - build_features, paid once per DISPATCH_FEATURES_TTL_SECONDS
+  rank      - score_users + top_k, paid by every request
+  python    - the same score computed per user in Python and fully sorted,
+              for comparison
+
+Usage (from the repository root):
+    python tests/load-testing/dispatch-benchmark.py --users 100000 --limit 20
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+# The app modules need a database URL at import time; nothing is queried
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from api_service.app.core.geo import haversine_km
+from api_service.app.logic.dispatch_logic import build_features, default_weights, score_users, top_k
+
+RESOURCE_TYPES = ["medical", "water", "food", "shelter", "vehicle", "tools"]
+
+
+def make_rows(users: int, seed: int) -> tuple[list[tuple], list[tuple]]:
+    rng = random.Random(seed)
+    user_rows, type_rows = [], []
+    for user_id in range(1, users + 1):
+        located = rng.random() < 0.8
+        user_rows.append((user_id, f"User {user_id}", rng.choice([0, 0, 0, 1, 2]),
+                          55.0 + rng.uniform(-2, 2) if located else None,
+                          10.0 + rng.uniform(-3, 3) if located else None))
+        for resource_type in rng.sample(RESOURCE_TYPES, rng.choice([0, 0, 1, 2])):
+            type_rows.append((user_id, resource_type))
+    return user_rows, type_rows
+
+
+def rank_in_python(users, types, latitude, longitude, priority, needed_types, limit):
+    weights, scale_km = default_weights(), 25.0
+    held: dict[int, set] = {}
+    for user_id, resource_type in types:
+        held.setdefault(user_id, set()).add(resource_type)
+    urgency = 1.0 + (5 - priority) / 4.0
+    scored = []
+    for user_id, _, active, lat, lon in users:
+        distance = haversine_km(latitude, longitude, lat, lon) if lat is not None else scale_km
+        coverage = len(held.get(user_id, set()) & set(needed_types)) / len(needed_types)
+        scored.append((weights["distance"] * urgency * scale_km / (distance + scale_km)
+                       + weights["workload"] / (1 + active) + weights["resources"] * coverage, user_id))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return scored[:limit]
+
+
+def timed(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=20, help="candidates returned (K)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    users, types = make_rows(args.users, args.seed)
+    event = (55.3, 10.4, 1, ["medical", "water"])  # latitude, longitude, priority, needed types
+    features = build_features(users, types)
+
+    def rank():
+        scores = score_users(features, event[2], event[0], event[1], event[3], default_weights())
+        return top_k(scores, features["user_ids"], args.limit)
+
+    print(f"{args.users} users, {len(types)} registered resource types, K={args.limit}")
+    print(f"features: {timed(lambda: build_features(users, types), 3):8.1f} ms (once per TTL)")
+    print(f"rank:     {timed(rank, args.repeat):8.1f} ms per request")
+    print(f"python:   {timed(lambda: rank_in_python(users, types, *event, args.limit), 3):8.1f} ms per request")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Resource matching engine microbenchmark.
+
+Times MatchingLogic.match on synthetic needs and offers spread over a region
+of about 300 x 300 km: scoring, top-k candidate selection, the assignment
+solver and every follow-up round. Rows are generated in the shape the
+MatchingDAO queries return, so the database is not involved.
+
+Usage (from the repository root):
+    python tests/load-testing/matching-benchmark.py --needs 2000 --offers 20000 --types 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+# The app modules need a database URL at import time; nothing is queried
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from api_service.app.logic import MatchingLogic
+
+
+def make_rows(needs: int, offers: int, types: int, events: int, seed: int) -> tuple[list[tuple], list[tuple]]:
+    rng = random.Random(seed)
+    resource_types = [f"type-{i}" for i in range(types)]
+    sites = [(55.0 + rng.uniform(-1.4, 1.4), 10.0 + rng.uniform(-2.4, 2.4), rng.randint(1, 5)) for _ in range(events)]
+    need_rows = []
+    for need_id in range(1, needs + 1):
+        event_id = rng.randrange(events)
+        latitude, longitude, priority = sites[event_id]
+        need_rows.append((need_id, event_id, rng.choice(resource_types), rng.randint(1, 10), priority,
+                          latitude, longitude, 0))
+    need_rows.sort(key=lambda row: (row[1], row[2], row[0]))
+    offer_rows = []
+    for resource_id in range(1, offers + 1):
+        if rng.random() < 0.1:
+            latitude = longitude = None  # volunteer not deployed
+        else:
+            latitude, longitude, _ = sites[rng.randrange(events)]
+            latitude, longitude = latitude + rng.uniform(-0.05, 0.05), longitude + rng.uniform(-0.05, 0.05)
+        offer_rows.append((resource_id, rng.choice(resource_types), rng.randint(1, 10), latitude, longitude))
+    return need_rows, offer_rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--needs", type=int, default=2000)
+    parser.add_argument("--offers", type=int, default=20000)
+    parser.add_argument("--types", type=int, default=5, help="distinct resource types")
+    parser.add_argument("--events", type=int, default=300, help="distinct event locations")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    needs, offers = make_rows(args.needs, args.offers, args.types, args.events, args.seed)
+    MatchingLogic.match(needs, offers)  # warm up imports and caches
+
+    timings = []
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        proposals = MatchingLogic.match(needs, offers)
+        timings.append(time.perf_counter() - started)
+
+    matched_needs = len({proposal["need_id"] for proposal in proposals})
+    print(f"{args.needs} needs x {args.offers} offers, {args.types} types, {args.events} events")
+    print(f"proposals: {len(proposals)} offers for {matched_needs} needs")
+    print(f"median: {statistics.median(timings) * 1000:.1f} ms, best: {min(timings) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Response serialization microbenchmark for the event list.
+
+Times the work between "rows fetched" and "response body ready" for a page of
+events, per 1,000 events, for:
+
+  before        - EventResponse.model_validate per row, then FastAPI's
+                  response_model pass (dump, re-validate, encode) and the
+                  stdlib JSONResponse
+  orjson only   - the same models and response_model pass, rendered by
+                  ORJSONResponse (the app's default response class)
+  after         - EventLogic.event_payload dicts rendered by ORJSONResponse
+                  (what trusted_response does on the read routes)
+
+Usage (from the repository root):
+    python tests/load-testing/serialization-benchmark.py --events 1000 --repeat 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+# The app modules need a database URL at import time; nothing is queried
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from api_service.app.logic import EventLogic, LocationLogic
+from api_service.app.models import Event, Location
+from domain.schemas import EventResponse
+
+
+def make_rows(count: int) -> list[tuple[Event, Location, int]]:
+    now = datetime.utcnow()
+    return [
+        (
+            Event(id=i, description=f"Flooded basement {i}", create_time=now, modified_time=now,
+                  priority=i % 5 + 1, status="active", location_id=i),
+            Location(id=i, street="Nørregade 5", city="København", postcode="1165", country="Denmark",
+                     latitude=55.68 + i / 1e5, longitude=12.57 + i / 1e5),
+            i % 4,
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_event_response(event: Event, location: Location, volunteers_count: int) -> EventResponse:
+    """EventLogic.build_event_response as it was before the trusted read path."""
+    return EventResponse.model_validate({
+        **event.model_dump(),
+        "location": LocationLogic.validate_location_response(location),
+        "volunteers_count": volunteers_count,
+    })
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=1000, help="events per response")
+    parser.add_argument("--repeat", type=int, default=50, help="timed repetitions per path")
+    args = parser.parse_args()
+
+    rows = make_rows(args.events)
+    field = create_response_field(name="Response_get_events", type_=list[EventResponse])
+
+    def response_model_pass(models, response_class):
+        content = asyncio.run(serialize_response(field=field, response_content=models, is_coroutine=True))
+        return response_class(content).body
+
+    paths = {
+        "before": lambda: response_model_pass([legacy_event_response(*row) for row in rows], JSONResponse),
+        "orjson only": lambda: response_model_pass([legacy_event_response(*row) for row in rows], ORJSONResponse),
+        "after": lambda: ORJSONResponse([EventLogic.event_payload(*row) for row in rows]).body,
+    }
+
+    bodies = {name: json.loads(path()) for name, path in paths.items()}
+    assert bodies["before"] == bodies["after"] == bodies["orjson only"], "paths must produce the same JSON"
+
+    print(f"{args.events} events, {args.repeat} repetitions")
+    print(f"{'path':>12} | {'ms / 1,000 events':>17} | {'speed-up':>8}")
+    baseline = None
+    for name, path in paths.items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            path()
+        per_thousand = (time.perf_counter() - start) / args.repeat * 1000 * 1000 / args.events
+        baseline = baseline or per_thousand
+        print(f"{name:>12} | {per_thousand:>17.2f} | {baseline / per_thousand:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import asyncio
+import json
+from datetime import datetime
+
+from api_service.app.core.change_feed import ChangeFeed, change_feed, format_sse
+from api_service.app.data_access import EventDAO, LocationDAO
+from api_service.app.models import Event, Location
+
+
+def test_feed_fans_out_to_every_subscriber():
+    feed = ChangeFeed()
+
+    async def scenario():
+        first, second = feed.subscribe(), feed.subscribe()
+        feed.publish("event", "created", 1)
+        return await first.get(timeout=1), await second.get(timeout=1)
+
+    first, second = asyncio.run(scenario())
+    assert first == second
+    assert (first["entity"], first["action"], first["id"]) == ("event", "created", 1)
+
+
+def test_slow_subscriber_is_told_to_resync():
+    feed = ChangeFeed(max_pending=2)
+
+    async def scenario():
+        subscription = feed.subscribe()
+        for event_id in range(5):
+            feed.publish("event", "updated", event_id)
+        await asyncio.sleep(0)
+        received = []
+        while (change := await subscription.get(timeout=0.05)) is not None:
+            received.append(change)
+        feed.unsubscribe(subscription)
+        return received
+
+    received = asyncio.run(scenario())
+    assert received[0]["action"] == "resync"
+    assert feed.subscriber_count() == 0
+
+
+def test_dao_writes_publish_after_commit(db_session):
+    async def scenario():
+        subscription = change_feed.subscribe()
+        try:
+            location = await asyncio.to_thread(
+                LocationDAO.create_location, Location(latitude=1.0, longitude=2.0)
+            )
+            event = await asyncio.to_thread(
+                EventDAO.create_event,
+                Event(
+                    description="Feed",
+                    priority=1,
+                    status="active",
+                    location_id=location.id,
+                    create_time=datetime.now(),
+                    modified_time=datetime.now(),
+                ),
+            )
+            await asyncio.to_thread(EventDAO.delete_event, event.id)
+            return event.id, [await subscription.get(timeout=1), await subscription.get(timeout=1)]
+        finally:
+            change_feed.unsubscribe(subscription)
+
+    event_id, changes = asyncio.run(scenario())
+    assert [(c["entity"], c["action"], c["id"]) for c in changes] == [
+        ("event", "created", event_id),
+        ("event", "deleted", event_id),
+    ]
+
+
+def test_format_sse_emits_change_event():
+    message = format_sse({"seq": 7, "entity": "user", "action": "updated", "id": 3})
+    lines = message.strip().split("\n")
+    assert lines[0] == "id: 7"
+    assert lines[1] == "event: change"
+    assert json.loads(lines[2][len("data: "):])["entity"] == "user"
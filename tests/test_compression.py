@@ -0,0 +1,52 @@
+from api_service.app.core import compression
+from api_service.app.core.compression import negotiate_encoding
+
+EVENT = {
+    "description": "Compressible flood report",
+    "priority": 2,
+    "status": "active",
+    "location": {"latitude": 55.6761, "longitude": 12.5683},
+}
+
+
+def test_negotiation_honours_q_values(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", object())
+    assert negotiate_encoding("gzip, deflate, br") == "br"
+    assert negotiate_encoding("gzip;q=1.0, br;q=0.5") == "gzip"
+    assert negotiate_encoding("br;q=0, *") == "gzip"
+    assert negotiate_encoding("identity") is None
+
+    monkeypatch.setattr(compression, "brotli", None)
+    assert negotiate_encoding("br") is None
+    assert negotiate_encoding("br, gzip") == "gzip"
+
+
+def test_large_collections_are_gzipped(client):
+    for _ in range(20):
+        client.post("/events/", json=EVENT)
+
+    response = client.get("/events/", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert len(response.json()) == 20
+
+
+def test_small_or_unaccepted_responses_are_left_alone(client):
+    assert "content-encoding" not in client.get("/health", headers={"Accept-Encoding": "gzip"}).headers
+
+    for _ in range(20):
+        client.post("/events/", json=EVENT)
+    plain = client.get("/events/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert len(plain.json()) == 20
+
+
+def test_not_modified_stays_empty(client):
+    for _ in range(20):
+        client.post("/events/", json=EVENT)
+    etag = client.get("/events/").headers["ETag"]
+
+    response = client.get("/events/", headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+    assert response.status_code == 304
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,50 @@
+from sqlalchemy import event as sa_event
+
+from api_service.app import db
+
+EVENT = {
+    "description": "Dashboard flood",
+    "priority": 2,
+    "status": "active",
+    "location": {"latitude": 55.6761, "longitude": 12.5683},
+}
+
+
+def test_snapshot_matches_individual_endpoints(client):
+    client.post("/events/", json=EVENT)
+
+    snapshot = client.get("/dashboard/snapshot")
+    assert snapshot.status_code == 200
+    body = snapshot.json()
+    assert set(body) == {"events", "volunteers", "users", "stats", "resources_needed", "resources_available"}
+    assert body["events"] == client.get("/events/").json()
+    assert body["users"] == client.get("/users/").json()
+    assert body["stats"] == client.get("/stats/").json()
+
+
+def test_snapshot_uses_one_statement_per_section(client):
+    client.post("/events/", json=EVENT)
+    statements = []
+    sa_event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    client.get("/dashboard/snapshot")
+    assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 6
+
+    # Served from the shared cache until the TTL runs out
+    statements.clear()
+    client.get("/dashboard/snapshot")
+    assert statements == []
+
+
+def test_sections_and_field_selection(client):
+    client.post("/events/", json=EVENT)
+
+    body = client.get("/dashboard/snapshot", params={"sections": "events,stats", "fields": "events.id,events.status"}).json()
+    assert set(body) == {"events", "stats"}
+    assert all(set(row) == {"id", "status"} for row in body["events"])
+    assert body["stats"]["activeEvents"] == 1
+
+
+def test_unknown_section_is_rejected(client):
+    response = client.get("/dashboard/snapshot", params={"sections": "notifications"})
+    assert response.status_code == 400
@@ -0,0 +1,84 @@
+import uuid
+
+import pytest
+
+
+def _create_event(client, latitude, priority=1):
+    response = client.post("/events/", json={
+        "description": "Dispatch event",
+        "priority": priority,
+        "status": "active",
+        "location": {"latitude": latitude, "longitude": 12.0},
+    })
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_user(client, name):
+    response = client.post("/auth/register", json={
+        "name": name,
+        "email": f"dispatch_{uuid.uuid4().hex[:8]}@test.com",
+        "phonenumber": "+4500000010",
+        "password": "password123",
+        "role": "SUV",
+    })
+    assert response.status_code in (200, 201)
+    return response.json()["id"]
+
+
+def _deploy(client, user_id, latitude):
+    """Give the user a finished deployment near ``latitude``, which becomes their last known location."""
+    volunteer = client.post("/volunteers/", json={
+        "user_id": user_id, "event_id": _create_event(client, latitude, priority=5), "status": "completed",
+    })
+    assert volunteer.status_code == 201
+    return volunteer.json()["id"]
+
+
+@pytest.fixture
+def scenario(client):
+    target = _create_event(client, 55.0)
+    client.post("/resources/needed/", json={
+        "name": "First aid", "resource_type": "medical", "description": "Kits",
+        "quantity": 5, "is_fulfilled": False, "event_id": target,
+    })
+    near, far, unknown = _create_user(client, "Near"), _create_user(client, "Far"), _create_user(client, "Unknown")
+    client.post("/resources/available/", json={
+        "name": "Kits", "resource_type": "medical", "quantity": 5, "description": "First aid kits",
+        "status": "available", "volunteer_id": _deploy(client, near, 55.01), "is_allocated": False,
+    })
+    _deploy(client, far, 56.5)
+    return target, near, far, unknown
+
+
+def test_candidates_are_ranked_by_distance_workload_and_resources(client, scenario):
+    target, near, far, unknown = scenario
+    response = client.get(f"/events/{target}/dispatch/candidates")
+    assert response.status_code == 200
+    candidates = response.json()
+    assert [c["user_id"] for c in candidates] == [near, unknown, far]
+    assert candidates[0]["resource_types"] == ["medical"]
+    assert 1.0 < candidates[0]["distance_km"] < 1.2
+    assert candidates[1]["distance_km"] is None
+
+    # Without the distance term the unmatched users tie and fall back to id order
+    unweighted = client.get(f"/events/{target}/dispatch/candidates", params={"weight_distance": 0, "limit": 2}).json()
+    assert [c["user_id"] for c in unweighted] == [near, far]
+
+
+def test_bulk_assign_creates_all_volunteers_or_none(client, scenario):
+    target, near, far, unknown = scenario
+
+    rejected = client.post(f"/events/{target}/dispatch", json={"user_ids": [near, 999999]})
+    assert rejected.status_code == 400
+    assert client.get("/volunteers/", params={"event_id": target}).json() == []
+
+    response = client.post(f"/events/{target}/dispatch", json={"user_ids": [near, unknown]})
+    assert response.status_code == 201
+    volunteers = response.json()
+    assert [v["user"]["id"] for v in volunteers] == [near, unknown]
+    assert all(v["event_id"] == target and v["user"]["status"] == "assigned" for v in volunteers)
+
+    assert [c["user_id"] for c in client.get(f"/events/{target}/dispatch/candidates").json()] == [far]
+    assert client.post(f"/events/{target}/dispatch", json={"user_ids": [near]}).status_code == 400
+    assert client.get("/events/999999/dispatch/candidates").status_code == 404
@@ -1,5 +1,9 @@
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event as sa_event
+
+from api_service.app import db
+from api_service.app.logic import EventLogic
 
 @pytest.fixture
 def sample_event():
@@ -145,3 +149,130 @@ class TestEvents:
     def test_ingest_event_invalid_payload_returns_400(self, client):
         resp = client.post("/events/ingest", json={"bad": "payload"})
         assert resp.status_code == 400
+
+    def test_list_events_includes_active_volunteer_counts(self, client, sample_event):
+        busy = client.post("/events/", json=sample_event).json()
+        idle = client.post("/events/", json=sample_event).json()
+
+        user_ids = []
+        for idx in range(2):
+            resp = client.post(
+                "/auth/register",
+                json={
+                    "name": f"Counter {idx}",
+                    "email": f"counter_{idx}_{busy['id']}@test.com",
+                    "phonenumber": "+4500000000",
+                    "password": "password123",
+                },
+            )
+            user_ids.append(resp.json()["id"])
+
+        client.post("/volunteers/", json={"user_id": user_ids[0], "event_id": busy["id"], "status": "active"})
+        client.post("/volunteers/", json={"user_id": user_ids[1], "event_id": busy["id"], "status": "active"})
+        client.post("/volunteers/", json={"user_id": user_ids[1], "event_id": busy["id"], "status": "completed"})
+
+        listed = {ev["id"]: ev for ev in client.get("/events/").json()}
+        assert listed[busy["id"]]["volunteers_count"] == 2
+        assert listed[idle["id"]]["volunteers_count"] == 0
+        assert listed[busy["id"]]["location"]["latitude"] == sample_event["location"]["latitude"]
+        assert client.get(f"/events/{busy['id']}").json()["volunteers_count"] == 2
+
+    def test_bulk_ingest_reports_per_item_results(self, client):
+        items = [
+            {
+                "event": {
+                    "description": "Bulk A",
+                    "priority": 1,
+                    "status": "active",
+                    "location": {"latitude": 1.0, "longitude": 2.0},
+                    "resources_needed": [
+                        {"name": "Water", "resource_type": "supply", "description": "Bottled", "quantity": 3},
+                        {"name": "Tents", "resource_type": "shelter", "description": "Family", "quantity": 1},
+                    ],
+                }
+            },
+            {"description": "Missing priority", "status": "active", "location": {"latitude": 0, "longitude": 0}},
+            {"description": "Bulk B", "priority": 4, "status": "pending", "location": {"latitude": 3.0, "longitude": 4.0}},
+        ]
+
+        resp = client.post("/events/ingest/bulk", json=items)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert (body["created"], body["failed"]) == (2, 1)
+        assert [r["status"] for r in body["results"]] == ["created", "error", "created"]
+
+        first_id = body["results"][0]["event_id"]
+        event = client.get(f"/events/{first_id}").json()
+        assert event["description"] == "Bulk A"
+        assert event["location"]["latitude"] == 1.0
+        needed = client.get(f"/resources/needed/?event_id={first_id}").json()
+        assert sorted(r["name"] for r in needed) == ["Tents", "Water"]
+
+    def test_bulk_ingest_accepts_ndjson(self, client):
+        lines = "\n".join(
+            '{"description": "Line %d", "priority": 2, "status": "active", '
+            '"location": {"latitude": %d, "longitude": 0}}' % (idx, idx)
+            for idx in range(3)
+        )
+        resp = client.post(
+            "/events/ingest/bulk",
+            content=lines,
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        assert resp.status_code == 200
+        assert resp.json()["created"] == 3
+
+    def test_bulk_ingest_rejects_non_array(self, client):
+        resp = client.post("/events/ingest/bulk", json={"event": {}})
+        assert resp.status_code == 400
+
+    def test_update_event_uses_one_connection_and_one_commit(self, client, sample_event):
+        created = client.post("/events/", json=sample_event).json()
+        checkouts, commits = [], []
+        # Listeners die with the per-test engine
+        sa_event.listen(db.engine, "checkout", lambda *args: checkouts.append(1))
+        sa_event.listen(db.engine, "commit", lambda *args: commits.append(1))
+
+        response = client.put(f"/events/{created['id']}", json={
+            "description": "Updated in one transaction",
+            "status": "completed",
+            "location": {"latitude": 56.0, "longitude": 10.0},
+        })
+        assert response.status_code == 200
+        assert response.json()["description"] == "Updated in one transaction"
+        assert len(checkouts) == 1
+        assert len(commits) == 1
+
+    def test_list_events_supports_conditional_get(self, client, sample_event):
+        event = client.post("/events/", json=sample_event).json()
+        first = client.get("/events/")
+        etag = first.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert "Last-Modified" in first.headers
+
+        cached = client.get("/events/", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+
+        # Assigning a volunteer changes the embedded volunteers_count, so the list ETag moves
+        user = client.post(
+            "/auth/register",
+            json={"name": "Etag", "email": "etag@test.com", "phonenumber": "+4500000000", "password": "password123"},
+        ).json()
+        client.post("/volunteers/", json={"user_id": user["id"], "event_id": event["id"], "status": "active"})
+
+        changed = client.get("/events/", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+
+    def test_failed_write_does_not_change_etag(self, client):
+        etag = client.get("/events/").headers["ETag"]
+        assert client.put("/events/999999", json={"status": "active"}).status_code == 404
+        assert client.get("/events/", headers={"If-None-Match": etag}).status_code == 304
+
+    def test_trusted_read_path_matches_validated_response(self, client, sample_event):
+        created = client.post("/events/", json=sample_event).json()
+        validated = EventLogic.get_event(created["id"]).model_dump(mode="json")
+        assert client.get(f"/events/{created['id']}").json() == validated
+        assert client.get("/events/").json() == [validated]
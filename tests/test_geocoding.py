@@ -0,0 +1,92 @@
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from api_service.app.clients import GeocodingCache, OSMClient
+from api_service.app.data_access import GeocodeCacheDAO
+from api_service.app.models import GeocodeCacheEntry
+
+
+class StubNominatim(BaseHTTPRequestHandler):
+    """Minimal stand-in for the Nominatim search endpoint."""
+
+    known = {"nørregade 5, københavn": {"lat": "55.68", "lon": "12.57"}}
+    requests_seen: list[str] = []
+    fail = False
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)["q"][0]
+        StubNominatim.requests_seen.append(query)
+        if StubNominatim.fail:
+            self.send_response(503)
+            self.end_headers()
+            return
+        match = StubNominatim.known.get(query.lower())
+        body = json.dumps([match] if match else []).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def nominatim(db_session, monkeypatch):
+    server = HTTPServer(("127.0.0.1", 0), StubNominatim)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(OSMClient, "BASE_URL", f"http://127.0.0.1:{server.server_port}/search")
+    StubNominatim.requests_seen = []
+    StubNominatim.fail = False
+    GeocodingCache.memory.clear()
+    yield StubNominatim
+    GeocodingCache.memory.clear()
+    server.shutdown()
+    server.server_close()
+
+
+def test_repeat_addresses_are_served_from_memory(nominatim):
+    assert GeocodingCache.get_coordinates("Nørregade 5, København") == (55.68, 12.57)
+    assert GeocodingCache.get_coordinates("nørregade  5 , KØBENHAVN") == (55.68, 12.57)
+    assert len(nominatim.requests_seen) == 1
+
+
+def test_persistent_table_survives_memory_eviction(nominatim):
+    GeocodingCache.get_coordinates("Nørregade 5, København")
+    GeocodingCache.memory.clear()
+
+    assert GeocodingCache.get_coordinates("Nørregade 5, København") == (55.68, 12.57)
+    assert len(nominatim.requests_seen) == 1
+
+
+def test_unknown_addresses_are_negatively_cached(nominatim):
+    assert GeocodingCache.get_coordinates("Nowhere 1, Atlantis") is None
+    GeocodingCache.memory.clear()
+    assert GeocodingCache.get_coordinates("Nowhere 1, Atlantis") is None
+    assert len(nominatim.requests_seen) == 1
+
+
+def test_upstream_failures_are_not_cached(nominatim):
+    nominatim.fail = True
+    assert GeocodingCache.get_coordinates("Nørregade 5, København") is None
+
+    nominatim.fail = False
+    assert GeocodingCache.get_coordinates("Nørregade 5, København") == (55.68, 12.57)
+    assert len(nominatim.requests_seen) == 2
+
+
+def test_saving_an_existing_address_replaces_the_entry(db_session):
+    later = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+    # A worker that lost the race writes the same address again; the upsert lets it win
+    GeocodeCacheDAO.save_entry(GeocodeCacheEntry(address="algade 1", latitude=None, longitude=None, expires_at=later))
+    GeocodeCacheDAO.save_entry(GeocodeCacheEntry(address="algade 1", latitude=57.0, longitude=9.9, expires_at=later))
+
+    entry = GeocodeCacheDAO.get_entry("algade 1")
+    assert (entry.latitude, entry.longitude) == (57.0, 9.9)
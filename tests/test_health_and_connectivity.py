@@ -1,10 +1,18 @@
+import asyncio
+import threading
 import uuid
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 from api_service.app.main import app
+from api_service.app.auth import jwt_handler
 from api_service.app.auth.jwt_handler import decode_access_token
+from api_service.app.core.config import Settings
+from api_service.app.data_access import UserDAO
+from api_service.app.db import unit_of_work
+from api_service.app.models import User
 
 
 @pytest.fixture
@@ -129,6 +137,67 @@ def test_auth_token_contains_role_and_sub(client: TestClient):
     assert decoded["role"] == role
 
 
+def _register_and_login(client: TestClient, role: str = "SUV") -> tuple[dict, str]:
+    email = f"cache_{uuid.uuid4().hex[:8]}@test.com"
+    user = client.post("/auth/register", json={
+        "name": "Cache User",
+        "email": email,
+        "phonenumber": "+4500000015",
+        "password": "password123",
+        "role": role,
+    }).json()
+    token = client.post("/auth/login", json={"email": email, "password": "password123"}).json()["access_token"]
+    return user, token
+
+
+def test_tokens_are_verified_once_per_process(client: TestClient, monkeypatch):
+    _, token = _register_and_login(client)
+    calls = []
+    real_decode = jwt_handler.jwt.decode
+    monkeypatch.setattr(jwt_handler.jwt, "decode", lambda *a, **kw: calls.append(1) or real_decode(*a, **kw))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for _ in range(3):
+        assert client.get("/events/", headers=headers).status_code == 200
+    assert len(calls) == 1
+
+
+def test_wrong_role_is_forbidden(client: TestClient):
+    _, token = _register_and_login(client, role="SUV")
+    response = client.get("/stats/", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 403
+
+
+def test_current_user_cache_is_invalidated_on_update(client: TestClient):
+    user, token = _register_and_login(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/auth/me", headers=headers).json()["name"] == "Cache User"
+
+    client.put(f"/users/{user['id']}", json={"name": "Renamed User"})
+    assert client.get("/auth/me", headers=headers).json()["name"] == "Renamed User"
+
+    client.delete(f"/users/{user['id']}")
+    assert client.get("/auth/me", headers=headers).status_code == 401
+
+
+def test_current_user_cache_is_evicted_after_commit(client: TestClient):
+    user, _ = _register_and_login(client)
+
+    def concurrent_lookup():
+        # A new thread has no unit of work, so it reads the last committed row
+        thread = threading.Thread(target=lambda: seen.append(UserDAO.get_user_by_email_cached(user["email"]).name))
+        thread.start()
+        thread.join()
+
+    seen = []
+    with unit_of_work() as session:
+        UserDAO.update_user(user["id"], User(name="Renamed User"))
+        concurrent_lookup()
+        session.commit()
+    concurrent_lookup()
+    assert seen == ["Cache User", "Renamed User"]
+
+
 def test_stats_counts_match_seeded_data(client: TestClient):
     # Seed one active event with a location
     event_payload = {
@@ -180,3 +249,130 @@ def test_stats_counts_match_seeded_data(client: TestClient):
     }
 
 
+
+
+def test_stats_are_served_from_cache_within_ttl(client: TestClient):
+    assert client.get("/stats/").json()["activeEvents"] == 0
+
+    client.post("/events/", json={
+        "description": "Cached Event",
+        "priority": 2,
+        "status": "active",
+        "location": {"latitude": 1.0, "longitude": 2.0},
+    })
+
+    # Still inside the TTL window: the shared cached numbers are returned
+    assert client.get("/stats/").json()["activeEvents"] == 0
+
+
+def test_stats_snapshots_can_be_read_back(client: TestClient):
+    before = "2000-01-01T00:00:00"
+    assert client.get("/stats/", params={"at": before}).status_code == 404
+
+    live = client.get("/stats/").json()
+    snapshot = client.get("/stats/", params={"at": "2999-01-01T00:00:00Z"})
+    assert snapshot.status_code == 200
+    assert snapshot.json() == live
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("postgresql://u:p@db:5432/mayday", "postgresql+asyncpg://u:p@db:5432/mayday"),
+    ("postgresql+psycopg2://u:p@db/mayday", "postgresql+asyncpg://u:p@db/mayday"),
+    ("sqlite:///./test.db", "sqlite+aiosqlite:///./test.db"),
+])
+def test_async_database_url_uses_async_driver(url: str, expected: str):
+    assert Settings(DATABASE_URL=url).async_database_url_computed == expected
+
+
+def test_async_routes_serve_concurrent_reads(client: TestClient):
+    created = client.post("/events/", json={
+        "description": "Concurrent Event",
+        "priority": 2,
+        "status": "active",
+        "location": {"latitude": 1.0, "longitude": 2.0},
+    }).json()
+
+    async def scenario():
+        async with httpx.AsyncClient(app=app, base_url="http://test", headers=client.headers) as async_client:
+            return await asyncio.gather(
+                *(async_client.get(f"/events/{created['id']}") for _ in range(10)),
+                async_client.get("/events/"),
+                async_client.get("/health"),
+            )
+
+    *details, listing, health = asyncio.run(scenario())
+    assert all(r.status_code == 200 and r.json()["id"] == created["id"] for r in details)
+    assert [e["id"] for e in listing.json()] == [created["id"]]
+    assert health.json() == {"database": "ok"}
+
+
+def test_pool_endpoint_reports_engine_pools(client: TestClient):
+    response = client.get("/health/pool")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["pgbouncer_mode"] is False
+    assert "pool" in data["sync"]
+
+
+def test_sync_and_async_engines_have_their_own_pool_sizes(monkeypatch):
+    from api_service.app.core.config import settings
+    from api_service.app.db import engine_options
+
+    for name, value in {"DB_POOL_SIZE": 3, "DB_MAX_OVERFLOW": 4, "DB_ASYNC_POOL_SIZE": 1, "DB_ASYNC_MAX_OVERFLOW": 2}.items():
+        monkeypatch.setattr(settings, name, value)
+    sync = engine_options("postgresql+psycopg2://u:p@db/app")
+    asynchronous = engine_options("postgresql+asyncpg://u:p@db/app", asynchronous=True)
+    assert (sync["pool_size"], sync["max_overflow"]) == (3, 4)
+    assert (asynchronous["pool_size"], asynchronous["max_overflow"]) == (1, 2)
+
+
+def test_instrumented_pool_records_checkout_waits(tmp_path):
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.exc import TimeoutError
+    from api_service.app.core.pool import InstrumentedQueuePool, pool_status
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool,
+                           pool_size=2, max_overflow=0, pool_timeout=0.05)
+    first, second = engine.connect(), engine.connect()
+    with pytest.raises(TimeoutError):
+        engine.connect()  # pool exhausted: waits pool_timeout, then gives up
+    first.close()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    second.close()
+
+    status = pool_status(engine.pool)
+    assert status["size"] == 2
+    assert status["checked_out"] == 0
+    wait = status["checkout_wait"]
+    assert wait["count"] == 3
+    assert wait["timeouts"] == 1
+    assert wait["buckets_ms"]["+Inf"] == 3
+    engine.dispose()
+
+
+def test_login_rehashes_password_when_bcrypt_cost_changes(client: TestClient, monkeypatch):
+    from api_service.app.core.config import settings
+    from api_service.app.data_access import UserDAO
+
+    user, _ = _register_and_login(client)
+    assert UserDAO.get_user(user["id"]).password.startswith("$2b$04$")
+
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    login = client.post("/auth/login", json={"email": user["email"], "password": "password123"})
+    assert login.status_code == 200
+    assert UserDAO.get_user(user["id"]).password.startswith("$2b$05$")
+
+
+def test_password_hashing_runs_in_worker_processes(monkeypatch):
+    from api_service.app.auth import hashing
+    from api_service.app.core.config import settings
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+    try:
+        hashed = hashing.hash_password("password123")
+        assert hashing.verify_password("password123", hashed)
+        assert asyncio.run(hashing.verify_and_update_password_async("wrong", hashed)) == (False, None)
+        assert hashing.start_hash_pool() is not None
+    finally:
+        hashing.shutdown_hash_pool()
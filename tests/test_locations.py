@@ -0,0 +1,134 @@
+import pytest
+
+from api_service.app.core.geo import covering_cells, encode_geohash, haversine_km, prefix_upper_bound
+from api_service.app.data_access import LocationDAO
+from api_service.app.models import Location
+
+COPENHAGEN = (55.6761, 12.5683)
+MALMO = (55.6050, 13.0038)  # ~28 km from Copenhagen
+AARHUS = (56.1629, 10.2039)  # ~157 km from Copenhagen
+
+
+def _event_payload(latitude, longitude, description="Geo Event"):
+    return {
+        "description": description,
+        "priority": 2,
+        "status": "active",
+        "location": {"latitude": latitude, "longitude": longitude},
+    }
+
+
+@pytest.fixture
+def geo_events(client):
+    ids = {}
+    for name, (lat, lon) in {"copenhagen": COPENHAGEN, "malmo": MALMO, "aarhus": AARHUS}.items():
+        ids[name] = client.post("/events/", json=_event_payload(lat, lon, name)).json()["id"]
+    return ids
+
+
+class TestGeohash:
+    def test_encode_matches_reference_value(self):
+        assert encode_geohash(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+    def test_covering_cells_contain_points_inside_box(self):
+        cells = covering_cells(55.5, 12.3, 55.8, 13.1)
+        assert 0 < len(cells) <= 32
+        for lat, lon in (COPENHAGEN, MALMO):
+            assert any(encode_geohash(lat, lon).startswith(cell) for cell in cells)
+
+    def test_prefix_bound_holds_under_locale_collation(self):
+        # Like glibc's en_US.utf8 (Postgres' default), rank punctuation below
+        # digits and letters; a "{" sentinel bound would select nothing here
+        def locale_key(text):
+            return [(0 if not ch.isalnum() else 1 if ch.isdigit() else 2, ch) for ch in text]
+
+        hashes = [encode_geohash(lat / 7.0, lon / 3.0, 5) for lat in range(-600, 600, 37) for lon in range(-520, 520, 41)]
+        for prefix in ("u", "u4p", "9z", "zz", "b0"):
+            bound = prefix_upper_bound(prefix)
+            for geohash in hashes:
+                in_range = locale_key(geohash) >= locale_key(prefix) and (
+                    bound is None or locale_key(geohash) < locale_key(bound)
+                )
+                assert in_range == geohash.startswith(prefix)
+        assert prefix_upper_bound("u4p") == "u4q"
+        assert prefix_upper_bound("9z") == "b"
+        assert prefix_upper_bound("zz") is None
+
+    def test_haversine_distance(self):
+        assert haversine_km(*COPENHAGEN, *MALMO) == pytest.approx(28, abs=2)
+
+
+class TestSpatialQueries:
+    def test_events_nearby_are_sorted_by_distance(self, client, geo_events):
+        resp = client.get(
+            "/events/nearby",
+            params={"latitude": COPENHAGEN[0], "longitude": COPENHAGEN[1], "radius_km": 50},
+        )
+        assert resp.status_code == 200
+        assert [ev["id"] for ev in resp.json()] == [geo_events["copenhagen"], geo_events["malmo"]]
+
+    def test_nearby_limit_keeps_the_nearest(self, client, geo_events, monkeypatch):
+        # Without overfetch the database returns exactly ``limit`` candidates,
+        # so the result shows the SQL ordering is nearest first
+        monkeypatch.setattr(LocationDAO, "NEARBY_OVERFETCH", 1)
+        params = {"latitude": AARHUS[0], "longitude": AARHUS[1], "radius_km": 500, "limit": 2}
+        resp = client.get("/events/nearby", params=params)
+        assert [ev["id"] for ev in resp.json()] == [geo_events["aarhus"], geo_events["copenhagen"]]
+        locations = client.get("/locations/nearby", params=params).json()
+        assert [loc["latitude"] for loc in locations] == [AARHUS[0], COPENHAGEN[0]]
+
+    def test_events_within_bbox(self, client, geo_events):
+        resp = client.get(
+            "/events/within",
+            params={"min_lat": 55.9, "min_lon": 9.5, "max_lat": 56.5, "max_lon": 11.0},
+        )
+        assert resp.status_code == 200
+        assert [ev["id"] for ev in resp.json()] == [geo_events["aarhus"]]
+
+    def test_locations_nearby_and_within(self, client, geo_events):
+        nearby = client.get(
+            "/locations/nearby",
+            params={"latitude": AARHUS[0], "longitude": AARHUS[1], "radius_km": 10},
+        )
+        assert nearby.status_code == 200
+        assert [loc["latitude"] for loc in nearby.json()] == [AARHUS[0]]
+
+        within = client.get(
+            "/locations/within",
+            params={"min_lat": 55.0, "min_lon": 12.0, "max_lat": 56.0, "max_lon": 13.5},
+        )
+        assert sorted(loc["latitude"] for loc in within.json()) == sorted([COPENHAGEN[0], MALMO[0]])
+
+    def test_inverted_bbox_returns_400(self, client):
+        resp = client.get(
+            "/events/within",
+            params={"min_lat": 56.0, "min_lon": 9.5, "max_lat": 55.0, "max_lon": 11.0},
+        )
+        assert resp.status_code == 400
+
+
+class TestAddressIndex:
+    def test_full_address_lookup_uses_token_candidates(self, db_session):
+        target = LocationDAO.create_location(
+            Location(street="Nørregade 5", city="København K", postcode="1165", country="Denmark",
+                     latitude=55.68, longitude=12.57)
+        )
+        LocationDAO.create_location(
+            Location(street="Vestergade 12", city="Aarhus", postcode="8000", country="Denmark",
+                     latitude=56.15, longitude=10.20)
+        )
+
+        match = LocationDAO.get_location_by_full_address("nørregade 5,  1165 KØBENHAVN K")
+        assert match is not None and match.id == target.id
+        assert LocationDAO.get_location_by_full_address("Strandvejen 100, Hellerup") is None
+
+    def test_common_tokens_are_skipped_as_stop_words(self, db_session, monkeypatch):
+        monkeypatch.setattr(LocationDAO, "MAX_TOKEN_POSTINGS", 1)
+        for street in ("Algade 1", "Algade 2"):
+            LocationDAO.create_location(
+                Location(street=street, city="Aalborg", country="Denmark", latitude=57.0, longitude=9.9)
+            )
+
+        # "algade", "aalborg" and "denmark" each match two rows; only the house number narrows
+        match = LocationDAO.get_location_by_full_address("Algade 2, Aalborg, Denmark")
+        assert match is not None and match.street == "Algade 2"
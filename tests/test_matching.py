@@ -0,0 +1,91 @@
+import uuid
+
+from api_service.app.core.config import settings
+from api_service.app.logic import MatchingLogic
+
+
+def need(need_id, priority=3, quantity=1, latitude=55.0, longitude=12.0, event_id=None, resource_type="water", spare=0):
+    return (need_id, event_id or need_id, resource_type, quantity, priority, latitude, longitude, spare)
+
+
+def offer(resource_id, quantity=1, latitude=55.0, longitude=12.0, resource_type="water"):
+    return (resource_id, resource_type, quantity, latitude, longitude)
+
+
+def test_prefers_the_nearest_offer():
+    proposals = MatchingLogic.match([need(1)], [offer(10, latitude=56.0), offer(11, latitude=55.01)])
+    assert [(p["need_id"], p["resource_id"]) for p in proposals] == [(1, 11)]
+    assert 1.0 < proposals[0]["distance_km"] < 1.2
+
+
+def test_contested_offer_goes_to_the_most_urgent_need():
+    proposals = MatchingLogic.match([need(1, priority=5), need(2, priority=1)], [offer(10)])
+    assert [(p["need_id"], p["resource_id"]) for p in proposals] == [(2, 10)]
+
+
+def test_needs_take_several_offers_and_respect_type_distance_and_spare():
+    needs = [
+        need(1, quantity=3),
+        need(2, quantity=2, spare=2),  # already covered by an earlier allocation
+        need(3, resource_type="medical"),
+    ]
+    offers = [offer(10), offer(11), offer(12), offer(13, latitude=70.0, resource_type="medical")]
+    proposals = MatchingLogic.match(needs, offers)
+    assert sorted((p["need_id"], p["resource_id"]) for p in proposals) == [(1, 10), (1, 11), (1, 12)]
+
+
+def test_low_priority_need_takes_partial_unlocated_offers():
+    offers = [offer(10 + i, quantity=2, latitude=None, longitude=None) for i in range(5)]
+    proposals = MatchingLogic.match([need(1, priority=5, quantity=10)], offers)
+    # The need takes one offer per round even though each covers only a fifth of it
+    assert len(proposals) == settings.MATCHING_MAX_ROUNDS
+    assert {p["need_id"] for p in proposals} == {1}
+    assert all(p["score"] > 0 for p in proposals)
+
+
+def _create_event(client, latitude):
+    response = client.post("/events/", json={
+        "description": "Matching event",
+        "priority": 1,
+        "status": "active",
+        "location": {"latitude": latitude, "longitude": 12.0},
+    })
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def test_propose_and_apply(client):
+    target = _create_event(client, 55.0)
+    staging = _create_event(client, 55.05)
+    user = client.post("/auth/register", json={
+        "name": "Matcher",
+        "email": f"matcher_{uuid.uuid4().hex[:8]}@test.com",
+        "phonenumber": "+4500000009",
+        "password": "password123",
+        "role": "SUV",
+    }).json()
+    volunteer = client.post("/volunteers/", json={"user_id": user["id"], "event_id": staging, "status": "active"}).json()
+    needed = client.post("/resources/needed/", json={
+        "name": "Drinking water", "resource_type": "water", "description": "Pallets",
+        "quantity": 2, "is_fulfilled": False, "event_id": target,
+    }).json()
+    resource = client.post("/resources/available/", json={
+        "name": "Water pallets", "resource_type": "water", "quantity": 2, "description": "Pallets",
+        "status": "available", "volunteer_id": volunteer["id"], "is_allocated": False,
+    }).json()
+
+    proposals = client.get("/resources/matches/").json()
+    assert [(p["need_id"], p["resource_id"]) for p in proposals] == [(needed["id"], resource["id"])]
+
+    matches = [{"need_id": p["need_id"], "resource_id": p["resource_id"]} for p in proposals]
+    applied = client.post("/resources/matches/apply", json={"matches": matches})
+    assert applied.status_code == 200
+    assert applied.json() == {"allocated": [resource["id"]], "skipped": [], "fulfilled_needs": [needed["id"]]}
+
+    allocated = client.get(f"/resources/available/{resource['id']}").json()
+    assert (allocated["event_id"], allocated["is_allocated"], allocated["status"]) == (target, True, "in_use")
+    assert client.get(f"/resources/needed/{needed['id']}").json()["is_fulfilled"] is True
+    assert client.get("/resources/matches/").json() == []
+
+    again = client.post("/resources/matches/apply", json={"matches": matches}).json()
+    assert again == {"allocated": [], "skipped": [resource["id"]], "fulfilled_needs": []}
@@ -135,4 +135,48 @@ class TestResources:
 
     def test_delete_resource_needed_not_found(self, client):
         resp = client.delete("/resources/needed/999999")
-        assert resp.status_code == 404
\ No newline at end of file
+        assert resp.status_code == 404
+
+    def test_available_resources_keyset_pagination_and_filters(self, client, sample_resource):
+        created_ids = []
+        for idx in range(3):
+            payload = dict(sample_resource, resource_type="vehicle" if idx < 2 else "supply")
+            created_ids.append(client.post("/resources/available/", json=payload).json()["id"])
+
+        first_page = client.get("/resources/available/?limit=2")
+        assert [r["id"] for r in first_page.json()] == created_ids[:2]
+        cursor = first_page.headers["X-Next-Cursor"]
+        assert cursor == str(created_ids[1])
+
+        second_page = client.get(f"/resources/available/?limit=2&after_id={cursor}")
+        assert [r["id"] for r in second_page.json()] == created_ids[2:]
+        assert "X-Next-Cursor" not in second_page.headers
+
+        supplies = client.get("/resources/available/?resource_type=supply&is_allocated=false").json()
+        assert [r["id"] for r in supplies] == created_ids[2:]
+
+    def test_needed_resources_filter_by_event_and_fulfillment(self, client):
+        event_payload = {
+            "description": "Filter Event",
+            "priority": 1,
+            "status": "active",
+            "location": {"latitude": 0.0, "longitude": 0.0},
+        }
+        event_ids = [client.post("/events/", json=event_payload).json()["id"] for _ in range(2)]
+        for event_id, fulfilled in ((event_ids[0], False), (event_ids[0], True), (event_ids[1], False)):
+            client.post(
+                "/resources/needed/",
+                json={
+                    "name": "Food",
+                    "resource_type": "supply",
+                    "description": "Meals",
+                    "quantity": 1,
+                    "is_fulfilled": fulfilled,
+                    "event_id": event_id,
+                },
+            )
+
+        open_needs = client.get(f"/resources/needed/?event_id={event_ids[0]}&is_fulfilled=false").json()
+        assert len(open_needs) == 1
+        assert open_needs[0]["event_id"] == event_ids[0]
+        assert open_needs[0]["is_fulfilled"] is False
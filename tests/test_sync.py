@@ -0,0 +1,96 @@
+import pytest
+
+from api_service.app.core.config import settings
+from api_service.app.logic import VolunteerLogic
+
+EVENT = {
+    "description": "Sync flood",
+    "priority": 2,
+    "status": "active",
+    "location": {"latitude": 55.6761, "longitude": 12.5683},
+}
+
+
+@pytest.fixture
+def no_overlap(monkeypatch):
+    monkeypatch.setattr(settings, "SYNC_OVERLAP_SECONDS", 0.0)
+
+
+def test_full_snapshot_without_cursor(client):
+    event = client.post("/events/", json=EVENT).json()
+
+    body = client.get("/sync").json()
+    assert [e["id"] for e in body["events"]] == [event["id"]]
+    assert body["users"]  # at least the seeded administrator
+    assert body["deleted"] == []
+    assert body["cursor"]
+
+
+def test_delta_contains_only_rows_changed_after_cursor(client, no_overlap):
+    untouched = client.post("/events/", json=EVENT).json()
+    busy = client.post("/events/", json=EVENT).json()
+    user = client.post(
+        "/auth/register",
+        json={"name": "Syncer", "email": "syncer@test.com", "phonenumber": "+4500000000", "password": "password123"},
+    ).json()
+    cursor = client.get("/sync").json()["cursor"]
+
+    volunteer = client.post("/volunteers/", json={"user_id": user["id"], "event_id": busy["id"], "status": "active"}).json()
+
+    delta = client.get("/sync", params={"since": cursor}).json()
+    assert [e["id"] for e in delta["events"]] == [busy["id"]]
+    assert untouched["id"] not in [e["id"] for e in delta["events"]]
+    assert [v["id"] for v in delta["volunteers"]] == [volunteer["id"]]
+    # The assignment flips the user's status, so the user row is part of the delta too
+    assert [(u["id"], u["status"]) for u in delta["users"]] == [(user["id"], "assigned")]
+
+    again = client.get("/sync", params={"since": delta["cursor"]}).json()
+    assert again["events"] == again["volunteers"] == again["users"] == []
+
+
+def test_volunteer_changes_resend_their_event(client, no_overlap):
+    event = client.post("/events/", json=EVENT).json()
+    user = client.post(
+        "/auth/register",
+        json={"name": "Helper", "email": "helper@test.com", "phonenumber": "+4500000001", "password": "password123"},
+    ).json()
+    cursor = client.get("/sync").json()["cursor"]
+
+    def event_counts():
+        nonlocal cursor
+        delta = client.get("/sync", params={"since": cursor}).json()
+        cursor = delta["cursor"]
+        return [(e["id"], e["volunteers_count"]) for e in delta["events"]], delta["deleted"]
+
+    volunteer = client.post("/volunteers/", json={"user_id": user["id"], "event_id": event["id"], "status": "active"}).json()
+    assert event_counts() == ([(event["id"], 1)], [])
+
+    client.put(f"/volunteers/{volunteer['id']}", json={"id": volunteer["id"], "status": "completed"})
+    assert event_counts() == ([(event["id"], 0)], [])
+
+    client.put(f"/volunteers/{volunteer['id']}", json={"id": volunteer["id"], "status": "active"})
+    assert event_counts() == ([(event["id"], 1)], [])
+
+    other = client.post("/events/", json=EVENT).json()
+    cursor = client.get("/sync").json()["cursor"]
+    client.put(f"/volunteers/{volunteer['id']}", json={"id": volunteer["id"], "event_id": other["id"]})
+    assert event_counts() == ([(event["id"], 0), (other["id"], 1)], [])
+
+    VolunteerLogic.delete_volunteer(volunteer["id"])
+    assert event_counts() == ([(other["id"], 0)], [{"entity": "volunteer", "id": volunteer["id"]}])
+
+
+def test_deletes_are_reported_as_tombstones(client, no_overlap):
+    event = client.post("/events/", json=EVENT).json()
+    cursor = client.get("/sync").json()["cursor"]
+
+    assert client.delete(f"/events/{event['id']}").status_code == 204
+
+    delta = client.get("/sync", params={"since": cursor}).json()
+    assert delta["deleted"] == [{"entity": "event", "id": event["id"]}]
+    assert delta["events"] == []
+
+
+def test_expired_cursor_requires_full_reload(client):
+    response = client.get("/sync", params={"since": "2000-01-01T00:00:00"})
+    assert response.status_code == 410
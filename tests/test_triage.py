@@ -0,0 +1,76 @@
+import uuid
+from datetime import datetime, timedelta
+
+from api_service.app.data_access import TriageDAO
+
+
+def _create_event(client, priority):
+    response = client.post("/events/", json={
+        "description": f"Triage priority {priority}",
+        "priority": priority,
+        "status": "active",
+        "location": {"latitude": 55.0, "longitude": 12.0},
+    })
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def _create_need(client, event_id, quantity):
+    response = client.post("/resources/needed/", json={
+        "name": "Sandbags", "resource_type": "tools", "description": "Flood barrier",
+        "quantity": quantity, "is_fulfilled": False, "event_id": event_id,
+    })
+    assert response.status_code in (200, 201)
+    return response.json()["id"]
+
+
+def _queue(client, limit=20):
+    response = client.get("/events/triage", params={"limit": limit})
+    assert response.status_code == 200
+    return {event["id"]: event["triage_score"] for event in response.json()}, [event["id"] for event in response.json()]
+
+
+def test_queue_follows_needs_volunteers_and_status(client):
+    low, high = _create_event(client, 3), _create_event(client, 2)
+    assert _queue(client)[1] == [high, low]
+
+    # A large unfulfilled need outweighs one priority level
+    need = _create_need(client, low, 1000)
+    scores, order = _queue(client)
+    assert order == [low, high]
+
+    # Volunteers on site lower the score, without marking the event as edited
+    modified_time = client.get(f"/events/{low}").json()["modified_time"]
+    user = client.post("/auth/register", json={
+        "name": "Triage", "email": f"triage_{uuid.uuid4().hex[:8]}@test.com",
+        "phonenumber": "+4500000011", "password": "password123", "role": "SUV",
+    }).json()
+    volunteer = client.post("/volunteers/", json={"user_id": user["id"], "event_id": low, "status": "active"}).json()
+    assert _queue(client)[0][low] < scores[low]
+    assert client.get(f"/events/{low}").json()["modified_time"] == modified_time
+
+    # Moving the volunteer away rescores the event it left
+    client.put(f"/volunteers/{volunteer['id']}", json={"id": volunteer["id"], "event_id": high})
+    assert _queue(client)[0][low] >= scores[low] - 0.01
+
+    client.put(f"/resources/needed/{need}", json={"is_fulfilled": True})
+    assert _queue(client)[1] == [high, low]
+
+    client.put(f"/events/{low}", json={"status": "completed"})
+    assert _queue(client)[1] == [high]
+    assert _queue(client, limit=1)[1] == [high]
+
+
+def test_deleted_need_is_rescored(client):
+    event_id = _create_event(client, 3)
+    before = _queue(client)[0][event_id]
+    need = _create_need(client, event_id, 50)
+    assert _queue(client)[0][event_id] > before + 5
+    assert client.delete(f"/resources/needed/{need}").status_code in (200, 204)
+    assert abs(_queue(client)[0][event_id] - before) < 0.01
+
+
+def test_waiting_events_age_past_higher_priorities():
+    now = datetime.utcnow()
+    assert TriageDAO.score(3, now - timedelta(hours=48), 0, 0) > TriageDAO.score(2, now, 0, 0)
+    assert TriageDAO.score(3, now - timedelta(hours=1), 0, 0) < TriageDAO.score(2, now, 0, 0)
@@ -109,4 +109,82 @@ class TestVolunteers:
             "/volunteers/",
             json={"user_id": 999999, "event_id": created_event_id, "status": "active"},
         )
-        assert resp.status_code == 400
\ No newline at end of file
+        assert resp.status_code == 400
+
+    def test_list_volunteers_nests_each_linked_user(self, client, created_user_id, created_event_id):
+        other = client.post(
+            "/auth/register",
+            json={
+                "name": "Jane Doe",
+                "email": f"volunteer_{uuid.uuid4().hex[:8]}@test.com",
+                "password": "password123",
+                "phonenumber": "+4512345679",
+            },
+        ).json()
+        for user_id in (created_user_id, other["id"]):
+            client.post(
+                "/volunteers/",
+                json={"user_id": user_id, "event_id": created_event_id, "status": "active"},
+            )
+
+        listed = client.get(f"/volunteers/?event_id={created_event_id}").json()
+        assert sorted(v["user"]["id"] for v in listed) == sorted([created_user_id, other["id"]])
+        assert all(v["user"]["status"] == "assigned" for v in listed)
+
+    def test_closing_event_completes_volunteers_and_frees_users(self, client, created_user_id, created_event_id):
+        busy = client.post(
+            "/auth/register",
+            json={
+                "name": "Busy Volunteer",
+                "email": f"volunteer_{uuid.uuid4().hex[:8]}@test.com",
+                "password": "password123",
+                "phonenumber": "+4512345670",
+            },
+        ).json()
+        other_event_id = client.post(
+            "/events/",
+            json={"description": "Other", "priority": 2, "status": "active", "location": {"latitude": 1.0, "longitude": 1.0}},
+        ).json()["id"]
+        for user_id, event_id in ((created_user_id, created_event_id), (busy["id"], created_event_id), (busy["id"], other_event_id)):
+            client.post("/volunteers/", json={"user_id": user_id, "event_id": event_id, "status": "active"})
+
+        assert client.put(f"/events/{created_event_id}", json={"status": "completed"}).status_code == 200
+
+        closed = client.get(f"/volunteers/?event_id={created_event_id}").json()
+        assert {v["status"] for v in closed} == {"completed"}
+        assert all(v["completion_time"] for v in closed)
+        assert client.get(f"/users/{created_user_id}").json()["status"] == "available"
+        # Still active on another event
+        assert client.get(f"/users/{busy['id']}").json()["status"] == "assigned"
+
+    def test_active_assignment_counter_drives_user_status(self, client, created_user_id, created_event_id):
+        from api_service.app.data_access import UserDAO, VolunteerDAO
+
+        first, second = (
+            client.post("/volunteers/", json={"user_id": created_user_id, "event_id": created_event_id, "status": "active"}).json()
+            for _ in range(2)
+        )
+        assert UserDAO.get_user(created_user_id).active_assignments == 2
+
+        client.put(f"/volunteers/{first['id']}", json={"id": first["id"], "status": "completed"})
+        user = UserDAO.get_user(created_user_id)
+        assert (user.active_assignments, user.status) == (1, "assigned")
+
+        VolunteerDAO.delete_volunteer(second["id"])
+        user = UserDAO.get_user(created_user_id)
+        assert (user.active_assignments, user.status) == (0, "available")
+
+    def test_recount_repairs_drifted_counters(self, client, db_session, created_user_id, created_event_id):
+        from api_service.app.data_access import UserDAO, VolunteerDAO
+        from api_service.app.models import User
+
+        client.post("/volunteers/", json={"user_id": created_user_id, "event_id": created_event_id, "status": "active"})
+        drifted = db_session.get(User, created_user_id)
+        drifted.active_assignments, drifted.status = 5, "available"
+        db_session.add(drifted)
+        db_session.commit()
+
+        assert VolunteerDAO.recount_active_assignments() == 1
+        user = UserDAO.get_user(created_user_id)
+        assert (user.active_assignments, user.status) == (1, "assigned")
+        assert VolunteerDAO.recount_active_assignments() == 0